@@ -12,23 +12,36 @@ SBI証券FXトレード向けのAPIクライアントを提供します。
 """
 
 import asyncio
+import bisect
 import hashlib
 import hmac
 import json
 import logging
 import random
+import struct
 import time
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
-from datetime import datetime, timedelta
+from dataclasses import dataclass, field, fields
+from datetime import datetime, timedelta, timezone
 from decimal import Decimal
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional, Tuple
+from typing import (
+    TYPE_CHECKING, Any, AsyncIterator, Callable, Dict, List, Optional, Tuple
+)
 
-import aiohttp
-import requests
+from config import CurrencyPair, TradingConfig, TradingMode, get_config
 
-from config import CurrencyPair, TradingConfig, TradingMode, config
+if TYPE_CHECKING:
+    import aiohttp
+
+# orjson（オプション）: 高速なJSONデコーダ。未インストール時は標準のjsonを使用
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+    json_loads: Callable[[Any], Any] = orjson.loads
+except ImportError:
+    ORJSON_AVAILABLE = False
+    json_loads = json.loads
 
 # ロガーの設定
 logger = logging.getLogger(__name__)
@@ -58,6 +71,86 @@ class OrderStatus(Enum):
     REJECTED = "rejected"
 
 
+# バイナリ形式で使用する通貨ペアID（シリアライズ済みデータとの互換性のため変更しないこと）
+PAIR_IDS: Dict[CurrencyPair, int] = {
+    CurrencyPair.USDJPY: 1,
+    CurrencyPair.EURJPY: 2,
+    CurrencyPair.GBPJPY: 3,
+    CurrencyPair.AUDJPY: 4,
+    CurrencyPair.EURUSD: 5,
+    CurrencyPair.GBPUSD: 6,
+    CurrencyPair.AUDUSD: 7,
+}
+PAIRS_BY_ID: Dict[int, CurrencyPair] = {v: k for k, v in PAIR_IDS.items()}
+
+# 固定長バイナリレイアウト（リトルエンディアン）
+# Tick:  pair_id(u8), bid(f64), ask(f64), timestamp_ns(i64)
+# OHLCV: pair_id(u8), timestamp_ns(i64), open/high/low/close(f64), volume(i64)
+TICK_STRUCT = struct.Struct("<Bddq")
+OHLCV_STRUCT = struct.Struct("<Bqddddq")
+
+_EPOCH = datetime(1970, 1, 1)
+_EPOCH_UTC = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_ONE_MICROSECOND = timedelta(microseconds=1)
+
+
+def _to_epoch_ns(ts: datetime) -> int:
+    """datetimeをエポックからのナノ秒に変換（タイムゾーンなしはそのままの時刻として扱う）"""
+    epoch = _EPOCH if ts.tzinfo is None else _EPOCH_UTC
+    return (ts - epoch) // _ONE_MICROSECOND * 1000
+
+
+def _from_epoch_ns(ts_ns: int) -> datetime:
+    """エポックからのナノ秒をdatetime（タイムゾーンなし）に変換"""
+    return _EPOCH + timedelta(microseconds=ts_ns // 1000)
+
+
+def _to_dict_expr(attr: str, annotation: Any) -> str:
+    """フィールドの型からto_dict用の変換式を生成"""
+    value = f"self.{attr}"
+    if annotation is Decimal:
+        return f"float({value})"
+    if annotation == Optional[Decimal]:
+        return f"(None if (v := {value}) is None else float(v))"
+    if annotation is datetime:
+        return f"{value}.isoformat()"
+    if isinstance(annotation, type) and issubclass(annotation, Enum):
+        return f"{value}.value"
+    return value
+
+
+def generated_to_dict(
+    exclude: Tuple[str, ...] = (),
+    extra: Tuple[Tuple[str, str], ...] = ()
+) -> Callable[[type], type]:
+    """
+    dataclassのフィールド定義からto_dictをクラス定義時に生成するデコレータ
+    
+    フィールドごとの変換（Decimal→float、Enum→value、datetime→ISO形式）を
+    インライン展開した関数をexecでコンパイルするため、呼び出し時に
+    フィールド一覧を走査するオーバーヘッドがありません。
+    
+    Args:
+        exclude: 出力しないフィールド名
+        extra: 追加で出力するプロパティの (キー, 属性名)（floatに変換）
+    """
+    def decorator(cls: type) -> type:
+        items = [
+            f"{f.name!r}: {_to_dict_expr(f.name, f.type)}"
+            for f in fields(cls) if f.name not in exclude
+        ]
+        items.extend(f"{key!r}: float(self.{attr})" for key, attr in extra)
+        source = "def to_dict(self):\n    return {" + ", ".join(items) + "}\n"
+        namespace: Dict[str, Any] = {}
+        exec(source, {}, namespace)
+        to_dict = namespace["to_dict"]
+        to_dict.__qualname__ = f"{cls.__qualname__}.to_dict"
+        to_dict.__doc__ = "ログ表示用の辞書に変換"
+        cls.to_dict = to_dict
+        return cls
+    return decorator
+
+
 @dataclass
 class Tick:
     """ティックデータ（価格情報）"""
@@ -69,15 +162,36 @@ class Tick:
     @property
     def spread(self) -> Decimal:
         """スプレッド（pips）"""
-        pip_multiplier = Decimal("100") if "JPY" in self.currency_pair.value else Decimal("10000")
+        pip_multiplier = Decimal("100") if self.currency_pair.is_jpy else Decimal("10000")
         return (self.ask - self.bid) * pip_multiplier
     
     @property
     def mid(self) -> Decimal:
         """中値"""
         return (self.bid + self.ask) / 2
+    
+    def pack(self) -> bytes:
+        """固定長バイナリに変換（プロセス間通信・永続化用）"""
+        return TICK_STRUCT.pack(
+            PAIR_IDS[self.currency_pair],
+            float(self.bid),
+            float(self.ask),
+            _to_epoch_ns(self.timestamp),
+        )
+    
+    @classmethod
+    def unpack(cls, data: bytes) -> "Tick":
+        """pack()で生成したバイナリから復元"""
+        pair_id, bid, ask, ts_ns = TICK_STRUCT.unpack(data)
+        return cls(
+            currency_pair=PAIRS_BY_ID[pair_id],
+            bid=Decimal(str(bid)),
+            ask=Decimal(str(ask)),
+            timestamp=_from_epoch_ns(ts_ns),
+        )
 
 
+@generated_to_dict(exclude=("currency_pair",))
 @dataclass
 class OHLCV:
     """ローソク足データ"""
@@ -89,17 +203,34 @@ class OHLCV:
     close: Decimal
     volume: int
     
-    def to_dict(self) -> Dict[str, Any]:
-        return {
-            "timestamp": self.timestamp.isoformat(),
-            "open": float(self.open),
-            "high": float(self.high),
-            "low": float(self.low),
-            "close": float(self.close),
-            "volume": self.volume
-        }
+    def pack(self) -> bytes:
+        """固定長バイナリに変換（プロセス間通信・永続化用）"""
+        return OHLCV_STRUCT.pack(
+            PAIR_IDS[self.currency_pair],
+            _to_epoch_ns(self.timestamp),
+            float(self.open),
+            float(self.high),
+            float(self.low),
+            float(self.close),
+            self.volume,
+        )
+    
+    @classmethod
+    def unpack(cls, data: bytes) -> "OHLCV":
+        """pack()で生成したバイナリから復元"""
+        pair_id, ts_ns, open_, high, low, close, volume = OHLCV_STRUCT.unpack(data)
+        return cls(
+            currency_pair=PAIRS_BY_ID[pair_id],
+            timestamp=_from_epoch_ns(ts_ns),
+            open=Decimal(str(open_)),
+            high=Decimal(str(high)),
+            low=Decimal(str(low)),
+            close=Decimal(str(close)),
+            volume=volume,
+        )
 
 
+@generated_to_dict(exclude=("stop_price", "updated_at"))
 @dataclass
 class Order:
     """注文データ"""
@@ -117,24 +248,15 @@ class Order:
     filled_price: Optional[Decimal] = None
     created_at: datetime = field(default_factory=datetime.now)
     updated_at: datetime = field(default_factory=datetime.now)
-    
-    def to_dict(self) -> Dict[str, Any]:
-        return {
-            "order_id": self.order_id,
-            "currency_pair": self.currency_pair.value,
-            "side": self.side.value,
-            "order_type": self.order_type.value,
-            "quantity": self.quantity,
-            "price": float(self.price) if self.price else None,
-            "stop_loss": float(self.stop_loss) if self.stop_loss else None,
-            "take_profit": float(self.take_profit) if self.take_profit else None,
-            "status": self.status.value,
-            "filled_quantity": self.filled_quantity,
-            "filled_price": float(self.filled_price) if self.filled_price else None,
-            "created_at": self.created_at.isoformat(),
-        }
 
 
+@generated_to_dict(
+    exclude=("stop_loss", "take_profit"),
+    extra=(
+        ("unrealized_pnl_pips", "unrealized_pnl"),
+        ("unrealized_pnl_jpy", "unrealized_pnl_jpy"),
+    )
+)
 @dataclass
 class Position:
     """ポジションデータ"""
@@ -151,7 +273,7 @@ class Position:
     @property
     def unrealized_pnl(self) -> Decimal:
         """未実現損益（pips）"""
-        pip_multiplier = Decimal("100") if "JPY" in self.currency_pair.value else Decimal("10000")
+        pip_multiplier = Decimal("100") if self.currency_pair.is_jpy else Decimal("10000")
         if self.side == OrderSide.BUY:
             return (self.current_price - self.entry_price) * pip_multiplier
         else:
@@ -165,21 +287,9 @@ class Position:
         else:
             diff = self.entry_price - self.current_price
         return diff * self.quantity
-    
-    def to_dict(self) -> Dict[str, Any]:
-        return {
-            "position_id": self.position_id,
-            "currency_pair": self.currency_pair.value,
-            "side": self.side.value,
-            "quantity": self.quantity,
-            "entry_price": float(self.entry_price),
-            "current_price": float(self.current_price),
-            "unrealized_pnl_pips": float(self.unrealized_pnl),
-            "unrealized_pnl_jpy": float(self.unrealized_pnl_jpy),
-            "opened_at": self.opened_at.isoformat(),
-        }
 
 
+@generated_to_dict()
 @dataclass
 class AccountInfo:
     """口座情報"""
@@ -190,17 +300,6 @@ class AccountInfo:
     margin_available: Decimal  # 余剰証拠金
     unrealized_pnl: Decimal  # 未実現損益
     margin_level: Optional[Decimal] = None  # 証拠金維持率（%）
-    
-    def to_dict(self) -> Dict[str, Any]:
-        return {
-            "account_id": self.account_id,
-            "balance": float(self.balance),
-            "equity": float(self.equity),
-            "margin_used": float(self.margin_used),
-            "margin_available": float(self.margin_available),
-            "unrealized_pnl": float(self.unrealized_pnl),
-            "margin_level": float(self.margin_level) if self.margin_level else None,
-        }
 
 
 class FXBrokerClient(ABC):
@@ -226,9 +325,15 @@ class FXBrokerClient(ABC):
         self,
         currency_pair: CurrencyPair,
         timeframe: str,
-        count: int = 100
+        count: int = 100,
+        since: Optional[datetime] = None
     ) -> List[OHLCV]:
-        """ローソク足データを取得"""
+        """
+        ローソク足データを取得
+        
+        sinceを指定した場合は、その時刻以降（sinceの足を含む）の足のみを返します。
+        差分取得に使用します（形成中の最新足を更新できるよう、sinceの足も含める）。
+        """
         pass
     
     @abstractmethod
@@ -260,6 +365,43 @@ class FXBrokerClient(ABC):
     async def get_account_info(self) -> AccountInfo:
         """口座情報を取得"""
         pass
+    
+    async def stream_ticks(
+        self,
+        currency_pairs: List[CurrencyPair],
+        poll_interval: float = 60.0
+    ) -> AsyncIterator[Tick]:
+        """
+        ティックを順次配信する
+        
+        プッシュ配信に対応していないブローカー向けの既定実装で、
+        poll_interval秒ごとにget_tick()を呼び出して配信します。
+        1回のポーリングで通貨ペア数だけAPIを呼び出すため、
+        ブローカーのリクエスト制限を考慮して間隔を決めてください。
+        ストリーミングAPIを持つブローカーはオーバーライドしてください。
+        """
+        while True:
+            for currency_pair in currency_pairs:
+                yield await self.get_tick(currency_pair)
+            await asyncio.sleep(poll_interval)
+    
+    async def subscribe_ohlcv(
+        self,
+        currency_pair: CurrencyPair,
+        timeframe: str,
+        callback: Callable[[OHLCV], None],
+        on_end: Optional[Callable[[], None]] = None
+    ) -> bool:
+        """
+        ローソク足のプッシュ配信を購読
+        
+        更新・確定した足が届くたびにcallbackを呼び出します。
+        配信が切断などで終了した場合はon_endを1回呼び出すため、
+        呼び出し側はget_ohlcv()での取得に戻し、必要なら再購読してください。
+        配信に対応していないブローカーはFalseを返すため、
+        呼び出し側はget_ohlcv()で取得してください。
+        """
+        return False
 
 
 class SBIFXClient(FXBrokerClient):
@@ -273,7 +415,7 @@ class SBIFXClient(FXBrokerClient):
     
     def __init__(self, config: TradingConfig):
         self.config = config
-        self._session: Optional[aiohttp.ClientSession] = None
+        self._session: Optional["aiohttp.ClientSession"] = None
         self._access_token: Optional[str] = None
         self._connected = False
     
@@ -287,6 +429,7 @@ class SBIFXClient(FXBrokerClient):
             return True
         
         # 本番モードの場合の認証フロー（将来の実装用）
+        # aiohttpは起動時間短縮のため、ここで初めてimportしてセッションを生成する想定
         # 現時点ではSBI証券の公式APIが公開されていないため、
         # 実装は保留としています
         raise NotImplementedError(
@@ -315,20 +458,25 @@ class SBIFXClient(FXBrokerClient):
         self,
         currency_pair: CurrencyPair,
         timeframe: str,
-        count: int = 100
+        count: int = 100,
+        since: Optional[datetime] = None
     ) -> List[OHLCV]:
         """ローソク足データを取得"""
         self._ensure_connected()
         
         if self.config.api.mode == TradingMode.DEMO:
-            return self._generate_mock_ohlcv(currency_pair, count)
+            ohlcv_list = self._generate_mock_ohlcv(currency_pair, count)
+            if since is not None:
+                ohlcv_list = [ohlcv for ohlcv in ohlcv_list if ohlcv.timestamp >= since]
+            return ohlcv_list
         
         raise NotImplementedError("本番API未実装")
     
     async def place_order(self, order: Order) -> Order:
         """注文を発注"""
         self._ensure_connected()
-        logger.info(f"注文発注: {order.to_dict()}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("注文発注: %s", order.to_dict())
         
         if self.config.api.mode == TradingMode.DEMO:
             # デモモードでは即座に約定したとみなす
@@ -422,7 +570,7 @@ class SBIFXClient(FXBrokerClient):
         mid_price = base_price + variation
         
         # スプレッドを設定（クロス円は0.3銭〜、ドルストレートは0.3pips〜）
-        if "JPY" in currency_pair.value:
+        if currency_pair.is_jpy:
             spread = Decimal("0.003")  # 0.3銭
         else:
             spread = Decimal("0.00003")  # 0.3pips
@@ -490,6 +638,41 @@ class SBIFXClient(FXBrokerClient):
         return ohlcv_list
 
 
+class _TriggerBook:
+    """
+    価格順に並べた決済トリガー（損切り・利確）の一覧
+    
+    価格の昇順リストを二分探索することで、ティック更新ごとに
+    全ポジションを走査せずに発動対象のみを取り出します。
+    """
+    
+    def __init__(self):
+        self._prices: List[Decimal] = []
+        self._position_ids: List[str] = []
+    
+    def add(self, price: Decimal, position_id: str) -> None:
+        index = bisect.bisect_right(self._prices, price)
+        self._prices.insert(index, price)
+        self._position_ids.insert(index, position_id)
+    
+    def remove(self, price: Decimal, position_id: str) -> None:
+        index = bisect.bisect_left(self._prices, price)
+        end = bisect.bisect_right(self._prices, price)
+        for i in range(index, end):
+            if self._position_ids[i] == position_id:
+                del self._prices[i]
+                del self._position_ids[i]
+                return
+    
+    def at_or_below(self, price: Decimal) -> List[str]:
+        """トリガー価格がprice以下のポジションID"""
+        return self._position_ids[:bisect.bisect_right(self._prices, price)]
+    
+    def at_or_above(self, price: Decimal) -> List[str]:
+        """トリガー価格がprice以上のポジションID"""
+        return self._position_ids[bisect.bisect_left(self._prices, price):]
+
+
 class MockBrokerClient(FXBrokerClient):
     """
     モックブローカークライアント（バックテスト・開発用）
@@ -506,6 +689,9 @@ class MockBrokerClient(FXBrokerClient):
         self.position_counter = 0
         self._connected = False
         self._current_prices: Dict[CurrencyPair, Tick] = {}
+        # (通貨ペア, 売買方向) ごとの損切り・利確トリガー
+        self._stop_loss_books: Dict[Tuple[CurrencyPair, OrderSide], _TriggerBook] = {}
+        self._take_profit_books: Dict[Tuple[CurrencyPair, OrderSide], _TriggerBook] = {}
     
     async def connect(self) -> bool:
         self._connected = True
@@ -527,6 +713,59 @@ class MockBrokerClient(FXBrokerClient):
                     position.current_price = tick.bid
                 else:
                     position.current_price = tick.ask
+        
+        # 損切り・利確の判定（買いはBid、売りはAskで判定）
+        pair = tick.currency_pair
+        triggered: List[Tuple[str, str]] = []
+        book = self._stop_loss_books.get((pair, OrderSide.BUY))
+        if book:
+            triggered.extend((pid, "損切り") for pid in book.at_or_above(tick.bid))
+        book = self._take_profit_books.get((pair, OrderSide.BUY))
+        if book:
+            triggered.extend((pid, "利確") for pid in book.at_or_below(tick.bid))
+        book = self._stop_loss_books.get((pair, OrderSide.SELL))
+        if book:
+            triggered.extend((pid, "損切り") for pid in book.at_or_below(tick.ask))
+        book = self._take_profit_books.get((pair, OrderSide.SELL))
+        if book:
+            triggered.extend((pid, "利確") for pid in book.at_or_above(tick.ask))
+        
+        for position_id, reason in triggered:
+            # 損切りと利確が同時に成立した場合は先に決済済み
+            if position_id in self.positions:
+                self._settle_position(position_id, reason)
+    
+    def _register_triggers(self, position: Position) -> None:
+        """ポジションの損切り・利確価格をトリガー一覧に登録"""
+        key = (position.currency_pair, position.side)
+        if position.stop_loss is not None:
+            self._stop_loss_books.setdefault(key, _TriggerBook()).add(
+                position.stop_loss, position.position_id
+            )
+        if position.take_profit is not None:
+            self._take_profit_books.setdefault(key, _TriggerBook()).add(
+                position.take_profit, position.position_id
+            )
+    
+    def _unregister_triggers(self, position: Position) -> None:
+        """ポジションの損切り・利確価格をトリガー一覧から削除"""
+        key = (position.currency_pair, position.side)
+        if position.stop_loss is not None:
+            self._stop_loss_books[key].remove(position.stop_loss, position.position_id)
+        if position.take_profit is not None:
+            self._take_profit_books[key].remove(position.take_profit, position.position_id)
+    
+    def _settle_position(self, position_id: str, reason: str = "") -> None:
+        """ポジションを現在価格で決済し、損益を残高に反映"""
+        position = self.positions.pop(position_id)
+        self._unregister_triggers(position)
+        pnl = position.unrealized_pnl_jpy
+        self.balance += pnl
+        
+        if reason:
+            logger.info(f"ポジション決済（{reason}）: {position_id}, 損益: {pnl:,.0f}円")
+        else:
+            logger.info(f"ポジション決済: {position_id}, 損益: {pnl:,.0f}円")
     
     async def get_tick(self, currency_pair: CurrencyPair) -> Tick:
         if currency_pair in self._current_prices:
@@ -544,7 +783,8 @@ class MockBrokerClient(FXBrokerClient):
         self,
         currency_pair: CurrencyPair,
         timeframe: str,
-        count: int = 100
+        count: int = 100,
+        since: Optional[datetime] = None
     ) -> List[OHLCV]:
         # バックテストエンジンから直接データを注入する想定
         return []
@@ -577,7 +817,9 @@ class MockBrokerClient(FXBrokerClient):
                 opened_at=datetime.now()
             )
             self.positions[position.position_id] = position
-            logger.info(f"ポジション作成: {position.to_dict()}")
+            self._register_triggers(position)
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("ポジション作成: %s", position.to_dict())
         else:
             # 指値・逆指値注文は保留
             order.status = OrderStatus.OPEN
@@ -587,13 +829,15 @@ class MockBrokerClient(FXBrokerClient):
     
     async def cancel_order(self, order_id: str) -> bool:
         if order_id in self.orders:
-            self.orders[order_id].status = OrderStatus.CANCELLED
-            del self.orders[order_id]
+            order = self.orders.pop(order_id)
+            order.status = OrderStatus.CANCELLED
             return True
         return False
     
     async def get_open_orders(self) -> List[Order]:
-        return [o for o in self.orders.values() if o.status == OrderStatus.OPEN]
+        # self.ordersには保留中（OPEN）の注文のみを保持している
+        # （成行注文は即時約定、キャンセル時は削除）
+        return list(self.orders.values())
     
     async def get_positions(self) -> List[Position]:
         return list(self.positions.values())
@@ -602,26 +846,24 @@ class MockBrokerClient(FXBrokerClient):
         if position_id not in self.positions:
             return False
         
-        position = self.positions[position_id]
-        pnl = position.unrealized_pnl_jpy
-        self.balance += pnl
-        
-        logger.info(f"ポジション決済: {position_id}, 損益: {pnl:,.0f}円")
-        del self.positions[position_id]
+        self._settle_position(position_id)
         return True
     
     async def get_account_info(self) -> AccountInfo:
-        # 未実現損益を計算
-        unrealized_pnl = sum(
-            p.unrealized_pnl_jpy for p in self.positions.values()
-        )
-        
-        # 使用証拠金を計算（レバレッジ25倍想定）
-        margin_used = sum(
-            p.entry_price * p.quantity / 25 for p in self.positions.values()
-        )
-        
-        equity = self.balance + unrealized_pnl
+        # 未実現損益と使用証拠金（レバレッジ25倍想定）を1回の走査でfloat集計
+        unrealized_pnl = 0.0
+        margin_used = 0.0
+        for p in self.positions.values():
+            entry_price = float(p.entry_price)
+            current_price = float(p.current_price)
+            if p.side is OrderSide.BUY:
+                unrealized_pnl += (current_price - entry_price) * p.quantity
+            else:
+                unrealized_pnl += (entry_price - current_price) * p.quantity
+            margin_used += entry_price * p.quantity
+        margin_used /= 25
+        
+        equity = float(self.balance) + unrealized_pnl
         margin_available = equity - margin_used
         
         margin_level = None
@@ -631,7 +873,7 @@ class MockBrokerClient(FXBrokerClient):
         return AccountInfo(
             account_id="MOCK-001",
             balance=self.balance,
-            equity=equity,
+            equity=Decimal(str(equity)),
             margin_used=Decimal(str(margin_used)),
             margin_available=Decimal(str(margin_available)),
             unrealized_pnl=Decimal(str(unrealized_pnl)),
@@ -676,7 +918,7 @@ if __name__ == "__main__":
     import asyncio
     
     async def test_client():
-        client = create_broker_client(config)
+        client = create_broker_client(get_config())
         await client.connect()
         
         # ティックデータ取得テスト
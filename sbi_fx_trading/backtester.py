@@ -6,11 +6,16 @@ FX自動売買システム - バックテストエンジン
 """
 
 import asyncio
+import hashlib
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone, tzinfo
 from decimal import Decimal
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional, Tuple
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 import logging
 import random
 
@@ -22,12 +27,109 @@ from api_client import (
     OrderType, Position, Tick
 )
 from config import RiskConfig, StrategyConfig, TradingConfig
-from indicators import ohlcv_to_dataframe
+from indicators import OHLCVFrame, ohlcv_field_array, ohlcv_to_dataframe
+from jit import NUMBA_AVAILABLE, njit
 from risk_management import RiskManager, TradeRecord
-from strategy import TradingStrategy, TradingSignal, SignalType
+from strategy import STRATEGIES, TradingStrategy, TradingSignal, SignalType
 
 logger = logging.getLogger(__name__)
 
+# 決済理由コード（_find_exit_barの戻り値）
+EXIT_NONE = 0
+EXIT_STOP_LOSS = 1
+EXIT_TAKE_PROFIT = 2
+
+EXIT_REASONS = {
+    EXIT_STOP_LOSS: "損切り",
+    EXIT_TAKE_PROFIT: "利確",
+}
+
+_D_ZERO = Decimal("0")
+_D_YEN = Decimal("1")
+
+# float64エクイティの丸め誤差とみなすリターンの大きさ（これ未満は0として扱う）
+RETURN_EPSILON = 1e-12
+
+
+@njit(cache=True)
+def _find_exit_bar(
+    highs: np.ndarray,
+    lows: np.ndarray,
+    start: int,
+    is_buy: bool,
+    stop_loss: float,
+    take_profit: float
+) -> Tuple[int, int]:
+    """
+    損切り・利確が最初に成立するバーを探索
+    
+    同一バーで両方に達した場合は損切りを優先します。
+    
+    Args:
+        highs: 高値配列
+        lows: 安値配列
+        start: 探索開始バー（エントリーの次のバー）
+        is_buy: 買いポジションかどうか
+        stop_loss: 損切り価格（未設定はNaN）
+        take_profit: 利確価格（未設定はNaN）
+    
+    Returns:
+        (バーインデックス, 決済理由コード)。成立しない場合は (-1, EXIT_NONE)
+    """
+    has_stop_loss = not np.isnan(stop_loss)
+    has_take_profit = not np.isnan(take_profit)
+    
+    for i in range(start, len(highs)):
+        if is_buy:
+            if has_stop_loss and lows[i] <= stop_loss:
+                return i, EXIT_STOP_LOSS
+            if has_take_profit and highs[i] >= take_profit:
+                return i, EXIT_TAKE_PROFIT
+        else:
+            if has_stop_loss and highs[i] >= stop_loss:
+                return i, EXIT_STOP_LOSS
+            if has_take_profit and lows[i] <= take_profit:
+                return i, EXIT_TAKE_PROFIT
+    
+    return -1, EXIT_NONE
+
+
+def _find_exit_bar_vectorized(
+    highs: np.ndarray,
+    lows: np.ndarray,
+    start: int,
+    is_buy: bool,
+    stop_loss: float,
+    take_profit: float
+) -> Tuple[int, int]:
+    """
+    _find_exit_barのNumPy版（numba未インストール時に使用）
+    
+    残りの全バーを比較マスクにしてargmaxで最初の成立バーを求めます。
+    Pythonループで1バーずつ比較するより、決済までが長いトレードで高速です。
+    """
+    if is_buy:
+        stop_hits = lows[start:] <= stop_loss
+        target_hits = highs[start:] >= take_profit
+    else:
+        stop_hits = highs[start:] >= stop_loss
+        target_hits = lows[start:] <= take_profit
+    
+    # NaNとの比較は常にFalseのため、未設定の価格は成立しない
+    stop_offset = int(np.argmax(stop_hits)) if stop_hits.any() else -1
+    target_offset = int(np.argmax(target_hits)) if target_hits.any() else -1
+    
+    if stop_offset < 0 and target_offset < 0:
+        return -1, EXIT_NONE
+    # 同一バーでは損切りを優先
+    if target_offset < 0 or (0 <= stop_offset <= target_offset):
+        return start + stop_offset, EXIT_STOP_LOSS
+    return start + target_offset, EXIT_TAKE_PROFIT
+
+
+if not NUMBA_AVAILABLE:
+    _find_exit_bar = _find_exit_bar_vectorized
+
 
 @dataclass
 class BacktestConfig:
@@ -40,20 +142,20 @@ class BacktestConfig:
     min_trade_interval_bars: int = 1  # 最小取引間隔（バー数）
 
 
-@dataclass
+@dataclass(slots=True)
 class BacktestTrade:
     """バックテスト取引記録"""
     trade_id: int
     currency_pair: CurrencyPair
     side: OrderSide
     entry_time: datetime
-    entry_price: Decimal
+    entry_price: float
     exit_time: Optional[datetime] = None
-    exit_price: Optional[Decimal] = None
+    exit_price: Optional[float] = None
     quantity: int = 1000
-    stop_loss: Optional[Decimal] = None
-    take_profit: Optional[Decimal] = None
-    pnl: Optional[Decimal] = None
+    stop_loss: Optional[float] = None
+    take_profit: Optional[float] = None
+    pnl: Optional[float] = None  # 円単位
     pnl_pips: Optional[float] = None
     exit_reason: str = ""
     strategy_name: str = ""
@@ -117,7 +219,7 @@ class BacktestResult:
     
     # 詳細データ
     trades: List[BacktestTrade] = field(default_factory=list)
-    equity_curve: List[Tuple[datetime, Decimal]] = field(default_factory=list)
+    equity_curve: List[Tuple[datetime, float]] = field(default_factory=list)
     monthly_returns: Dict[str, float] = field(default_factory=dict)
     
     def to_dict(self) -> Dict:
@@ -193,16 +295,20 @@ class BacktestEngine:
         self.risk_manager = RiskManager(self.risk_config)
         
         # 状態管理
-        self.balance = self.config.initial_balance
-        self.equity_curve: List[Tuple[datetime, Decimal]] = []
+        self.balance = float(self.config.initial_balance)
+        self.equity_curve: List[Tuple[datetime, float]] = []
         self.trades: List[BacktestTrade] = []
-        self.open_trades: List[BacktestTrade] = []
+        # オープン中のトレード（トレードID → トレード）
+        self.open_trades: Dict[int, BacktestTrade] = {}
         self.trade_counter = 0
         self.last_trade_bar = -100
+        # 決済予定（バーインデックス → (トレード, 決済理由)のリスト）
+        self._pending_exits: Dict[int, List[Tuple[BacktestTrade, str]]] = {}
+        self._reset_exposure()
     
     def run(
         self,
-        ohlcv_data: List[OHLCV],
+        ohlcv_data: Union[List[OHLCV], OHLCVFrame],
         currency_pair: CurrencyPair,
         position_size: int = 10000
     ) -> BacktestResult:
@@ -210,7 +316,7 @@ class BacktestEngine:
         バックテストを実行
         
         Args:
-            ohlcv_data: ローソク足データ
+            ohlcv_data: ローソク足データ（リストまたはOHLCVFrame）
             currency_pair: 通貨ペア
             position_size: ポジションサイズ（通貨単位）
         
@@ -223,163 +329,227 @@ class BacktestEngine:
         logger.info(f"バックテスト開始: {self.strategy.name}, {len(ohlcv_data)}本のバー")
         
         # 初期化
-        self.balance = self.config.initial_balance
+        self.balance = float(self.config.initial_balance)
         self.equity_curve = []
         self.trades = []
-        self.open_trades = []
+        self.open_trades = {}
         self.trade_counter = 0
         self.last_trade_bar = -100
+        self._pending_exits = {}
+        self._reset_exposure()
+        
+        # 列指向に一括展開（ループ内のDecimal演算を避け、戦略の指標計算にもそのまま渡す）
+        if not isinstance(ohlcv_data, OHLCVFrame):
+            ohlcv_data = OHLCVFrame.from_ohlcv(ohlcv_data)
+        timestamps = ohlcv_data.timestamp.to_pydatetime().tolist()
+        self._opens = ohlcv_data.open
+        self._highs = ohlcv_data.high
+        self._lows = ohlcv_data.low
+        self._closes = ohlcv_data.close
         
-        peak_balance = self.balance
-        max_drawdown = 0.0
+        # バックテスト中に変化しない値は事前計算しておく
+        self._is_jpy = currency_pair.is_jpy
+        self._pip_value_f = currency_pair.pip_value
+        self._half_spread_f = self._pip_value_f * self.config.spread_pips / 2
+        self._slippage_max_f = self.config.slippage_pips * self._pip_value_f
+        
+        # スリッページの乱数はまとめて生成しておく（1トレードでエントリーと決済の2回）
+        # シードはrandomモジュールから取るため、random.seed()で再現性を確保できる
+        rng = np.random.default_rng(random.getrandbits(64))
+        self._slippage_draws = rng.uniform(
+            0.0, self._slippage_max_f, size=2 * len(ohlcv_data)
+        ).tolist()
+        self._slippage_idx = 0
+        self._commission_per_unit_f = float(self.config.commission_per_lot) / 10000
+        half_spread = self._half_spread_f
+        closes = self._closes.tolist()
+        self._currency_pair = currency_pair
+        
+        initial_balance = self.balance
         
         # ウォームアップ期間（指標計算に必要な最小期間）
         warmup_period = 50
         
+        # 全バーのシグナルを一括で算出（バーごとに指標を再計算しない）
+        signals = self.strategy.generate_signals_batch(
+            currency_pair, ohlcv_data, start=warmup_period
+        )
+        signal_sides = signals.side.tolist()
+        signal_confidences = signals.confidence.tolist()
+        signal_stop_losses = signals.stop_loss.tolist()
+        signal_take_profits = signals.take_profit.tolist()
+        
+        # エクイティはバーごとに事前確保した配列へ書き込む
+        # （(時刻, 値)のリストは結果の集計時にまとめて作る）
+        equity_values = np.empty(len(ohlcv_data) - warmup_period, dtype=np.float64)
+        self._equity_values = equity_values
+        self._equity_timestamps = timestamps[warmup_period:]
+        
         # 各バーをループ
         for bar_idx in range(warmup_period, len(ohlcv_data)):
-            current_bar = ohlcv_data[bar_idx]
-            historical_data = ohlcv_data[:bar_idx + 1]
+            timestamp = timestamps[bar_idx]
             
-            # 現在のティック（模擬）
-            pip_value = Decimal("0.01") if "JPY" in currency_pair.value else Decimal("0.0001")
-            spread = pip_value * Decimal(str(self.config.spread_pips))
-            
-            current_tick = Tick(
-                currency_pair=currency_pair,
-                bid=current_bar.close - spread / 2,
-                ask=current_bar.close + spread / 2,
-                timestamp=current_bar.timestamp
-            )
+            bid = closes[bar_idx] - half_spread
+            ask = closes[bar_idx] + half_spread
             
             # オープンポジションをチェック
-            self._check_open_trades(current_bar, current_tick)
+            self._check_open_trades(bar_idx, bid, ask, timestamp)
             
-            # 新規シグナルを生成
+            # シグナルに基づいてエントリー
             if bar_idx - self.last_trade_bar >= self.config.min_trade_interval_bars:
-                signal = self.strategy.generate_signal(
-                    currency_pair, historical_data, current_tick
-                )
-                
-                # シグナルに基づいてエントリー
-                if signal.is_buy_signal or signal.is_sell_signal:
+                side = signal_sides[bar_idx]
+                if side != 0:
                     if len(self.open_trades) < self.risk_config.max_open_positions:
                         self._open_trade(
-                            signal, current_tick, current_bar.timestamp,
+                            OrderSide.BUY if side > 0 else OrderSide.SELL,
+                            signal_confidences[bar_idx],
+                            signal_stop_losses[bar_idx],
+                            signal_take_profits[bar_idx],
+                            bid, ask, timestamp,
                             position_size, bar_idx
                         )
             
             # エクイティを記録
-            current_equity = self._calculate_equity(current_tick)
-            self.equity_curve.append((current_bar.timestamp, current_equity))
-            
-            # ドローダウンを更新
-            if current_equity > peak_balance:
-                peak_balance = current_equity
-            
-            current_drawdown = float((peak_balance - current_equity) / peak_balance * 100)
-            if current_drawdown > max_drawdown:
-                max_drawdown = current_drawdown
+            equity_values[bar_idx - warmup_period] = self._calculate_equity(bid, ask)
         
-        # 残りのオープンポジションを強制決済
-        final_bar = ohlcv_data[-1]
-        final_tick = Tick(
-            currency_pair=currency_pair,
-            bid=final_bar.close - Decimal("0.003"),
-            ask=final_bar.close + Decimal("0.003"),
-            timestamp=final_bar.timestamp
-        )
+        # 最大ドローダウン（初期資金を最初のピークとする）
+        peaks = np.maximum(np.maximum.accumulate(equity_values), initial_balance)
+        drawdowns = (peaks - equity_values) / peaks * 100
+        max_drawdown = max(float(drawdowns.max()), 0.0) if drawdowns.size else 0.0
         
-        for trade in list(self.open_trades):
-            self._close_trade(trade, final_tick, final_bar.timestamp, "バックテスト終了")
+        # 残りのオープンポジションを強制決済
+        final_close = closes[-1]
+        for trade in list(self.open_trades.values()):
+            self._close_trade(
+                trade, final_close - 0.003, final_close + 0.003,
+                timestamps[-1], "バックテスト終了"
+            )
         
         # 結果を集計
         return self._compile_results(
             currency_pair,
-            ohlcv_data[0].timestamp,
-            ohlcv_data[-1].timestamp,
+            timestamps[0],
+            timestamps[-1],
             max_drawdown
         )
     
+    def _reset_exposure(self) -> None:
+        """オープンポジションの集計値（評価損益の計算用）をクリア"""
+        self._long_units = 0
+        self._long_cost = 0.0  # 買いポジションの Σ(エントリー価格 × 数量)
+        self._short_units = 0
+        self._short_cost = 0.0  # 売りポジションの Σ(エントリー価格 × 数量)
+    
+    def _update_exposure(self, trade: BacktestTrade, sign: int) -> None:
+        """トレードのオープン（sign=1）・クローズ（sign=-1）を集計値に反映"""
+        units = sign * trade.quantity
+        if trade.side == OrderSide.BUY:
+            self._long_units += units
+            self._long_cost += units * trade.entry_price
+        else:
+            self._short_units += units
+            self._short_cost += units * trade.entry_price
+    
+    def _next_slippage(self) -> float:
+        """事前生成したスリッページ（価格幅）を1つ取り出す"""
+        slippage = self._slippage_draws[self._slippage_idx]
+        self._slippage_idx += 1
+        return slippage
+    
     def _open_trade(
         self,
-        signal: TradingSignal,
-        tick: Tick,
+        side: OrderSide,
+        confidence: float,
+        stop_loss: float,
+        take_profit: float,
+        bid: float,
+        ask: float,
         timestamp: datetime,
         position_size: int,
         bar_idx: int
     ) -> None:
-        """新規トレードをオープン"""
+        """新規トレードをオープン（損切り・利確の未設定はNaN）"""
         self.trade_counter += 1
         
         # エントリー価格（スリッページ込み）
-        slippage = Decimal(str(random.uniform(0, self.config.slippage_pips)))
-        pip_value = Decimal("0.01") if "JPY" in signal.currency_pair.value else Decimal("0.0001")
-        slippage_amount = slippage * pip_value
+        slippage_amount = self._next_slippage()
         
-        if signal.is_buy_signal:
-            entry_price = tick.ask + slippage_amount
-            side = OrderSide.BUY
+        if side == OrderSide.BUY:
+            entry_price = ask + slippage_amount
         else:
-            entry_price = tick.bid - slippage_amount
-            side = OrderSide.SELL
+            entry_price = bid - slippage_amount
         
         trade = BacktestTrade(
             trade_id=self.trade_counter,
-            currency_pair=signal.currency_pair,
+            currency_pair=self._currency_pair,
             side=side,
             entry_time=timestamp,
             entry_price=entry_price,
             quantity=position_size,
-            stop_loss=signal.stop_loss,
-            take_profit=signal.take_profit,
-            strategy_name=signal.strategy_name,
-            signal_confidence=signal.confidence
+            stop_loss=None if np.isnan(stop_loss) else stop_loss,
+            take_profit=None if np.isnan(take_profit) else take_profit,
+            strategy_name=self.strategy.name,
+            signal_confidence=confidence
         )
         
-        self.open_trades.append(trade)
+        self.open_trades[trade.trade_id] = trade
+        self._update_exposure(trade, 1)
         self.last_trade_bar = bar_idx
         
+        # 以降のバーで損切り・利確が成立するバーを先に求めておく
+        exit_bar, exit_code = _find_exit_bar(
+            self._highs,
+            self._lows,
+            bar_idx + 1,
+            side == OrderSide.BUY,
+            stop_loss,
+            take_profit
+        )
+        if exit_bar >= 0:
+            self._pending_exits.setdefault(exit_bar, []).append(
+                (trade, EXIT_REASONS[exit_code])
+            )
+        
         logger.debug(f"トレードオープン: {trade.trade_id} {side.value} @ {entry_price}")
     
     def _close_trade(
         self,
         trade: BacktestTrade,
-        tick: Tick,
+        bid: float,
+        ask: float,
         timestamp: datetime,
         reason: str
     ) -> None:
         """トレードをクローズ"""
         # 出口価格（スリッページ込み）
-        slippage = Decimal(str(random.uniform(0, self.config.slippage_pips)))
-        pip_value = Decimal("0.01") if "JPY" in trade.currency_pair.value else Decimal("0.0001")
-        slippage_amount = slippage * pip_value
+        slippage_amount = self._next_slippage()
+        pip_value = self._pip_value_f
         
         if trade.side == OrderSide.BUY:
-            exit_price = tick.bid - slippage_amount
+            exit_price = bid - slippage_amount
         else:
-            exit_price = tick.ask + slippage_amount
+            exit_price = ask + slippage_amount
         
         # 損益計算
         if trade.side == OrderSide.BUY:
-            pnl_pips = float((exit_price - trade.entry_price) / pip_value)
+            pnl_pips = (exit_price - trade.entry_price) / pip_value
         else:
-            pnl_pips = float((trade.entry_price - exit_price) / pip_value)
+            pnl_pips = (trade.entry_price - exit_price) / pip_value
         
         # 金額ベースの損益（JPYペアの場合）
-        if "JPY" in trade.currency_pair.value:
-            pnl = Decimal(str(pnl_pips)) * pip_value * trade.quantity
+        if self._is_jpy:
+            pnl = pnl_pips * pip_value * trade.quantity
         else:
             # 非JPYペアの場合、円換算が必要（簡略化のため固定レート使用）
-            pnl = Decimal(str(pnl_pips * 0.01 * trade.quantity * 150))
+            pnl = pnl_pips * 0.01 * trade.quantity * 150
         
         # 手数料を差し引く
-        commission = self.config.commission_per_lot * Decimal(str(trade.quantity / 10000))
-        pnl -= commission
+        pnl -= self._commission_per_unit_f * trade.quantity
         
         trade.exit_time = timestamp
         trade.exit_price = exit_price
-        trade.pnl = pnl
+        # 記録・集計する損益は円単位に丸める（float計算の誤差を結果に出さない）
+        trade.pnl = float(round(pnl))
         trade.pnl_pips = pnl_pips
         trade.exit_reason = reason
         
@@ -387,54 +557,43 @@ class BacktestEngine:
         self.balance += pnl
         
         # オープンから移動
-        if trade in self.open_trades:
-            self.open_trades.remove(trade)
+        if self.open_trades.pop(trade.trade_id, None) is not None:
+            if self.open_trades:
+                self._update_exposure(trade, -1)
+            else:
+                # 誤差が蓄積しないよう、ポジションがなくなったら0に戻す
+                self._reset_exposure()
         self.trades.append(trade)
         
         logger.debug(f"トレードクローズ: {trade.trade_id} @ {exit_price} "
                     f"PnL: {pnl_pips:.1f}pips ({pnl:+,.0f}円) [{reason}]")
     
-    def _check_open_trades(self, bar: OHLCV, tick: Tick) -> None:
-        """オープンポジションをチェック（SL/TP）"""
-        for trade in list(self.open_trades):
-            # ストップロスチェック
-            if trade.stop_loss:
-                if trade.side == OrderSide.BUY:
-                    if bar.low <= trade.stop_loss:
-                        self._close_trade(trade, tick, bar.timestamp, "損切り")
-                        continue
-                else:
-                    if bar.high >= trade.stop_loss:
-                        self._close_trade(trade, tick, bar.timestamp, "損切り")
-                        continue
-            
-            # テイクプロフィットチェック
-            if trade.take_profit:
-                if trade.side == OrderSide.BUY:
-                    if bar.high >= trade.take_profit:
-                        self._close_trade(trade, tick, bar.timestamp, "利確")
-                        continue
-                else:
-                    if bar.low <= trade.take_profit:
-                        self._close_trade(trade, tick, bar.timestamp, "利確")
-                        continue
+    def _check_open_trades(
+        self,
+        bar_idx: int,
+        bid: float,
+        ask: float,
+        timestamp: datetime
+    ) -> None:
+        """このバーで損切り・利確に達するトレードを決済"""
+        for trade, reason in self._pending_exits.pop(bar_idx, ()):
+            self._close_trade(trade, bid, ask, timestamp, reason)
     
-    def _calculate_equity(self, tick: Tick) -> Decimal:
-        """現在のエクイティを計算"""
-        equity = self.balance
-        
-        pip_value = Decimal("0.01") if "JPY" in tick.currency_pair.value else Decimal("0.0001")
+    def _calculate_equity(self, bid: float, ask: float) -> float:
+        """
+        現在のエクイティを計算
         
-        for trade in self.open_trades:
-            if trade.side == OrderSide.BUY:
-                unrealized_pips = (tick.bid - trade.entry_price) / pip_value
-            else:
-                unrealized_pips = (trade.entry_price - tick.ask) / pip_value
-            
-            unrealized_pnl = unrealized_pips * pip_value * trade.quantity
-            equity += unrealized_pnl
+        評価損益はオープンポジションの集計値から求めるため、
+        同時保有ポジション数によらず一定の計算量です。
+        """
+        if not self.open_trades:
+            return self.balance
         
-        return equity
+        return (
+            self.balance
+            + (bid * self._long_units - self._long_cost)
+            + (self._short_cost - ask * self._short_units)
+        )
     
     def _compile_results(
         self,
@@ -444,6 +603,7 @@ class BacktestEngine:
         max_drawdown: float
     ) -> BacktestResult:
         """結果を集計"""
+        self.equity_curve = list(zip(self._equity_timestamps, self._equity_values.tolist()))
         closed_trades = [t for t in self.trades if t.is_closed]
         
         if not closed_trades:
@@ -453,7 +613,7 @@ class BacktestEngine:
                 start_date=start_date,
                 end_date=end_date,
                 initial_balance=self.config.initial_balance,
-                final_balance=self.balance,
+                final_balance=Decimal(str(self.balance)).quantize(_D_YEN),
                 total_return=0.0,
                 annualized_return=0.0,
                 max_drawdown=max_drawdown,
@@ -465,69 +625,68 @@ class BacktestEngine:
                 losing_trades=0,
                 win_rate=0.0,
                 profit_factor=0.0,
-                average_win=Decimal("0"),
-                average_loss=Decimal("0"),
-                largest_win=Decimal("0"),
-                largest_loss=Decimal("0"),
+                average_win=_D_ZERO,
+                average_loss=_D_ZERO,
+                largest_win=_D_ZERO,
+                largest_loss=_D_ZERO,
                 average_trade_duration=timedelta(0),
                 trades=self.trades,
                 equity_curve=self.equity_curve
             )
         
-        winning_trades = [t for t in closed_trades if t.is_winning]
-        losing_trades = [t for t in closed_trades if not t.is_winning and t.pnl is not None]
+        # 集計は決済済みトレードの構造化配列で行う
+        closed = trades_to_array(closed_trades)
+        pnls = closed["pnl"]
+        winning = pnls > 0
+        losing = ~winning & ~np.isnan(pnls)
+        winning_count = int(winning.sum())
+        losing_count = int(losing.sum())
         
         # リターン計算
-        total_return = float(
-            (self.balance - self.config.initial_balance) / self.config.initial_balance * 100
-        )
+        initial_balance = float(self.config.initial_balance)
+        total_return = (self.balance - initial_balance) / initial_balance * 100
         
         days = (end_date - start_date).days
         years = days / 365.25 if days > 0 else 1
         annualized_return = ((1 + total_return / 100) ** (1 / years) - 1) * 100 if years > 0 else 0
         
         # 勝率・プロフィットファクター
-        win_rate = len(winning_trades) / len(closed_trades) * 100 if closed_trades else 0
+        win_rate = winning_count / len(closed) * 100
         
-        total_profit = sum(t.pnl for t in winning_trades if t.pnl)
-        total_loss = abs(sum(t.pnl for t in losing_trades if t.pnl))
-        profit_factor = float(total_profit / total_loss) if total_loss > 0 else float("inf")
+        total_profit = float(pnls[winning].sum())
+        total_loss = abs(float(pnls[losing].sum()))
+        profit_factor = total_profit / total_loss if total_loss > 0 else float("inf")
         
         # 平均値
-        average_win = total_profit / len(winning_trades) if winning_trades else Decimal("0")
-        average_loss = (
-            abs(sum(t.pnl for t in losing_trades if t.pnl)) / len(losing_trades)
-            if losing_trades else Decimal("0")
-        )
+        average_win = total_profit / winning_count if winning_count else 0.0
+        average_loss = total_loss / losing_count if losing_count else 0.0
         
-        largest_win = max((t.pnl for t in winning_trades if t.pnl), default=Decimal("0"))
-        largest_loss = min((t.pnl for t in losing_trades if t.pnl), default=Decimal("0"))
+        largest_win = float(pnls[winning].max()) if winning_count else 0.0
+        largest_loss = float(min(pnls[losing].min(), 0.0)) if losing_count else 0.0
         
-        # 取引時間
-        durations = [
-            (t.exit_time - t.entry_time) for t in closed_trades
-            if t.exit_time and t.entry_time
-        ]
+        # 取引時間（マイクロ秒単位の整数で合計してから平均）
+        durations = (closed["exit_time"] - closed["entry_time"]).astype(np.int64)
         average_duration = (
-            sum(durations, timedelta(0)) / len(durations) if durations else timedelta(0)
+            timedelta(microseconds=int(durations.sum())) / len(durations)
+            if durations.size else timedelta(0)
         )
         
         # シャープレシオ計算
-        returns = []
-        for i in range(1, len(self.equity_curve)):
-            prev_equity = self.equity_curve[i - 1][1]
-            curr_equity = self.equity_curve[i][1]
-            if prev_equity > 0:
-                returns.append(float((curr_equity - prev_equity) / prev_equity))
-        
-        if returns:
-            avg_return = np.mean(returns)
-            std_return = np.std(returns)
+        equity = self._equity_values
+        prev_equity = equity[:-1]
+        valid = prev_equity > 0
+        returns = np.diff(equity)[valid] / prev_equity[valid]
+        # 価格が動かなかったバーの丸め誤差（±1e-16程度）を下方リターンに数えない
+        returns[np.abs(returns) < RETURN_EPSILON] = 0.0
+        
+        if returns.size:
+            avg_return = returns.mean()
+            std_return = returns.std()
             sharpe_ratio = (avg_return / std_return * np.sqrt(252)) if std_return > 0 else 0
             
             # ソルティノレシオ（下方偏差のみ）
-            negative_returns = [r for r in returns if r < 0]
-            downside_std = np.std(negative_returns) if negative_returns else std_return
+            negative_returns = returns[returns < 0]
+            downside_std = negative_returns.std() if negative_returns.size else std_return
             sortino_ratio = (avg_return / downside_std * np.sqrt(252)) if downside_std > 0 else 0
         else:
             sharpe_ratio = 0.0
@@ -536,11 +695,12 @@ class BacktestEngine:
         # カルマーレシオ
         calmar_ratio = annualized_return / max_drawdown if max_drawdown > 0 else 0
         
-        # 月次リターン
-        monthly_returns = {}
-        for timestamp, equity in self.equity_curve:
-            month_key = timestamp.strftime("%Y-%m")
-            monthly_returns[month_key] = float(equity)
+        # 月次リターン（各月末時点のエクイティ）
+        equity_series = pd.Series(
+            equity, index=pd.DatetimeIndex(self._equity_timestamps)
+        )
+        month_end_equity = equity_series.groupby(equity_series.index.strftime("%Y-%m")).last()
+        monthly_returns = dict(zip(month_end_equity.index, month_end_equity.tolist()))
         
         return BacktestResult(
             strategy_name=self.strategy.name,
@@ -548,22 +708,22 @@ class BacktestEngine:
             start_date=start_date,
             end_date=end_date,
             initial_balance=self.config.initial_balance,
-            final_balance=self.balance,
+            final_balance=Decimal(str(self.balance)).quantize(_D_YEN),
             total_return=total_return,
             annualized_return=annualized_return,
             max_drawdown=max_drawdown,
             sharpe_ratio=sharpe_ratio,
             sortino_ratio=sortino_ratio,
             calmar_ratio=calmar_ratio,
-            total_trades=len(closed_trades),
-            winning_trades=len(winning_trades),
-            losing_trades=len(losing_trades),
+            total_trades=len(closed),
+            winning_trades=winning_count,
+            losing_trades=losing_count,
             win_rate=win_rate,
             profit_factor=profit_factor,
-            average_win=average_win,
-            average_loss=average_loss,
-            largest_win=largest_win,
-            largest_loss=largest_loss,
+            average_win=Decimal(str(average_win)),
+            average_loss=Decimal(str(average_loss)),
+            largest_win=Decimal(str(largest_win)),
+            largest_loss=Decimal(str(largest_loss)),
             average_trade_duration=average_duration,
             trades=self.trades,
             equity_curve=self.equity_curve,
@@ -602,44 +762,278 @@ def generate_sample_data(
     }
     
     base_price = base_prices.get(currency_pair, 100.0)
-    ohlcv_list = []
     
-    current_price = base_price
+    # 乱数は一括生成（シードはrandomモジュールから取り、random.seed()で再現可能）
+    rng = np.random.default_rng(random.getrandbits(64))
+    
+    # ランダムウォーク + トレンド（次のバーは前のバーの終値から変動する）
+    changes = rng.normal(trend, volatility, bars) * base_price
+    close_noise = rng.normal(0, volatility * 0.3, bars) * base_price
+    current_prices = base_price + np.cumsum(changes)
+    current_prices[1:] += np.cumsum(close_noise)[:-1]
+    
+    # OHLC生成
+    open_prices = current_prices + rng.normal(0, volatility * 0.3, bars) * base_price
+    high_prices = current_prices + np.abs(rng.normal(0, volatility * 0.5, bars)) * base_price
+    low_prices = current_prices - np.abs(rng.normal(0, volatility * 0.5, bars)) * base_price
+    close_prices = current_prices + close_noise
+    
+    # 整合性を保証
+    high_prices = np.maximum.reduce([high_prices, open_prices, close_prices])
+    low_prices = np.minimum.reduce([low_prices, open_prices, close_prices])
+    volumes = rng.integers(1000, 10000, bars, endpoint=True)
+    
     now = datetime.now()
+    timestamps = pd.date_range(
+        end=now - timedelta(hours=timeframe_hours),
+        periods=bars,
+        freq=f"{timeframe_hours}h"
+    ).to_pydatetime()
     
-    for i in range(bars):
-        timestamp = now - timedelta(hours=(bars - i) * timeframe_hours)
-        
-        # ランダムウォーク + トレンド
-        change = random.gauss(trend, volatility) * base_price
-        current_price += change
-        
-        # OHLC生成
-        open_price = current_price + random.gauss(0, volatility * 0.3) * base_price
-        high_price = current_price + abs(random.gauss(0, volatility * 0.5)) * base_price
-        low_price = current_price - abs(random.gauss(0, volatility * 0.5)) * base_price
-        close_price = current_price + random.gauss(0, volatility * 0.3) * base_price
-        
-        # 整合性を保証
-        high_price = max(high_price, open_price, close_price)
-        low_price = min(low_price, open_price, close_price)
-        
-        ohlcv = OHLCV(
+    ohlcv_list = [
+        OHLCV(
             currency_pair=currency_pair,
             timestamp=timestamp,
-            open=Decimal(str(round(open_price, 5))),
-            high=Decimal(str(round(high_price, 5))),
-            low=Decimal(str(round(low_price, 5))),
-            close=Decimal(str(round(close_price, 5))),
-            volume=random.randint(1000, 10000)
+            open=Decimal(str(open_price)),
+            high=Decimal(str(high_price)),
+            low=Decimal(str(low_price)),
+            close=Decimal(str(close_price)),
+            volume=volume
         )
-        ohlcv_list.append(ohlcv)
-        
-        current_price = close_price
+        for timestamp, open_price, high_price, low_price, close_price, volume in zip(
+            timestamps,
+            np.round(open_prices, 5).tolist(),
+            np.round(high_prices, 5).tolist(),
+            np.round(low_prices, 5).tolist(),
+            np.round(close_prices, 5).tolist(),
+            volumes.tolist()
+        )
+    ]
     
     return ohlcv_list
 
 
+# ローソク足の構造化配列（共有メモリでの受け渡し用）
+OHLCV_DTYPE = np.dtype([
+    ("timestamp", "i8"),  # エポックからのマイクロ秒（タイムゾーン付きの時刻はUTC）
+    ("open", "f8"),
+    ("high", "f8"),
+    ("low", "f8"),
+    ("close", "f8"),
+    ("volume", "i8"),
+])
+
+
+def _to_utc_naive(timestamps: pd.DatetimeIndex) -> pd.DatetimeIndex:
+    """タイムゾーン付きの時刻をUTCに揃えてタイムゾーンを外す（マイクロ秒単位）"""
+    if timestamps.tz is not None:
+        timestamps = timestamps.tz_convert("UTC").tz_localize(None)
+    return timestamps.as_unit("us")
+
+
+def ohlcv_timezone(ohlcv_data: List[OHLCV]) -> Optional[tzinfo]:
+    """OHLCVリストの時刻のタイムゾーン（タイムゾーンなし・空の場合はNone）"""
+    return ohlcv_data[0].timestamp.tzinfo if ohlcv_data else None
+
+
+def ohlcv_to_array(ohlcv_data: List[OHLCV]) -> np.ndarray:
+    """
+    OHLCVリストを構造化配列に変換
+    
+    タイムゾーン付きの時刻はUTCに揃えて保存します。復元時は
+    ohlcv_timezone()で取得したタイムゾーンをarray_to_ohlcv・
+    OHLCVFrame.from_recordsに渡してください。
+    """
+    array = np.empty(len(ohlcv_data), dtype=OHLCV_DTYPE)
+    timestamps = pd.DatetimeIndex([o.timestamp for o in ohlcv_data])
+    array["timestamp"] = _to_utc_naive(timestamps).asi8
+    for name in ("open", "high", "low", "close", "volume"):
+        array[name] = ohlcv_field_array(ohlcv_data, name, OHLCV_DTYPE[name])
+    return array
+
+
+# 取引記録の構造化配列（集計・保存用）
+TRADE_DTYPE = np.dtype([
+    ("entry_time", "datetime64[us]"),
+    ("exit_time", "datetime64[us]"),  # 未決済はNaT
+    ("side", "i1"),  # 1=買い、-1=売り
+    ("entry_price", "f8"),
+    ("exit_price", "f8"),  # 未決済はNaN
+    ("quantity", "i8"),
+    ("pnl", "f8"),  # 未決済はNaN
+    ("pnl_pips", "f8"),  # 未決済はNaN
+])
+
+
+def trades_to_array(trades: List[BacktestTrade]) -> np.ndarray:
+    """取引記録のリストを構造化配列に変換"""
+    array = np.empty(len(trades), dtype=TRADE_DTYPE)
+    array["entry_time"] = _to_utc_naive(pd.DatetimeIndex([t.entry_time for t in trades])).values
+    array["exit_time"] = _to_utc_naive(pd.DatetimeIndex([t.exit_time for t in trades])).values
+    array["side"] = [1 if t.side == OrderSide.BUY else -1 for t in trades]
+    array["quantity"] = [t.quantity for t in trades]
+    for name in ("entry_price", "exit_price", "pnl", "pnl_pips"):
+        array[name] = np.array([getattr(t, name) for t in trades], dtype=np.float64)
+    return array
+
+
+def array_to_ohlcv(
+    array: np.ndarray,
+    currency_pair: CurrencyPair,
+    tz: Optional[tzinfo] = None
+) -> List[OHLCV]:
+    """構造化配列をOHLCVリストに変換（tzを指定した場合はUTCからtzの時刻に変換）"""
+    timestamps = array["timestamp"].astype("datetime64[us]")
+    if tz is None:
+        timestamps = timestamps.tolist()
+    else:
+        timestamps = list(
+            pd.DatetimeIndex(timestamps).tz_localize("UTC").tz_convert(tz).to_pydatetime()
+        )
+    return [
+        OHLCV(
+            currency_pair=currency_pair,
+            timestamp=timestamp,
+            open=Decimal(repr(open_)),
+            high=Decimal(repr(high)),
+            low=Decimal(repr(low)),
+            close=Decimal(repr(close)),
+            volume=volume
+        )
+        for timestamp, open_, high, low, close, volume in zip(
+            timestamps,
+            array["open"].tolist(),
+            array["high"].tolist(),
+            array["low"].tolist(),
+            array["close"].tolist(),
+            array["volume"].tolist()
+        )
+    ]
+
+
+# ローソク足のディスクキャッシュの保存先
+OHLCV_CACHE_DIR = Path("./.cache/ohlcv")
+
+
+def load_ohlcv_cached(
+    loader: Callable[..., List[OHLCV]],
+    currency_pair: CurrencyPair,
+    use_cache: bool = True,
+    cache_dir: Path = OHLCV_CACHE_DIR,
+    **params: Any
+) -> List[OHLCV]:
+    """
+    ローソク足データをディスクキャッシュ経由で読み込む
+    
+    loader(currency_pair=..., **params) の結果を構造化配列（.npz）として保存し、
+    同じ引数での2回目以降はファイルから復元します。パラメータスイープなどで
+    同じ期間のデータを繰り返し取得する場合に使用します。
+    
+    Args:
+        loader: データ取得関数（generate_sample_dataなど）
+        currency_pair: 通貨ペア
+        use_cache: Falseの場合はキャッシュを使わずに毎回取得
+        cache_dir: キャッシュの保存先
+        **params: loaderに渡す引数（キャッシュのキーにも使用）
+    
+    Returns:
+        OHLCVリスト
+    """
+    key = hashlib.sha1(
+        repr((loader.__name__, currency_pair.name, sorted(params.items()))).encode()
+    ).hexdigest()[:16]
+    path = cache_dir / f"{currency_pair.name}_{key}.npz"
+    
+    if use_cache and path.exists():
+        try:
+            # タイムゾーン付きのデータはUTCとして保存しているため、UTCの時刻で復元する
+            with np.load(path) as cached:
+                tz = timezone.utc if cached["utc"] else None
+                data = array_to_ohlcv(cached["bars"], currency_pair, tz)
+            logger.info(f"キャッシュからデータを読み込みました: {path}")
+            return data
+        except (OSError, ValueError) as e:
+            logger.warning(f"キャッシュの読み込みに失敗したため再取得します: {e}")
+    
+    data = loader(currency_pair=currency_pair, **params)
+    
+    if use_cache:
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            # 並行実行時に書きかけのファイルを読まないよう、一時ファイルから置き換える
+            tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp_path, "wb") as f:
+                np.savez(f, bars=ohlcv_to_array(data), utc=ohlcv_timezone(data) is not None)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"キャッシュの保存に失敗しました: {e}")
+    
+    return data
+
+
+# 最適化ワーカープロセス内で共有するデータ（_init_optimizer_workerで設定）
+_worker_context: Dict[str, Any] = {}
+
+
+def _init_optimizer_worker(
+    strategy_class: type,
+    risk_config: RiskConfig,
+    backtest_config: BacktestConfig,
+    shm_name: str,
+    bar_count: int,
+    currency_pair: CurrencyPair,
+    optimization_metric: str,
+    tz: Optional[tzinfo] = None
+) -> None:
+    """
+    ワーカープロセスの初期化
+    
+    ローソク足は共有メモリ上の構造化配列から読み出すため、
+    データをプロセスごとにpickleで受け渡す必要がありません。
+    """
+    shm = SharedMemory(name=shm_name)
+    try:
+        array = np.ndarray((bar_count,), dtype=OHLCV_DTYPE, buffer=shm.buf)
+        # OHLCVオブジェクトを経由せず、列指向のまま各バックテストに渡す
+        ohlcv_data = OHLCVFrame.from_records(array, currency_pair, tz)
+        del array
+    finally:
+        shm.close()
+    
+    _worker_context.update(
+        # 指標キャッシュ（このワーカーが担当する組み合わせ間で共有）
+        indicator_cache={},
+        strategy_class=strategy_class,
+        risk_config=risk_config,
+        backtest_config=backtest_config,
+        ohlcv_data=ohlcv_data,
+        currency_pair=currency_pair,
+        optimization_metric=optimization_metric
+    )
+
+
+def _run_one(
+    params: Dict[str, Any]
+) -> Tuple[Dict[str, Any], Optional[float], Optional[BacktestResult], Optional[str]]:
+    """
+    1つのパラメータの組み合わせでバックテストを実行（ワーカープロセス用）
+    
+    Returns:
+        (パラメータ, 指標値, 結果, エラーメッセージ)
+    """
+    ctx = _worker_context
+    
+    try:
+        strategy = ctx["strategy_class"](StrategyConfig(), **params)
+        strategy.indicator_cache = ctx["indicator_cache"]
+        engine = BacktestEngine(strategy, ctx["risk_config"], ctx["backtest_config"])
+        result = engine.run(ctx["ohlcv_data"], ctx["currency_pair"])
+        metric_value = getattr(result, ctx["optimization_metric"], 0)
+        return params, metric_value, result, None
+    except Exception as e:
+        return params, None, None, str(e)
+
+
 class StrategyOptimizer:
     """戦略パラメータ最適化クラス"""
     
@@ -667,15 +1061,19 @@ class StrategyOptimizer:
         self,
         ohlcv_data: List[OHLCV],
         currency_pair: CurrencyPair,
-        optimization_metric: str = "sharpe_ratio"
+        optimization_metric: str = "sharpe_ratio",
+        max_workers: Optional[int] = None
     ) -> Tuple[Dict[str, Any], BacktestResult]:
         """
         グリッドサーチで最適なパラメータを探索
         
+        パラメータの組み合わせごとのバックテストは、複数プロセスで並列実行します。
+        
         Args:
             ohlcv_data: ローソク足データ
             currency_pair: 通貨ペア
             optimization_metric: 最適化指標
+            max_workers: 並列プロセス数（Noneの場合はCPU数）
         
         Returns:
             (最適パラメータ, 最良結果)
@@ -685,52 +1083,185 @@ class StrategyOptimizer:
         # パラメータの組み合わせを生成
         param_names = list(self.param_ranges.keys())
         param_values = list(self.param_ranges.values())
+        combinations = [
+            dict(zip(param_names, combination))
+            for combination in product(*param_values)
+        ]
+        
+        # 指標パラメータが同じ組み合わせを隣接させ、同じワーカーでまとめて処理する
+        # （ワーカー内で指標の計算結果を再利用できる）
+        indicator_params = getattr(self.strategy_class, "indicator_params", ())
+        groups: Dict[Tuple, List[int]] = {}
+        for index, params in enumerate(combinations):
+            key = tuple(params.get(name) for name in indicator_params)
+            groups.setdefault(key, []).append(index)
+        order = [index for indices in groups.values() for index in indices]
+        workers = max_workers or os.cpu_count()
+        chunksize = max(1, len(order) // (workers * 4))
         
         best_params = None
         best_result = None
         best_metric_value = float("-inf")
         
-        total_combinations = 1
-        for values in param_values:
-            total_combinations *= len(values)
-        
-        logger.info(f"最適化開始: {total_combinations}通りの組み合わせをテスト")
+        logger.info(f"最適化開始: {len(combinations)}通りの組み合わせをテスト")
         
-        for i, combination in enumerate(product(*param_values)):
-            params = dict(zip(param_names, combination))
-            
-            # 戦略インスタンスを作成
-            strategy_config = StrategyConfig()
-            strategy = self.strategy_class(strategy_config, **params)
-            
-            # バックテスト実行
-            engine = BacktestEngine(
-                strategy,
-                self.risk_config,
-                self.backtest_config
-            )
-            
-            try:
-                result = engine.run(ohlcv_data, currency_pair)
-                
-                # 指標を取得
-                metric_value = getattr(result, optimization_metric, 0)
-                
-                if metric_value > best_metric_value:
-                    best_metric_value = metric_value
-                    best_params = params
-                    best_result = result
-                
-                logger.debug(f"パラメータ {params}: {optimization_metric}={metric_value:.4f}")
+        # ローソク足を共有メモリ上の構造化配列に1回だけ書き込む
+        array = ohlcv_to_array(ohlcv_data)
+        shm = SharedMemory(create=True, size=max(array.nbytes, 1))
+        try:
+            np.ndarray(array.shape, dtype=OHLCV_DTYPE, buffer=shm.buf)[:] = array
             
-            except Exception as e:
-                logger.warning(f"パラメータ {params} でエラー: {e}")
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_optimizer_worker,
+                initargs=(
+                    self.strategy_class,
+                    self.risk_config,
+                    self.backtest_config,
+                    shm.name,
+                    len(array),
+                    currency_pair,
+                    optimization_metric,
+                    ohlcv_timezone(ohlcv_data)
+                )
+            ) as executor:
+                # 同値の場合は元の組み合わせ順で先のものを優先する
+                best_index = len(combinations)
+                outcomes = executor.map(
+                    _run_one, [combinations[i] for i in order], chunksize=chunksize
+                )
+                for index, (params, metric_value, result, error) in zip(order, outcomes):
+                    if error is not None:
+                        logger.warning(f"パラメータ {params} でエラー: {error}")
+                        continue
+                    
+                    if metric_value > best_metric_value or (
+                        metric_value == best_metric_value and index < best_index
+                    ):
+                        best_metric_value = metric_value
+                        best_index = index
+                        best_params = params
+                        best_result = result
+                    
+                    logger.debug(f"パラメータ {params}: {optimization_metric}={metric_value:.4f}")
+        finally:
+            shm.close()
+            shm.unlink()
         
         logger.info(f"最適化完了: 最良パラメータ={best_params}, {optimization_metric}={best_metric_value:.4f}")
         
         return best_params, best_result
 
 
+@dataclass
+class SweepCombo:
+    """パラメータスイープの1条件（戦略・パラメータ・データ・バックテスト設定）"""
+    strategy: str  # STRATEGIESのキー
+    params: Dict[str, Any] = field(default_factory=dict)  # 戦略クラスに渡す引数
+    currency_pair: CurrencyPair = CurrencyPair.USDJPY
+    bars: int = 2000
+    backtest_config: BacktestConfig = field(default_factory=BacktestConfig)
+
+
+# スイープのワーカープロセス内で共有するデータ（_init_sweep_workerで設定）
+_sweep_context: Dict[str, Any] = {}
+
+
+def _init_sweep_worker(
+    datasets: Dict[Tuple[CurrencyPair, int], Tuple[np.ndarray, Optional[tzinfo]]],
+    risk_config: RiskConfig,
+    strategy_config: StrategyConfig
+) -> None:
+    """スイープ用ワーカープロセスの初期化（データセットはプロセスごとに1回だけ受け取る）"""
+    _sweep_context.update(
+        datasets={
+            key: OHLCVFrame.from_records(array, key[0], tz)
+            for key, (array, tz) in datasets.items()
+        },
+        risk_config=risk_config,
+        strategy_config=strategy_config
+    )
+
+
+def _run_one_backtest(
+    combo: SweepCombo
+) -> Tuple[SweepCombo, Optional[BacktestResult], Optional[str]]:
+    """
+    1条件のバックテストを実行（スイープのワーカープロセス用）
+    
+    Returns:
+        (条件, 結果, エラーメッセージ)
+    """
+    ctx = _sweep_context
+    
+    try:
+        strategy_class = STRATEGIES.get(combo.strategy)
+        if strategy_class is None:
+            raise ValueError(f"Unknown strategy: {combo.strategy}")
+        
+        strategy = strategy_class(ctx["strategy_config"], **combo.params)
+        engine = BacktestEngine(strategy, ctx["risk_config"], combo.backtest_config)
+        result = engine.run(
+            ctx["datasets"][(combo.currency_pair, combo.bars)], combo.currency_pair
+        )
+        return combo, result, None
+    except Exception as e:
+        return combo, None, str(e)
+
+
+def run_sweep(
+    combos: List[SweepCombo],
+    load_data: Callable[..., List[OHLCV]],
+    risk_config: RiskConfig = None,
+    strategy_config: StrategyConfig = None,
+    max_workers: Optional[int] = None
+) -> List[Tuple[SweepCombo, Optional[BacktestResult], Optional[str]]]:
+    """
+    複数条件のバックテストを複数プロセスで並列実行
+    
+    データは（通貨ペア, バー数）ごとに親プロセスで1回だけ読み込み、
+    全条件が同じデータで比較されるようにワーカーへ配布します。
+    
+    Args:
+        combos: スイープ条件のリスト
+        load_data: load_data(currency_pair=..., bars=...) でOHLCVリストを返す関数
+        risk_config: リスク設定
+        strategy_config: 戦略設定
+        max_workers: 並列プロセス数（Noneの場合はCPU数）
+    
+    Returns:
+        条件ごとの (条件, 結果, エラーメッセージ) のリスト（combosと同じ順序）
+    """
+    # (通貨ペア, バー数) → (構造化配列, 時刻のタイムゾーン)
+    datasets: Dict[Tuple[CurrencyPair, int], Tuple[np.ndarray, Optional[tzinfo]]] = {}
+    for combo in combos:
+        key = (combo.currency_pair, combo.bars)
+        if key not in datasets:
+            data = load_data(currency_pair=combo.currency_pair, bars=combo.bars)
+            datasets[key] = (ohlcv_to_array(data), ohlcv_timezone(data))
+    
+    workers = min(max_workers or os.cpu_count(), max(len(combos), 1))
+    logger.info(f"スイープ開始: {len(combos)}条件を{workers}プロセスで実行")
+    
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_sweep_worker,
+        initargs=(
+            datasets,
+            risk_config or RiskConfig(),
+            strategy_config or StrategyConfig()
+        )
+    ) as executor:
+        outcomes = list(executor.map(_run_one_backtest, combos))
+    
+    for combo, _, error in outcomes:
+        if error is not None:
+            logger.warning(f"{combo.strategy} {combo.params} でエラー: {error}")
+    
+    logger.info("スイープ完了")
+    return outcomes
+
+
 if __name__ == "__main__":
     # テスト実行
     from config import StrategyConfig
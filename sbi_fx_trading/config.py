@@ -11,13 +11,19 @@ FXトレード向けの設定を一元管理します。
 
 import os
 from dataclasses import dataclass, field
+from decimal import Decimal
+from functools import lru_cache
 from typing import Dict, List, Optional
 from enum import Enum
 from pathlib import Path
-from dotenv import load_dotenv
+from dotenv import dotenv_values
 
-# .envファイルの読み込み
-load_dotenv()
+# 環境変数のスナップショット（.envはインポート時に1回だけ読み込む）
+# load_dotenv()と同様、既に設定されている環境変数を優先する
+_ENV: Dict[str, str] = {
+    **{key: value for key, value in dotenv_values().items() if value is not None},
+    **os.environ
+}
 
 
 class Broker(Enum):
@@ -34,6 +40,19 @@ class TradingMode(Enum):
     BACKTEST = "backtest"
 
 
+# 時間足ごとの1本あたりの秒数
+_TIMEFRAME_SECONDS: Dict[str, int] = {
+    "1min": 60,
+    "5min": 300,
+    "15min": 900,
+    "30min": 1800,
+    "1hour": 3600,
+    "4hour": 14400,
+    "daily": 86400,
+    "weekly": 604800,
+}
+
+
 class TimeFrame(Enum):
     """時間足"""
     M1 = "1min"
@@ -44,6 +63,9 @@ class TimeFrame(Enum):
     H4 = "4hour"
     D1 = "daily"
     W1 = "weekly"
+    
+    def __init__(self, value: str):
+        self.seconds = _TIMEFRAME_SECONDS[value]  # 1本あたりの秒数
 
 
 class CurrencyPair(Enum):
@@ -55,35 +77,42 @@ class CurrencyPair(Enum):
     EURUSD = "EUR/USD"
     GBPUSD = "GBP/USD"
     AUDUSD = "AUD/USD"
+    
+    def __init__(self, value: str):
+        # 定義時に1回だけ判定しておく（毎回の文字列検索を避ける）
+        self.is_jpy = "JPY" in value  # クロス円かどうか
+        self.pip_value = 0.01 if self.is_jpy else 0.0001  # 1pipの値幅
+        # 1pipの値幅（Decimal、リスク管理の価格計算用）
+        self.pip_decimal = Decimal("0.01") if self.is_jpy else Decimal("0.0001")
 
 
-@dataclass
+@dataclass(slots=True)
 class APIConfig:
     """API接続設定"""
     # ブローカー選択
     broker: Broker = field(
-        default_factory=lambda: Broker(os.getenv("BROKER", "saxo"))
+        default_factory=lambda: Broker(_ENV.get("BROKER", "saxo"))
     )
     
     # トレードモード
     mode: TradingMode = field(
-        default_factory=lambda: TradingMode(os.getenv("TRADING_MODE", "demo"))
+        default_factory=lambda: TradingMode(_ENV.get("TRADING_MODE", "demo"))
     )
     
     # === SBI証券設定 ===
-    sbi_user_id: str = field(default_factory=lambda: os.getenv("SBI_USER_ID", ""))
-    sbi_password: str = field(default_factory=lambda: os.getenv("SBI_PASSWORD", ""))
+    sbi_user_id: str = field(default_factory=lambda: _ENV.get("SBI_USER_ID", ""))
+    sbi_password: str = field(default_factory=lambda: _ENV.get("SBI_PASSWORD", ""))
     sbi_base_url: str = "https://api.sbisec.co.jp/fx"
     sbi_demo_url: str = "https://demo-api.sbisec.co.jp/fx"
     
     # === Saxo Bank設定 ===
-    saxo_app_key: str = field(default_factory=lambda: os.getenv("SAXO_APP_KEY", ""))
-    saxo_app_secret: str = field(default_factory=lambda: os.getenv("SAXO_APP_SECRET", ""))
+    saxo_app_key: str = field(default_factory=lambda: _ENV.get("SAXO_APP_KEY", ""))
+    saxo_app_secret: str = field(default_factory=lambda: _ENV.get("SAXO_APP_SECRET", ""))
     saxo_redirect_uri: str = field(
-        default_factory=lambda: os.getenv("SAXO_REDIRECT_URI", "http://localhost:8080/callback")
+        default_factory=lambda: _ENV.get("SAXO_REDIRECT_URI", "http://localhost:8080/callback")
     )
     saxo_environment: str = field(
-        default_factory=lambda: os.getenv("SAXO_ENVIRONMENT", "sim")  # sim or live
+        default_factory=lambda: _ENV.get("SAXO_ENVIRONMENT", "sim")  # sim or live
     )
     
     # Saxo Bank APIエンドポイント
@@ -94,43 +123,54 @@ class APIConfig:
     saxo_sim_ws_url: str = "wss://streaming.saxobank.com/sim/openapi/streamingws"
     saxo_live_ws_url: str = "wss://streaming.saxobank.com/openapi/streamingws"
     
+    # 解決済みのエンドポイント（設定が変更されるとNoneに戻る）
+    _endpoint: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    
+    def __setattr__(self, name: str, value) -> None:
+        object.__setattr__(self, name, value)
+        # broker・modeなどは起動後に上書きされるため（main.py）、変更時はキャッシュを破棄する
+        if name != "_endpoint":
+            object.__setattr__(self, "_endpoint", None)
+    
     @property
     def endpoint(self) -> str:
-        """現在のモードに応じたエンドポイントを返す"""
-        if self.broker == Broker.SAXO:
-            if self.saxo_environment == "live":
-                return self.saxo_live_api_url
-            return self.saxo_sim_api_url
-        else:  # SBI
-            if self.mode == TradingMode.DEMO:
-                return self.sbi_demo_url
-            return self.sbi_base_url
+        """現在のモードに応じたエンドポイントを返す（初回アクセス時に解決してキャッシュ）"""
+        if self._endpoint is None:
+            self._endpoint = self._resolve_endpoint()
+        return self._endpoint
+    
+    def _resolve_endpoint(self) -> str:
+        """broker・mode・saxo_environmentからエンドポイントを決定"""
+        if self.broker is Broker.SAXO:
+            return self.saxo_live_api_url if self.saxo_environment == "live" else self.saxo_sim_api_url
+        # SBI
+        return self.sbi_demo_url if self.mode is TradingMode.DEMO else self.sbi_base_url
     
     @property
     def is_saxo(self) -> bool:
         """Saxo Bankを使用するかどうか"""
-        return self.broker == Broker.SAXO
+        return self.broker is Broker.SAXO
     
     @property
     def is_sbi(self) -> bool:
         """SBI証券を使用するかどうか"""
-        return self.broker == Broker.SBI
+        return self.broker is Broker.SBI
 
 
-@dataclass
+@dataclass(slots=True)
 class RiskConfig:
     """リスク管理設定"""
     # 1トレードあたりのリスク（口座残高に対する割合）
     risk_per_trade: float = field(
-        default_factory=lambda: float(os.getenv("RISK_PER_TRADE", "0.02"))
+        default_factory=lambda: float(_ENV.get("RISK_PER_TRADE", "0.02"))
     )
     
     # ポジション設定
     default_lot_size: int = field(
-        default_factory=lambda: int(os.getenv("DEFAULT_LOT_SIZE", "1000"))
+        default_factory=lambda: int(_ENV.get("DEFAULT_LOT_SIZE", "1000"))
     )
     max_position_size: int = field(
-        default_factory=lambda: int(os.getenv("MAX_POSITION_SIZE", "10000"))
+        default_factory=lambda: int(_ENV.get("MAX_POSITION_SIZE", "10000"))
     )
     
     # ストップロス・テイクプロフィット（pips）
@@ -147,7 +187,19 @@ class RiskConfig:
     max_drawdown_percent: float = 10.0
 
 
-@dataclass
+# 戦略名 → 説明（戦略名の一覧はここが正。strategy.STRATEGIESはこのキーに対して構築する）
+# --strategyの選択肢と一覧表示に使うため、pandasに依存しないこのモジュールに置く
+STRATEGY_DESCRIPTIONS: Dict[str, str] = {
+    "ma_cross": "移動平均線クロス戦略",
+    "rsi_reversal": "RSI平均回帰戦略",
+    "bollinger": "ボリンジャーバンド戦略",
+    "macd": "MACD戦略",
+    "trend_following": "トレンドフォロー戦略",
+    "combined": "複合戦略（推奨）",
+}
+
+
+@dataclass(slots=True)
 class StrategyConfig:
     """トレード戦略設定"""
     # 使用する時間足
@@ -181,16 +233,22 @@ class StrategyConfig:
     
     # ATR（Average True Range）
     atr_period: int = 14
+    
+    # 発注するシグナルの最低信頼度（これ未満のシグナルは見送る）
+    min_confidence: float = 0.5
+    
+    # 前回のサイクルから価格がこのpips以上動いたら、足の確定を待たずにサイクルを実行（0で無効）
+    price_move_trigger_pips: float = 10.0
 
 
-@dataclass
+@dataclass(slots=True)
 class NotificationConfig:
     """通知設定"""
     slack_webhook_url: Optional[str] = field(
-        default_factory=lambda: os.getenv("SLACK_WEBHOOK_URL")
+        default_factory=lambda: _ENV.get("SLACK_WEBHOOK_URL")
     )
     line_notify_token: Optional[str] = field(
-        default_factory=lambda: os.getenv("LINE_NOTIFY_TOKEN")
+        default_factory=lambda: _ENV.get("LINE_NOTIFY_TOKEN")
     )
     
     # 通知トリガー
@@ -199,14 +257,14 @@ class NotificationConfig:
     notify_daily_summary: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class LogConfig:
     """ログ設定"""
     level: str = field(
-        default_factory=lambda: os.getenv("LOG_LEVEL", "INFO")
+        default_factory=lambda: _ENV.get("LOG_LEVEL", "INFO")
     )
     file_path: Path = field(
-        default_factory=lambda: Path(os.getenv("LOG_FILE_PATH", "./logs/trading.log"))
+        default_factory=lambda: Path(_ENV.get("LOG_FILE_PATH", "./logs/trading.log"))
     )
     
     # ログローテーション
@@ -214,7 +272,7 @@ class LogConfig:
     backup_count: int = 5
 
 
-@dataclass
+@dataclass(slots=True)
 class TradingConfig:
     """統合設定クラス"""
     api: APIConfig = field(default_factory=APIConfig)
@@ -295,11 +353,14 @@ class TradingConfig:
         print("=" * 60)
 
 
-# グローバル設定インスタンス
-config = TradingConfig()
+@lru_cache(maxsize=1)
+def get_config() -> TradingConfig:
+    """グローバル設定インスタンスを取得（初回呼び出し時に作成）"""
+    return TradingConfig()
 
 
 if __name__ == "__main__":
     # 設定のテスト
+    config = get_config()
     config.display()
     config.validate()
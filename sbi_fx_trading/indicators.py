@@ -5,32 +5,203 @@ FX自動売買システム - テクニカル指標モジュール
 numpy/pandasを使用した高速な計算を実現しています。
 """
 
+from collections import deque
+from collections.abc import Sequence
 from dataclasses import dataclass
+from datetime import tzinfo
 from decimal import Decimal
-from typing import List, Optional, Tuple
+from operator import attrgetter
+from typing import Callable, Deque, Dict, List, Optional, Tuple, Union
 
 import numpy as np
 import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
 
 from api_client import OHLCV
+from config import CurrencyPair
+from jit import NUMBA_AVAILABLE, njit
 
+# bottleneck（オプション）: C実装の移動窓集計。未インストール時はpandasのrollingを使用
+try:
+    import bottleneck as bn
+    BOTTLENECK_AVAILABLE = True
+except ImportError:
+    BOTTLENECK_AVAILABLE = False
 
-def ohlcv_to_dataframe(ohlcv_list: List[OHLCV]) -> pd.DataFrame:
+
+class OHLCVHistory(Sequence):
+    """
+    ローソク足リストの先頭からend本分を表す読み取り専用ビュー
+    
+    バックテストで各バー時点までのデータを戦略に渡す際に、
+    リストのスライスを毎回作らずに済みます。DataFrameは元データ全体から
+    1回だけ作成し、ビューごとに先頭から行を切り出して使い回します。
+    """
+    
+    def __init__(
+        self,
+        ohlcv_list: List[OHLCV],
+        end: Optional[int] = None,
+        parent: Optional["OHLCVHistory"] = None
+    ):
+        self._data = ohlcv_list
+        self._end = len(ohlcv_list) if end is None else end
+        self._parent = parent
+        self._df: Optional[pd.DataFrame] = None
+    
+    def up_to(self, end: int) -> "OHLCVHistory":
+        """先頭からend本分のビューを作成（元データ・DataFrameを共有）"""
+        return OHLCVHistory(self._data, end, self._parent or self)
+    
+    def __len__(self) -> int:
+        return self._end
+    
+    def __getitem__(self, index: Union[int, slice]) -> Union[OHLCV, List[OHLCV]]:
+        if isinstance(index, slice):
+            return [self._data[i] for i in range(self._end)[index]]
+        if index < 0:
+            index += self._end
+        if not 0 <= index < self._end:
+            raise IndexError("OHLCVHistory index out of range")
+        return self._data[index]
+    
+    def to_dataframe(self) -> pd.DataFrame:
+        """このビューの範囲のDataFrame（元データ全体のDataFrameの先頭部分）"""
+        root = self._parent or self
+        if root._df is None:
+            root._df = ohlcv_to_dataframe(root._data)
+        return root._df.iloc[:self._end]
+
+
+@dataclass(slots=True)
+class OHLCVFrame:
+    """
+    ローソク足の列指向コンテナ（項目ごとの配列）
+    
+    OHLCVオブジェクトのリストの代わりに、時刻・価格・出来高を項目ごとの
+    配列で保持します。バックテストのように全バーをまとめて扱う処理では、
+    Decimalを経由せずに配列のまま指標計算へ渡せます。
+    ohlcv_to_dataframe・ohlcv_field_array・OHLCVHistoryはリストと同様に扱えます。
+    """
+    currency_pair: CurrencyPair
+    timestamp: pd.DatetimeIndex
+    open: np.ndarray  # float64
+    high: np.ndarray  # float64
+    low: np.ndarray  # float64
+    close: np.ndarray  # float64
+    volume: np.ndarray  # int64
+    
+    @classmethod
+    def from_ohlcv(cls, ohlcv_list: List[OHLCV]) -> "OHLCVFrame":
+        """OHLCVリストから作成（空リストは不可）"""
+        return cls(
+            ohlcv_list[0].currency_pair,
+            # タイムゾーン付きの時刻も保持できるよう、時刻はDatetimeIndexで持つ
+            pd.DatetimeIndex([o.timestamp for o in ohlcv_list], name="timestamp"),
+            *(
+                ohlcv_field_array(ohlcv_list, name, _OHLCV_RECORD_DTYPE[name])
+                for name in _OHLCV_RECORD_DTYPE.names
+            )
+        )
+    
+    @classmethod
+    def from_records(
+        cls,
+        records: np.ndarray,
+        currency_pair: CurrencyPair,
+        tz: Optional[tzinfo] = None
+    ) -> "OHLCVFrame":
+        """
+        構造化配列（timestampはエポックからのマイクロ秒）から作成
+        
+        tzを指定した場合、timestampをUTCとして解釈し、tzの時刻に変換します。
+        """
+        timestamp = pd.DatetimeIndex(records["timestamp"].astype("datetime64[us]"), name="timestamp")
+        if tz is not None:
+            timestamp = timestamp.tz_localize("UTC").tz_convert(tz)
+        return cls(
+            currency_pair,
+            timestamp,
+            *(
+                np.array(records[name], dtype=_OHLCV_RECORD_DTYPE[name])
+                for name in _OHLCV_RECORD_DTYPE.names
+            )
+        )
+    
+    def __len__(self) -> int:
+        return len(self.close)
+    
+    def __getitem__(self, index: int) -> OHLCV:
+        """1本分をOHLCVとして取り出す（リストとの互換用）"""
+        return OHLCV(
+            currency_pair=self.currency_pair,
+            timestamp=self.timestamp[index].to_pydatetime(),
+            open=Decimal(repr(float(self.open[index]))),
+            high=Decimal(repr(float(self.high[index]))),
+            low=Decimal(repr(float(self.low[index]))),
+            close=Decimal(repr(float(self.close[index]))),
+            volume=int(self.volume[index])
+        )
+    
+    def to_list(self) -> List[OHLCV]:
+        """OHLCVリストに変換"""
+        return [self[i] for i in range(len(self))]
+    
+    def to_dataframe(self) -> pd.DataFrame:
+        """DataFrameに変換（列はopen/high/low/close/volume、インデックスは時刻）"""
+        return pd.DataFrame(
+            {name: getattr(self, name) for name in _OHLCV_RECORD_DTYPE.names},
+            index=self.timestamp
+        )
+
+
+OHLCVData = Union[List[OHLCV], OHLCVHistory, OHLCVFrame]
+
+
+def ohlcv_to_dataframe(ohlcv_list: OHLCVData) -> pd.DataFrame:
     """OHLCVリストをDataFrameに変換"""
-    data = {
-        "timestamp": [o.timestamp for o in ohlcv_list],
-        "open": [float(o.open) for o in ohlcv_list],
-        "high": [float(o.high) for o in ohlcv_list],
-        "low": [float(o.low) for o in ohlcv_list],
-        "close": [float(o.close) for o in ohlcv_list],
-        "volume": [o.volume for o in ohlcv_list],
-    }
-    df = pd.DataFrame(data)
-    df.set_index("timestamp", inplace=True)
-    return df
+    if isinstance(ohlcv_list, (OHLCVHistory, OHLCVFrame)):
+        return ohlcv_list.to_dataframe()
+    return _build_dataframe(ohlcv_list)
+
+
+_OHLCV_RECORD_DTYPE = np.dtype([
+    ("open", np.float64),
+    ("high", np.float64),
+    ("low", np.float64),
+    ("close", np.float64),
+    ("volume", np.int64),
+])
 
 
-@dataclass
+def ohlcv_field_array(
+    ohlcv_list: Union[List[OHLCV], OHLCVFrame],
+    name: str,
+    dtype: np.dtype = np.float64
+) -> np.ndarray:
+    """
+    OHLCVリストの1項目を配列として取り出す
+    
+    属性の取得はattrgetter、Decimalからの変換はnumpy側で行うため、
+    バーごとのPythonレベルの処理はほぼ発生しません。
+    """
+    if isinstance(ohlcv_list, OHLCVFrame):
+        return getattr(ohlcv_list, name).astype(dtype, copy=False)
+    return np.fromiter(map(attrgetter(name), ohlcv_list), dtype=dtype, count=len(ohlcv_list))
+
+
+def _build_dataframe(ohlcv_list: List[OHLCV]) -> pd.DataFrame:
+    """OHLCVリストからDataFrameを作成"""
+    # 価格・出来高は項目ごとに構造化配列へ展開する
+    values = np.empty(len(ohlcv_list), dtype=_OHLCV_RECORD_DTYPE)
+    for name in _OHLCV_RECORD_DTYPE.names:
+        values[name] = ohlcv_field_array(ohlcv_list, name, _OHLCV_RECORD_DTYPE[name])
+    # タイムゾーン付きの時刻も保持できるよう、時刻はDatetimeIndexで作成する
+    index = pd.DatetimeIndex([o.timestamp for o in ohlcv_list], name="timestamp")
+    return pd.DataFrame(values, index=index)
+
+
+@dataclass(slots=True)
 class IndicatorResult:
     """テクニカル指標の計算結果"""
     name: str
@@ -38,6 +209,200 @@ class IndicatorResult:
     signal: Optional[str] = None  # "buy", "sell", None
 
 
+# ==================== 移動窓集計 ====================
+# bottleneckがあればC実装、なければpandasのrollingで計算（結果は同じ）
+
+
+def _move_mean(series: pd.Series, window: int, min_periods: Optional[int] = None) -> pd.Series:
+    """移動平均（min_periods未満のバーはNaN、省略時はwindow）"""
+    min_periods = window if min_periods is None else min_periods
+    if not BOTTLENECK_AVAILABLE:
+        return series.rolling(window=window, min_periods=min_periods).mean()
+    values = bn.move_mean(series.to_numpy(dtype=np.float64), window, min_count=min_periods)
+    return pd.Series(values, index=series.index, name=series.name)
+
+
+def _move_std(series: pd.Series, window: int) -> pd.Series:
+    """移動標準偏差（標本標準偏差、ddof=1）"""
+    if not BOTTLENECK_AVAILABLE:
+        return series.rolling(window=window).std()
+    values = bn.move_std(series.to_numpy(dtype=np.float64), window, ddof=1)
+    return pd.Series(values, index=series.index, name=series.name)
+
+
+def _move_min(series: pd.Series, window: int) -> pd.Series:
+    """移動最小値"""
+    if not BOTTLENECK_AVAILABLE:
+        return series.rolling(window=window).min()
+    values = bn.move_min(series.to_numpy(dtype=np.float64), window)
+    return pd.Series(values, index=series.index, name=series.name)
+
+
+def _move_max(series: pd.Series, window: int) -> pd.Series:
+    """移動最大値"""
+    if not BOTTLENECK_AVAILABLE:
+        return series.rolling(window=window).max()
+    values = bn.move_max(series.to_numpy(dtype=np.float64), window)
+    return pd.Series(values, index=series.index, name=series.name)
+
+
+class IncrementalSMA:
+    """
+    逐次更新の単純移動平均
+    
+    直近window本の値と合計を保持し、1本追加するごとにO(1)で更新します。
+    ライブ取引のように同じ系列へ新しいバーが1本ずつ追加される場合に使用します。
+    """
+    
+    __slots__ = ("window", "_values", "_total")
+    
+    def __init__(self, window: int):
+        self.window = window
+        self._values: Deque[float] = deque(maxlen=window)
+        self._total = 0.0
+    
+    def __len__(self) -> int:
+        return len(self._values)
+    
+    @property
+    def value(self) -> float:
+        """現在の移動平均（window本に満たない場合はNaN）"""
+        if len(self._values) < self.window:
+            return float("nan")
+        return self._total / self.window
+    
+    def update(self, price: float) -> float:
+        """値を1本追加し、更新後の移動平均を返す"""
+        self._total += price
+        if len(self._values) == self.window:
+            self._total -= self._values[0]
+        self._values.append(price)  # maxlenにより最古の値は自動的に外れる
+        return self.value
+    
+    def peek(self, price: float) -> float:
+        """値を追加した場合の移動平均を返す（状態は変更しない）"""
+        if len(self._values) + 1 < self.window:
+            return float("nan")
+        total = self._total + price
+        if len(self._values) == self.window:
+            total -= self._values[0]
+        return total / self.window
+
+
+# ==================== JITカーネル ====================
+# numbaが利用可能な場合のみ使用（未インストール時はpandasの実装で計算）
+
+
+@njit(cache=True)
+def _rolling_mean_nb(values: np.ndarray, period: int, min_periods: int) -> np.ndarray:
+    """移動平均（pandasのrolling().mean()と同じくNaNを除いた本数で平均）"""
+    n = len(values)
+    result = np.full(n, np.nan)
+    total = 0.0
+    count = 0
+    
+    for i in range(n):
+        value = values[i]
+        if not np.isnan(value):
+            total += value
+            count += 1
+        if i >= period:
+            old = values[i - period]
+            if not np.isnan(old):
+                total -= old
+                count -= 1
+        if count >= min_periods and count > 0:
+            result[i] = total / count
+    
+    return result
+
+
+@njit(cache=True)
+def _true_range_nb(high: np.ndarray, low: np.ndarray, close: np.ndarray) -> np.ndarray:
+    """True Range（先頭バーは高値 - 安値）"""
+    n = len(high)
+    tr = np.empty(n)
+    
+    for i in range(n):
+        tr[i] = high[i] - low[i]
+        if i > 0:
+            prev_close = close[i - 1]
+            tr[i] = max(tr[i], abs(high[i] - prev_close), abs(low[i] - prev_close))
+    
+    return tr
+
+
+@njit(cache=True)
+def _atr_nb(high: np.ndarray, low: np.ndarray, close: np.ndarray, period: int) -> np.ndarray:
+    """ATR（True Rangeの単純移動平均）"""
+    return _rolling_mean_nb(_true_range_nb(high, low, close), period, period)
+
+
+@njit(cache=True)
+def _rsi_nb(close: np.ndarray, period: int) -> np.ndarray:
+    """RSI（上昇幅・下落幅の単純移動平均、データ不足時は利用可能な本数で平均）"""
+    n = len(close)
+    gain = np.zeros(n)
+    loss = np.zeros(n)
+    
+    for i in range(1, n):
+        delta = close[i] - close[i - 1]
+        if delta > 0:
+            gain[i] = delta
+        elif delta < 0:
+            loss[i] = -delta
+    
+    avg_gain = _rolling_mean_nb(gain, period, 1)
+    avg_loss = _rolling_mean_nb(loss, period, 1)
+    rsi = np.full(n, np.nan)
+    
+    for i in range(n):
+        if avg_loss[i] > 0:
+            rsi[i] = 100.0 - 100.0 / (1.0 + avg_gain[i] / avg_loss[i])
+        elif avg_gain[i] > 0:
+            rsi[i] = 100.0
+    
+    return rsi
+
+
+@njit(cache=True)
+def _adx_nb(
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    period: int
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """ADX・+DI・-DI"""
+    n = len(high)
+    atr = _atr_nb(high, low, close, period)
+    plus_dm = np.zeros(n)
+    minus_dm = np.zeros(n)
+    
+    for i in range(1, n):
+        up_move = high[i] - high[i - 1]
+        down_move = low[i - 1] - low[i]
+        if up_move > down_move and up_move > 0:
+            plus_dm[i] = up_move
+        if down_move > up_move and down_move > 0:
+            minus_dm[i] = down_move
+    
+    plus_dm_avg = _rolling_mean_nb(plus_dm, period, period)
+    minus_dm_avg = _rolling_mean_nb(minus_dm, period, period)
+    plus_di = np.full(n, np.nan)
+    minus_di = np.full(n, np.nan)
+    dx = np.full(n, np.nan)
+    
+    for i in range(n):
+        if atr[i] > 0:
+            plus_di[i] = 100.0 * plus_dm_avg[i] / atr[i]
+            minus_di[i] = 100.0 * minus_dm_avg[i] / atr[i]
+            di_sum = plus_di[i] + minus_di[i]
+            if di_sum > 0:
+                dx[i] = 100.0 * abs(plus_di[i] - minus_di[i]) / di_sum
+    
+    return _rolling_mean_nb(dx, period, period), plus_di, minus_di
+
+
 class TechnicalIndicators:
     """テクニカル指標計算クラス"""
     
@@ -45,9 +410,13 @@ class TechnicalIndicators:
         """
         Args:
             df: OHLCV DataFrameopen, high, low, close, volumeカラムを含む）
+        
+        dfはコピーせずに参照します（このクラスはdfを変更しません）。
         """
-        self.df = df.copy()
+        self.df = df
         self._validate_dataframe()
+        # 計算済み指標のキャッシュ（(指標名, パラメータ...) → 系列）
+        self._cache: Dict[tuple, pd.Series] = {}
     
     def _validate_dataframe(self) -> None:
         """DataFrameの検証"""
@@ -56,6 +425,22 @@ class TechnicalIndicators:
             if col not in self.df.columns:
                 raise ValueError(f"必須カラム '{col}' が見つかりません")
     
+    def _memo(self, key: tuple, compute: Callable[[], pd.Series]) -> pd.Series:
+        """同じパラメータの指標は1回だけ計算し、以降はキャッシュを返す"""
+        series = self._cache.get(key)
+        if series is None:
+            series = compute()
+            self._cache[key] = series
+        return series
+    
+    def _hlc_arrays(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """高値・安値・終値のfloat64配列（JITカーネル用）"""
+        return (
+            self.df["high"].to_numpy(dtype=np.float64),
+            self.df["low"].to_numpy(dtype=np.float64),
+            self.df["close"].to_numpy(dtype=np.float64)
+        )
+    
     # ==================== 移動平均 ====================
     
     def sma(self, period: int, column: str = "close") -> pd.Series:
@@ -69,7 +454,10 @@ class TechnicalIndicators:
         Returns:
             SMA系列
         """
-        return self.df[column].rolling(window=period).mean()
+        return self._memo(
+            ("sma", period, column),
+            lambda: _move_mean(self.df[column], period)
+        )
     
     def ema(self, period: int, column: str = "close") -> pd.Series:
         """
@@ -82,7 +470,10 @@ class TechnicalIndicators:
         Returns:
             EMA系列
         """
-        return self.df[column].ewm(span=period, adjust=False).mean()
+        return self._memo(
+            ("ema", period, column),
+            lambda: self.df[column].ewm(span=period, adjust=False).mean()
+        )
     
     def wma(self, period: int, column: str = "close") -> pd.Series:
         """
@@ -95,10 +486,15 @@ class TechnicalIndicators:
         Returns:
             WMA系列
         """
-        weights = np.arange(1, period + 1)
-        return self.df[column].rolling(window=period).apply(
-            lambda x: np.dot(x, weights) / weights.sum(), raw=True
-        )
+        values = self.df[column].to_numpy(dtype=np.float64)
+        weights = np.arange(1, period + 1, dtype=np.float64)
+        weights /= weights.sum()
+        
+        # 畳み込みで全ウィンドウの加重平均を一括計算（先頭period-1本はNaN）
+        result = np.full(len(values), np.nan)
+        if len(values) >= period:
+            result[period - 1:] = np.convolve(values, weights[::-1], mode="valid")
+        return pd.Series(result, index=self.df.index, name=column)
     
     # ==================== トレンド指標 ====================
     
@@ -138,16 +534,30 @@ class TechnicalIndicators:
         Returns:
             (ADX, +DI, -DI)
         """
+        if NUMBA_AVAILABLE:
+            adx, plus_di, minus_di = _adx_nb(*self._hlc_arrays(), period)
+            index = self.df.index
+            return (
+                pd.Series(adx, index=index),
+                pd.Series(plus_di, index=index),
+                pd.Series(minus_di, index=index)
+            )
+        
         high = self.df["high"]
         low = self.df["low"]
         close = self.df["close"]
         
         # True Range
+        prev_close = close.shift(1)
         tr1 = high - low
-        tr2 = abs(high - close.shift(1))
-        tr3 = abs(low - close.shift(1))
-        tr = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
-        atr = tr.rolling(window=period).mean()
+        tr2 = (high - prev_close).abs()
+        tr3 = (low - prev_close).abs()
+        # 先頭バーは前日終値がないため、NaNを無視するfmaxで高値 - 安値を採用
+        tr = pd.Series(
+            np.fmax.reduce([tr1.to_numpy(), tr2.to_numpy(), tr3.to_numpy()]),
+            index=self.df.index
+        )
+        atr = _move_mean(tr, period)
         
         # Directional Movement
         up_move = high - high.shift(1)
@@ -156,12 +566,14 @@ class TechnicalIndicators:
         plus_dm = np.where((up_move > down_move) & (up_move > 0), up_move, 0)
         minus_dm = np.where((down_move > up_move) & (down_move > 0), down_move, 0)
         
-        plus_di = 100 * pd.Series(plus_dm).rolling(window=period).mean() / atr
-        minus_di = 100 * pd.Series(minus_dm).rolling(window=period).mean() / atr
+        plus_dm = pd.Series(plus_dm, index=self.df.index)
+        minus_dm = pd.Series(minus_dm, index=self.df.index)
+        plus_di = 100 * _move_mean(plus_dm, period) / atr
+        minus_di = 100 * _move_mean(minus_dm, period) / atr
         
         # ADX
         dx = 100 * abs(plus_di - minus_di) / (plus_di + minus_di)
-        adx = dx.rolling(window=period).mean()
+        adx = _move_mean(dx, period)
         
         return adx, plus_di, minus_di
     
@@ -177,13 +589,21 @@ class TechnicalIndicators:
         Returns:
             RSI系列（0-100）
         """
+        return self._memo(("rsi", period), lambda: self._rsi(period))
+    
+    def _rsi(self, period: int) -> pd.Series:
+        """RSIを計算（キャッシュなし）"""
+        if NUMBA_AVAILABLE:
+            close = self.df["close"].to_numpy(dtype=np.float64)
+            return pd.Series(_rsi_nb(close, period), index=self.df.index)
+        
         delta = self.df["close"].diff()
         
         gain = delta.where(delta > 0, 0)
         loss = (-delta).where(delta < 0, 0)
         
-        avg_gain = gain.rolling(window=period, min_periods=1).mean()
-        avg_loss = loss.rolling(window=period, min_periods=1).mean()
+        avg_gain = _move_mean(gain, period, min_periods=1)
+        avg_loss = _move_mean(loss, period, min_periods=1)
         
         rs = avg_gain / avg_loss
         rsi = 100 - (100 / (1 + rs))
@@ -205,11 +625,11 @@ class TechnicalIndicators:
         Returns:
             (%K, %D)
         """
-        low_min = self.df["low"].rolling(window=k_period).min()
-        high_max = self.df["high"].rolling(window=k_period).max()
+        low_min = _move_min(self.df["low"], k_period)
+        high_max = _move_max(self.df["high"], k_period)
         
         stoch_k = 100 * (self.df["close"] - low_min) / (high_max - low_min)
-        stoch_d = stoch_k.rolling(window=d_period).mean()
+        stoch_d = _move_mean(stoch_k, d_period)
         
         return stoch_k, stoch_d
     
@@ -223,14 +643,20 @@ class TechnicalIndicators:
         Returns:
             CCI系列
         """
-        tp = (self.df["high"] + self.df["low"] + self.df["close"]) / 3
-        tp_sma = tp.rolling(window=period).mean()
-        tp_mad = tp.rolling(window=period).apply(
-            lambda x: np.abs(x - x.mean()).mean(), raw=True
-        )
+        tp = ((self.df["high"] + self.df["low"] + self.df["close"]) / 3).to_numpy()
+        tp_sma = np.full(len(tp), np.nan)
+        tp_mad = np.full(len(tp), np.nan)
         
-        cci = (tp - tp_sma) / (0.015 * tp_mad)
-        return cci
+        # 全ウィンドウを(N-period+1, period)のビューとして平均・平均絶対偏差を一括計算
+        if len(tp) >= period:
+            windows = sliding_window_view(tp, period)
+            means = windows.mean(axis=1)
+            tp_sma[period - 1:] = means
+            tp_mad[period - 1:] = np.abs(windows - means[:, None]).mean(axis=1)
+        
+        with np.errstate(invalid="ignore", divide="ignore"):
+            cci = (tp - tp_sma) / (0.015 * tp_mad)
+        return pd.Series(cci, index=self.df.index)
     
     def williams_r(self, period: int = 14) -> pd.Series:
         """
@@ -242,8 +668,8 @@ class TechnicalIndicators:
         Returns:
             Williams %R系列（-100〜0）
         """
-        high_max = self.df["high"].rolling(window=period).max()
-        low_min = self.df["low"].rolling(window=period).min()
+        high_max = _move_max(self.df["high"], period)
+        low_min = _move_min(self.df["low"], period)
         
         wr = -100 * (high_max - self.df["close"]) / (high_max - low_min)
         return wr
@@ -266,7 +692,7 @@ class TechnicalIndicators:
             (上バンド, 中央線, 下バンド)
         """
         middle = self.sma(period)
-        std = self.df["close"].rolling(window=period).std()
+        std = _move_std(self.df["close"], period)
         
         upper = middle + (std * std_dev)
         lower = middle - (std * std_dev)
@@ -283,16 +709,28 @@ class TechnicalIndicators:
         Returns:
             ATR系列
         """
+        return self._memo(("atr", period), lambda: self._atr(period))
+    
+    def _atr(self, period: int) -> pd.Series:
+        """ATRを計算（キャッシュなし）"""
+        if NUMBA_AVAILABLE:
+            return pd.Series(_atr_nb(*self._hlc_arrays(), period), index=self.df.index)
+        
         high = self.df["high"]
         low = self.df["low"]
         close = self.df["close"]
         
+        prev_close = close.shift(1)
         tr1 = high - low
-        tr2 = abs(high - close.shift(1))
-        tr3 = abs(low - close.shift(1))
+        tr2 = (high - prev_close).abs()
+        tr3 = (low - prev_close).abs()
         
-        tr = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
-        atr = tr.rolling(window=period).mean()
+        # 先頭バーは前日終値がないため、NaNを無視するfmaxで高値 - 安値を採用
+        tr = pd.Series(
+            np.fmax.reduce([tr1.to_numpy(), tr2.to_numpy(), tr3.to_numpy()]),
+            index=self.df.index
+        )
+        atr = _move_mean(tr, period)
         
         return atr
     
@@ -333,11 +771,12 @@ class TechnicalIndicators:
         if "volume" not in self.df.columns:
             raise ValueError("volumeカラムが必要です")
         
-        close_diff = self.df["close"].diff()
-        direction = np.where(close_diff > 0, 1, np.where(close_diff < 0, -1, 0))
+        close = self.df["close"].to_numpy()
+        volume = self.df["volume"].to_numpy()
+        # 前バーからの騰落の符号（先頭バーは0）
+        direction = np.sign(np.diff(close, prepend=close[:1])).astype(np.int8)
         
-        obv = (self.df["volume"] * direction).cumsum()
-        return pd.Series(obv, index=self.df.index)
+        return pd.Series(np.cumsum(volume * direction), index=self.df.index)
     
     def vwap(self) -> pd.Series:
         """
@@ -349,10 +788,13 @@ class TechnicalIndicators:
         if "volume" not in self.df.columns:
             raise ValueError("volumeカラムが必要です")
         
-        tp = (self.df["high"] + self.df["low"] + self.df["close"]) / 3
-        vwap = (tp * self.df["volume"]).cumsum() / self.df["volume"].cumsum()
+        high, low, close = self._hlc_arrays()
+        volume = self.df["volume"].to_numpy()
+        tp = (high + low + close) / 3
         
-        return vwap
+        with np.errstate(invalid="ignore", divide="ignore"):
+            vwap = np.cumsum(tp * volume) / np.cumsum(volume)
+        return pd.Series(vwap, index=self.df.index)
     
     # ==================== サポート・レジスタンス ====================
     
@@ -363,12 +805,18 @@ class TechnicalIndicators:
         Returns:
             (ピボット, R1, R2, S1, S2)
         """
-        pivot = (self.df["high"].shift(1) + self.df["low"].shift(1) + self.df["close"].shift(1)) / 3
+        # 前日の高値・安値・終値
+        prev_high = self.df["high"].shift(1)
+        prev_low = self.df["low"].shift(1)
+        prev_close = self.df["close"].shift(1)
+        prev_range = prev_high - prev_low
+        
+        pivot = (prev_high + prev_low + prev_close) / 3
         
-        r1 = 2 * pivot - self.df["low"].shift(1)
-        s1 = 2 * pivot - self.df["high"].shift(1)
-        r2 = pivot + (self.df["high"].shift(1) - self.df["low"].shift(1))
-        s2 = pivot - (self.df["high"].shift(1) - self.df["low"].shift(1))
+        r1 = 2 * pivot - prev_low
+        s1 = 2 * pivot - prev_high
+        r2 = pivot + prev_range
+        s2 = pivot - prev_range
         
         return pivot, r1, r2, s1, s2
     
@@ -385,12 +833,7 @@ class TechnicalIndicators:
         Returns:
             ゴールデンクロス発生フラグ
         """
-        short_ma = self.sma(short_period)
-        long_ma = self.sma(long_period)
-        
-        # 前日は短期MA < 長期MA、当日は短期MA > 長期MA
-        golden_cross = (short_ma.shift(1) < long_ma.shift(1)) & (short_ma > long_ma)
-        
+        golden_cross, _ = self._crosses(short_period, long_period)
         return golden_cross
     
     def is_dead_cross(self, short_period: int = 20, long_period: int = 50) -> pd.Series:
@@ -404,13 +847,28 @@ class TechnicalIndicators:
         Returns:
             デッドクロス発生フラグ
         """
-        short_ma = self.sma(short_period)
-        long_ma = self.sma(long_period)
+        _, dead_cross = self._crosses(short_period, long_period)
+        return dead_cross
+    
+    def _crosses(self, short_period: int, long_period: int) -> Tuple[pd.Series, pd.Series]:
+        """
+        ゴールデンクロス・デッドクロスを同時に検出
         
-        # 前日は短期MA > 長期MA、当日は短期MA < 長期MA
-        dead_cross = (short_ma.shift(1) > long_ma.shift(1)) & (short_ma < long_ma)
+        短期MA - 長期MAの符号が前日から反転したバーをクロスとします。
         
-        return dead_cross
+        Returns:
+            (ゴールデンクロス発生フラグ, デッドクロス発生フラグ)
+        """
+        diff = self.sma(short_period).to_numpy() - self.sma(long_period).to_numpy()
+        golden_cross = np.zeros(len(diff), dtype=bool)
+        dead_cross = np.zeros(len(diff), dtype=bool)
+        
+        # 前日は短期MA < 長期MA、当日は短期MA > 長期MA（デッドクロスは逆）
+        golden_cross[1:] = (diff[:-1] < 0) & (diff[1:] > 0)
+        dead_cross[1:] = (diff[:-1] > 0) & (diff[1:] < 0)
+        
+        index = self.df.index
+        return pd.Series(golden_cross, index=index), pd.Series(dead_cross, index=index)
     
     def is_bullish_divergence(self, rsi_period: int = 14, lookback: int = 5) -> pd.Series:
         """
@@ -427,8 +885,8 @@ class TechnicalIndicators:
         rsi = self.rsi(rsi_period)
         price = self.df["close"]
         
-        price_lower_low = price < price.rolling(window=lookback).min().shift(1)
-        rsi_higher_low = rsi > rsi.rolling(window=lookback).min().shift(1)
+        price_lower_low = price < _move_min(price, lookback).shift(1)
+        rsi_higher_low = rsi > _move_min(rsi, lookback).shift(1)
         
         return price_lower_low & rsi_higher_low
     
@@ -447,8 +905,8 @@ class TechnicalIndicators:
         rsi = self.rsi(rsi_period)
         price = self.df["close"]
         
-        price_higher_high = price > price.rolling(window=lookback).max().shift(1)
-        rsi_lower_high = rsi < rsi.rolling(window=lookback).max().shift(1)
+        price_higher_high = price > _move_max(price, lookback).shift(1)
+        rsi_lower_high = rsi < _move_max(rsi, lookback).shift(1)
         
         return price_higher_high & rsi_lower_high
 
@@ -468,61 +926,59 @@ def calculate_all_indicators(df: pd.DataFrame, config: dict = None) -> pd.DataFr
         config = {}
     
     indicators = TechnicalIndicators(df)
-    result = df.copy()
-    
-    # 移動平均
-    result["sma_20"] = indicators.sma(config.get("sma_short", 20))
-    result["sma_50"] = indicators.sma(config.get("sma_long", 50))
-    result["ema_21"] = indicators.ema(config.get("ema_period", 21))
     
-    # MACD
+    # 各指標を列の辞書にまとめ、最後に1回のassignでDataFrameへ追加する
+    # （同じSMA・EMAはTechnicalIndicatorsのキャッシュで共有される）
     macd, signal, hist = indicators.macd(
         config.get("macd_fast", 12),
         config.get("macd_slow", 26),
         config.get("macd_signal", 9)
     )
-    result["macd"] = macd
-    result["macd_signal"] = signal
-    result["macd_hist"] = hist
-    
-    # RSI
-    result["rsi"] = indicators.rsi(config.get("rsi_period", 14))
-    
-    # ストキャスティクス
     stoch_k, stoch_d = indicators.stochastic(
         config.get("stoch_k", 14),
         config.get("stoch_d", 3)
     )
-    result["stoch_k"] = stoch_k
-    result["stoch_d"] = stoch_d
-    
-    # ボリンジャーバンド
     bb_upper, bb_middle, bb_lower = indicators.bollinger_bands(
         config.get("bb_period", 20),
         config.get("bb_std", 2.0)
     )
-    result["bb_upper"] = bb_upper
-    result["bb_middle"] = bb_middle
-    result["bb_lower"] = bb_lower
-    
-    # ATR
-    result["atr"] = indicators.atr(config.get("atr_period", 14))
-    
-    # ADX
     adx, plus_di, minus_di = indicators.adx(config.get("adx_period", 14))
-    result["adx"] = adx
-    result["plus_di"] = plus_di
-    result["minus_di"] = minus_di
-    
-    # パターン検出
-    result["golden_cross"] = indicators.is_golden_cross()
-    result["dead_cross"] = indicators.is_dead_cross()
+    golden_cross, dead_cross = indicators._crosses(20, 50)
+    
+    columns = {
+        # 移動平均
+        "sma_20": indicators.sma(config.get("sma_short", 20)),
+        "sma_50": indicators.sma(config.get("sma_long", 50)),
+        "ema_21": indicators.ema(config.get("ema_period", 21)),
+        # MACD
+        "macd": macd,
+        "macd_signal": signal,
+        "macd_hist": hist,
+        # RSI
+        "rsi": indicators.rsi(config.get("rsi_period", 14)),
+        # ストキャスティクス
+        "stoch_k": stoch_k,
+        "stoch_d": stoch_d,
+        # ボリンジャーバンド
+        "bb_upper": bb_upper,
+        "bb_middle": bb_middle,
+        "bb_lower": bb_lower,
+        # ATR
+        "atr": indicators.atr(config.get("atr_period", 14)),
+        # ADX
+        "adx": adx,
+        "plus_di": plus_di,
+        "minus_di": minus_di,
+        # パターン検出
+        "golden_cross": golden_cross,
+        "dead_cross": dead_cross,
+    }
     
-    return result
+    return df.assign(**columns)
 
 
-if __name__ == "__main__":
-    # テスト用のサンプルデータ生成
+def _demo() -> None:
+    """動作確認用のデモ（インポート時にはサンプルデータを生成しない）"""
     import random
     from datetime import datetime, timedelta
     
@@ -557,3 +1013,7 @@ if __name__ == "__main__":
     print(f"  MACD: {latest['macd']:.4f}")
     print(f"  ATR(14): {latest['atr']:.4f}")
     print(f"  ADX(14): {latest['adx']:.1f}")
+
+
+if __name__ == "__main__":
+    _demo()
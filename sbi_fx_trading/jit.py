@@ -0,0 +1,24 @@
+"""
+FX自動売買システム - JITコンパイル補助モジュール
+
+numbaがインストールされている場合は@njitでネイティブコードにコンパイルし、
+未インストールの場合は通常のPython関数としてそのまま実行します。
+numbaはオプション依存のため、各モジュールは直接importせずこのモジュールを経由してください。
+"""
+
+from typing import Any, Callable
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args: Any, **kwargs: Any) -> Callable:
+        """numba未インストール時の代替（何もしないデコレータ）"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func: Callable) -> Callable:
+            return func
+        return decorator
@@ -26,28 +26,44 @@ FX自動売買システム - メインエントリーポイント
 
 import argparse
 import asyncio
+import json
 import logging
 import signal
 import sys
-from datetime import datetime, timedelta
+import time
+from collections import deque
+from functools import partial
+from datetime import datetime, timedelta, timezone
 from decimal import Decimal
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Any, Deque, Dict, List, Optional, Set, Tuple
 
 # ローカルモジュール
 from api_client import (
-    CurrencyPair, FXBrokerClient, MockBrokerClient, Order, OrderSide,
-    OrderType, SBIFXClient, Tick, create_broker_client
+    OHLCV, CurrencyPair, FXBrokerClient, MockBrokerClient, Order, OrderSide,
+    OrderType, Position, SBIFXClient, Tick, create_broker_client
 )
-from backtester import BacktestConfig, BacktestEngine, generate_sample_data
-from config import Broker, TradingConfig, TradingMode, config
-from indicators import TechnicalIndicators, calculate_all_indicators, ohlcv_to_dataframe
+from config import STRATEGY_DESCRIPTIONS, Broker, TradingConfig, TradingMode, get_config
 from risk_management import RiskManager, TradeRecord
-from strategy import (
-    BollingerBandStrategy, CombinedStrategy, MACDStrategy,
-    MovingAverageCrossStrategy, RSIMeanReversionStrategy,
-    TradingSignal, TradingStrategy, TrendFollowingStrategy, get_strategy
-)
+
+# uvloop（オプション）: libuvベースの高速なイベントループ（Linux/macOSのみ）
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
+# 戦略・バックテスト（pandas/numpyに依存）は実行時に必要になった時点でインポートする
+# （--help や --list-* ではpandasの読み込みを待たずに済む）
+if TYPE_CHECKING:
+    from strategy import TradingSignal, TradingStrategy
+
+# バックテスト用サンプルデータの生成条件（通貨ペア・バー数以外）
+SAMPLE_DATA_PARAMS: Dict[str, Any] = {
+    "timeframe_hours": 1,
+    "trend": 0.00002,
+    "volatility": 0.0006,
+}
 
 # ロギング設定
 def setup_logging(log_level: str = "INFO", log_file: Optional[Path] = None) -> None:
@@ -81,7 +97,7 @@ class TradingBot:
     def __init__(
         self,
         broker_client: FXBrokerClient,
-        strategy: TradingStrategy,
+        strategy: "TradingStrategy",
         risk_manager: RiskManager,
         trading_config: TradingConfig
     ):
@@ -91,6 +107,22 @@ class TradingBot:
         self.config = trading_config
         self.is_running = False
         self._stop_event = asyncio.Event()
+        # 足の確定（ティックの時刻が次の足に入った）を通知するイベント
+        self._bar_close_event = asyncio.Event()
+        self._tick_task: Optional[asyncio.Task] = None
+        # (通貨ペア, 時間足) ごとの直近のローソク足（差分のみ取得して追記する）
+        self._ohlcv_cache: Dict[Tuple[CurrencyPair, str], Deque[OHLCV]] = {}
+        # プッシュ配信で更新される (通貨ペア, 時間足)（キャッシュ作成後はREST取得しない）
+        self._streamed_ohlcv: Set[Tuple[CurrencyPair, str]] = set()
+        # 配信が途切れた (通貨ペア, 時間足)（REST取得で追いついてから再購読する）
+        self._lost_ohlcv_streams: Set[Tuple[CurrencyPair, str]] = set()
+        # 通貨ペアを並行処理する際の同時リクエスト数の上限
+        self._request_semaphore = asyncio.Semaphore(4)
+        # 通貨ペアごとに前回シグナルを評価した最新バー (時刻, 終値)
+        self._last_evaluated_bar: Dict[CurrencyPair, Tuple[datetime, Decimal]] = {}
+        # ティック受信時にサイクルを前倒しするかの判定用（直近のサイクルで取得したポジションと価格）
+        self._watched_positions: List[Position] = []
+        self._cycle_prices: Dict[CurrencyPair, Decimal] = {}
     
     async def start(self) -> None:
         """ボットを開始"""
@@ -118,6 +150,8 @@ class TradingBot:
             logger.error(f"API接続エラー: {e}")
             return
         
+        await self._subscribe_ohlcv()
+        
         self.is_running = True
         logger.info("ボット稼働中... (Ctrl+C で停止)")
         
@@ -128,11 +162,31 @@ class TradingBot:
         finally:
             await self.stop()
     
+    def request_stop(self) -> None:
+        """
+        ボットの停止を要求（シグナルハンドラー用）
+        
+        トレードループを抜けるだけで、後片付けはstart()の終了処理で
+        1回だけ行います。
+        """
+        logger.info("停止シグナルを受信...")
+        self._stop_event.set()
+        self._bar_close_event.set()  # 待機中のトレードループを起こす
+    
     async def stop(self) -> None:
         """ボットを停止"""
         logger.info("ボットを停止中...")
         self.is_running = False
         self._stop_event.set()
+        self._bar_close_event.set()  # 待機中のトレードループを起こす
+        
+        if self._tick_task:
+            self._tick_task.cancel()
+            try:
+                await self._tick_task
+            except asyncio.CancelledError:
+                pass
+            self._tick_task = None
         
         # オープンポジションを確認
         positions = await self.client.get_positions()
@@ -146,8 +200,17 @@ class TradingBot:
         logger.info("ボットを停止しました")
     
     async def _trading_loop(self) -> None:
-        """メイントレードループ"""
-        poll_interval = 60  # 1分間隔でチェック
+        """
+        メイントレードループ
+        
+        一定間隔のポーリングではなく、ティック配信から足の確定を検知した時点で
+        トレードサイクルを実行します。保有ポジションが損切り・利確ラインに達した場合や、
+        価格が前回のサイクルから大きく動いた場合も前倒しで実行します。配信が止まった場合に備え、
+        max_wait秒経過しても足が確定しなければサイクルを実行します。
+        """
+        max_wait = 300  # ストリーム停止時のフォールバック間隔（秒）
+        
+        self._tick_task = asyncio.create_task(self._tick_consumer())
         
         while self.is_running and not self._stop_event.is_set():
             try:
@@ -155,23 +218,84 @@ class TradingBot:
             except Exception as e:
                 logger.error(f"トレードサイクルでエラー: {e}", exc_info=True)
             
-            # 次のサイクルまで待機
+            # 次の足の確定まで待機
             try:
-                await asyncio.wait_for(
-                    self._stop_event.wait(),
-                    timeout=poll_interval
-                )
+                await asyncio.wait_for(self._bar_close_event.wait(), timeout=max_wait)
             except asyncio.TimeoutError:
-                pass  # タイムアウトは正常（次のサイクルへ）
+                logger.debug("足の確定を検知できなかったためサイクルを実行します")
+            self._bar_close_event.clear()
+    
+    async def _tick_consumer(self) -> None:
+        """ティック配信を監視し、足の切り替わりや急な値動きで_bar_close_eventをセット"""
+        currency_pairs = self.config.strategy.currency_pairs
+        bar_seconds = self.config.strategy.primary_timeframe.seconds
+        move_pips = Decimal(str(self.config.strategy.price_move_trigger_pips))
+        # プッシュ配信がない場合のポーリング間隔。足の確定検知には1本あたり数回で足り、
+        # 毎秒ポーリングすると通貨ペア数×60回/分のREST呼び出しになるため、
+        # 足の長さの1/4（最大60秒、従来のサイクル間隔）にする
+        poll_interval = min(60.0, bar_seconds / 4)
+        last_bars: Dict[CurrencyPair, int] = {}
+        
+        while self.is_running:
+            try:
+                async for tick in self.client.stream_ticks(currency_pairs, poll_interval):
+                    bar = int(tick.timestamp.timestamp()) // bar_seconds
+                    previous = last_bars.get(tick.currency_pair)
+                    last_bars[tick.currency_pair] = bar
+                    if previous is not None and bar != previous:
+                        logger.debug(f"{tick.currency_pair.value}: 足が確定しました")
+                        self._bar_close_event.set()
+                    elif self._tick_requires_cycle(tick, move_pips):
+                        self._bar_close_event.set()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"ティック配信でエラー: {e}")
+            
+            # 配信が途切れた場合は少し待ってから再購読
+            await asyncio.sleep(5)
+    
+    def _tick_requires_cycle(self, tick: Tick, move_pips: Decimal) -> bool:
+        """
+        ティックが保有ポジションの損切り・利確ラインに達したか、
+        前回のサイクルからmove_pips以上動いたかを判定
+        
+        同じ理由で毎ティック起こさないよう、判定に使った基準は次のサイクルまで外します。
+        """
+        currency_pair = tick.currency_pair
+        for pos in self._watched_positions:
+            if pos.currency_pair == currency_pair:
+                price = tick.bid if pos.side == OrderSide.BUY else tick.ask
+                should_close, reason = self.risk_manager.should_close_position(pos, price)
+                if should_close:
+                    logger.debug(f"{currency_pair.value}: {pos.position_id} が{reason}")
+                    self._watched_positions = [
+                        p for p in self._watched_positions if p is not pos
+                    ]
+                    return True
+        
+        reference = self._cycle_prices.get(currency_pair)
+        if move_pips > 0 and reference is not None:
+            if abs(tick.bid - reference) >= move_pips * currency_pair.pip_decimal:
+                logger.debug(f"{currency_pair.value}: 前回のサイクルから{move_pips}pips以上変動")
+                del self._cycle_prices[currency_pair]
+                return True
+        
+        return False
     
     async def _execute_trading_cycle(self) -> None:
         """1回のトレードサイクルを実行"""
-        # 口座情報を取得
-        account = await self.client.get_account_info()
-        logger.debug(f"口座残高: ¥{account.balance:,.0f}")
+        # サイクル内の取引は同じ時刻（UTC）で記録する。所要時間の計測には単調時計を使う
+        cycle_now = datetime.now(timezone.utc)
+        started = time.monotonic()
         
-        # 現在のポジションを取得
-        positions = await self.client.get_positions()
+        # 口座情報と現在のポジションを並行して取得（互いに独立したリクエスト）
+        account, positions = await asyncio.gather(
+            self.client.get_account_info(),
+            self.client.get_positions()
+        )
+        logger.debug(f"口座残高: ¥{account.balance:,.0f}")
+        self._watched_positions = positions
         
         # リスク評価
         risk_assessment = self.risk_manager.assess_risk(account, positions)
@@ -184,37 +308,77 @@ class TradingBot:
             logger.warning(f"取引停止: {risk_assessment.reason}")
             return
         
-        # 各通貨ペアをチェック
-        for currency_pair in self.config.strategy.currency_pairs:
-            await self._check_currency_pair(currency_pair, account, positions)
+        # 各通貨ペアを並行してチェック（HTTP待ちを重ねる）
+        currency_pairs = self.config.strategy.currency_pairs
+        results = await asyncio.gather(
+            *(
+                self._check_currency_pair_limited(cp, account, positions, cycle_now)
+                for cp in currency_pairs
+            ),
+            return_exceptions=True
+        )
+        
+        # 1つの通貨ペアの失敗でサイクル全体を中断しない
+        for currency_pair, result in zip(currency_pairs, results):
+            if isinstance(result, Exception):
+                logger.error(f"{currency_pair.value}: チェック中にエラー: {result}", exc_info=result)
+        
+        logger.debug(f"トレードサイクル完了 ({time.monotonic() - started:.3f}秒)")
+    
+    async def _check_currency_pair_limited(
+        self,
+        currency_pair: CurrencyPair,
+        account,
+        positions,
+        cycle_now: datetime
+    ) -> None:
+        """同時リクエスト数を制限して通貨ペアをチェック（ブローカーのレート制限対策）"""
+        async with self._request_semaphore:
+            await self._check_currency_pair(currency_pair, account, positions, cycle_now)
     
     async def _check_currency_pair(
         self,
         currency_pair: CurrencyPair,
         account,
-        positions
+        positions,
+        cycle_now: datetime
     ) -> None:
-        """通貨ペアをチェックしてシグナルを処理"""
+        """通貨ペアをチェックしてシグナルを処理（cycle_nowはサイクル開始時刻）"""
         # ティックデータを取得
         tick = await self.client.get_tick(currency_pair)
+        self._cycle_prices[currency_pair] = tick.bid
         
         # ローソク足データを取得
-        ohlcv_data = await self.client.get_ohlcv(
+        ohlcv_data = await self._get_ohlcv_incremental(
             currency_pair,
-            self.config.strategy.primary_timeframe.value,
-            count=200
+            self.config.strategy.primary_timeframe.value
         )
         
         if not ohlcv_data:
             logger.warning(f"{currency_pair.value}: ローソク足データなし")
             return
         
-        # シグナルを生成
-        signal = self.strategy.generate_signal(currency_pair, ohlcv_data, tick)
-        
-        # シグナルを処理
-        if signal.is_buy_signal or signal.is_sell_signal:
-            await self._process_signal(signal, tick, account)
+        # 前回の評価時から最新バーが変わっていなければ、シグナルは同じなので再計算しない
+        last_bar = ohlcv_data[-1]
+        bar_key = (last_bar.timestamp, last_bar.close)
+        if self._last_evaluated_bar.get(currency_pair) == bar_key:
+            logger.debug(f"{currency_pair.value}: 新しいバーなし（シグナル評価をスキップ）")
+        else:
+            # シグナルを生成
+            signal = self.strategy.generate_signal(currency_pair, ohlcv_data, tick)
+            
+            # シグナルを処理（信頼度が低すぎる場合は発注処理に入らない）
+            handled = True
+            if signal.is_buy_signal or signal.is_sell_signal:
+                if signal.confidence >= self.config.strategy.min_confidence:
+                    handled = await self._process_signal(signal, tick, account, cycle_now)
+                else:
+                    logger.debug(f"{currency_pair.value}: 信頼度が低いためスキップ "
+                                 f"({signal.signal_type.value}, 信頼度: {signal.confidence:.2f})")
+            
+            # 評価・発注が正常に終わった場合のみ記録する（失敗したバーは次のサイクルで再評価）
+            if handled:
+                self._last_evaluated_bar[currency_pair] = bar_key
         
         # 既存ポジションの管理
         for pos in positions:
@@ -227,22 +391,99 @@ class TradingBot:
                     logger.info(f"ポジション決済: {pos.position_id} - {reason}")
                     await self.client.close_position(pos.position_id)
     
+    async def _subscribe_ohlcv(self) -> None:
+        """ローソク足のプッシュ配信を購読（未対応のブローカーはREST取得のまま）"""
+        timeframe = self.config.strategy.primary_timeframe.value
+        
+        for currency_pair in self.config.strategy.currency_pairs:
+            await self._subscribe_ohlcv_key((currency_pair, timeframe))
+    
+    async def _subscribe_ohlcv_key(self, key: Tuple[CurrencyPair, str]) -> None:
+        """1つの (通貨ペア, 時間足) のローソク足を購読"""
+        currency_pair, timeframe = key
+        try:
+            subscribed = await self.client.subscribe_ohlcv(
+                currency_pair, timeframe, partial(self._on_ohlcv, key),
+                on_end=partial(self._on_ohlcv_stream_end, key)
+            )
+        except Exception as e:
+            logger.warning(f"{currency_pair.value}: ローソク足の購読に失敗: {e}")
+            return
+        if subscribed:
+            self._lost_ohlcv_streams.discard(key)
+            self._streamed_ohlcv.add(key)
+    
+    def _on_ohlcv_stream_end(self, key: Tuple[CurrencyPair, str]) -> None:
+        """ローソク足の配信が終了したら、REST取得に戻して再購読の対象にする"""
+        # 停止処理中の切断は再購読しない
+        if self.is_running and key in self._streamed_ohlcv:
+            self._streamed_ohlcv.discard(key)
+            self._lost_ohlcv_streams.add(key)
+            logger.warning(f"{key[0].value}: ローソク足の配信が終了しました（REST取得に切り替えて再購読します）")
+    
+    def _on_ohlcv(self, key: Tuple[CurrencyPair, str], bar: OHLCV) -> None:
+        """プッシュ配信されたローソク足をキャッシュに反映"""
+        cache = self._ohlcv_cache.get(key)
+        # 初回のREST取得前に届いた足は、その取得結果に含まれるため捨ててよい
+        if cache is not None:
+            self._merge_bars(cache, [bar])
+    
+    @staticmethod
+    def _merge_bars(cache: Deque[OHLCV], bars: List[OHLCV]) -> None:
+        """キャッシュ末尾の足を、同時刻以降の新しい足で置き換えて追記"""
+        if not bars:
+            return
+        # 取得した足と重複するキャッシュ末尾（形成中だった足）を取り除く
+        while cache and cache[-1].timestamp >= bars[0].timestamp:
+            cache.pop()
+        cache.extend(bars)
+    
+    async def _get_ohlcv_incremental(
+        self,
+        currency_pair: CurrencyPair,
+        timeframe: str,
+        count: int = 200
+    ) -> List[OHLCV]:
+        """
+        キャッシュ済みのローソク足に差分だけを取得して追記する
+        
+        初回は count 本をまとめて取得し、以降はキャッシュ末尾の足以降のみを取得します。
+        末尾の足は形成中の可能性があるため、取得した足で置き換えます。
+        プッシュ配信を購読している場合は、初回以降の取得は行いません。
+        配信が途切れた場合は、差分を取得して追いついてから再購読します。
+        """
+        key = (currency_pair, timeframe)
+        cache = self._ohlcv_cache.get(key)
+        
+        if not cache:
+            ohlcv_data = await self.client.get_ohlcv(currency_pair, timeframe, count=count)
+            self._ohlcv_cache[key] = deque(ohlcv_data, maxlen=count)
+            return ohlcv_data
+        
+        # プッシュ配信で更新されているキャッシュはそのまま使う
+        if key not in self._streamed_ohlcv:
+            new_bars = await self.client.get_ohlcv(
+                currency_pair, timeframe, count=count, since=cache[-1].timestamp
+            )
+            self._merge_bars(cache, new_bars)
+            
+            if key in self._lost_ohlcv_streams:
+                await self._subscribe_ohlcv_key(key)
+        
+        return list(cache)
+    
     async def _process_signal(
         self,
-        signal: TradingSignal,
+        signal: "TradingSignal",
         tick: Tick,
-        account
-    ) -> None:
-        """シグナルを処理して注文を実行"""
+        account,
+        cycle_now: datetime
+    ) -> bool:
+        """シグナルを処理して注文を実行（取引はcycle_nowの時刻で記録、発注に失敗した場合はFalse）"""
         logger.info(f"シグナル検出: {signal.currency_pair.value} "
                    f"{signal.signal_type.value} (信頼度: {signal.confidence:.2f})")
         logger.info(f"  理由: {signal.reason}")
         
-        # 信頼度が低すぎる場合はスキップ
-        if signal.confidence < 0.5:
-            logger.debug("信頼度が低いためスキップ")
-            return
-        
         # エントリー価格を決定
         entry_price = signal.entry_price or (
             tick.ask if signal.is_buy_signal else tick.bid
@@ -289,7 +530,7 @@ class TradingBot:
             
             # 取引を記録
             self.risk_manager.record_trade(TradeRecord(
-                timestamp=datetime.now(),
+                timestamp=cycle_now,
                 currency_pair=signal.currency_pair,
                 side=signal.order_side,
                 entry_price=filled_order.filled_price,
@@ -300,11 +541,30 @@ class TradingBot:
             ))
         except Exception as e:
             logger.error(f"注文エラー: {e}")
+            return False
+        
+        return True
+
+
+def _install_signal_handlers(bot: TradingBot) -> None:
+    """SIGINT/SIGTERMでボットの停止を要求するハンドラーをイベントループに登録"""
+    loop = asyncio.get_running_loop()
+    
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, bot.request_stop)
+        except NotImplementedError:
+            # Windowsのイベントループはadd_signal_handler未対応のため、
+            # ループのスレッドに処理を引き渡す
+            signal.signal(sig, lambda signum, frame: loop.call_soon_threadsafe(bot.request_stop))
 
 
 async def run_demo_mode(args: argparse.Namespace) -> None:
     """デモモードで実行"""
+    from strategy import get_strategy
+    
     logger.info("デモモードで実行中...")
+    config = get_config()
     
     # 設定をデモモードに
     config.api.mode = TradingMode.DEMO
@@ -318,31 +578,33 @@ async def run_demo_mode(args: argparse.Namespace) -> None:
     bot = TradingBot(client, strategy, risk_manager, config)
     
     # シグナルハンドラー設定
-    def signal_handler(sig, frame):
-        logger.info("停止シグナルを受信...")
-        asyncio.create_task(bot.stop())
-    
-    signal.signal(signal.SIGINT, signal_handler)
-    signal.signal(signal.SIGTERM, signal_handler)
+    _install_signal_handlers(bot)
     
     await bot.start()
 
 
 async def run_backtest_mode(args: argparse.Namespace) -> None:
     """バックテストモードで実行"""
+    from backtester import (
+        BacktestConfig, BacktestEngine, generate_sample_data, load_ohlcv_cached
+    )
+    from strategy import get_strategy
+    
     logger.info("バックテストモードで実行中...")
+    config = get_config()
     
     # 戦略を取得
     strategy = get_strategy(args.strategy, config.strategy)
     
     # サンプルデータを生成（実際の運用では過去データを読み込む）
+    # 同じ条件での2回目以降はディスクキャッシュから読み込む（--no-cacheで再生成）
     logger.info("テストデータを生成中...")
-    data = generate_sample_data(
-        currency_pair=CurrencyPair.USDJPY,
+    data = load_ohlcv_cached(
+        generate_sample_data,
+        CurrencyPair.USDJPY,
+        use_cache=not args.no_cache,
         bars=args.bars or 2000,
-        timeframe_hours=1,
-        trend=0.00002,
-        volatility=0.0006
+        **SAMPLE_DATA_PARAMS
     )
     
     logger.info(f"データ期間: {data[0].timestamp.date()} 〜 {data[-1].timestamp.date()}")
@@ -364,19 +626,99 @@ async def run_backtest_mode(args: argparse.Namespace) -> None:
     
     # 取引詳細を表示（オプション）
     if args.verbose:
-        print("\n【取引詳細】")
-        for trade in result.trades[:20]:  # 最初の20件
-            print(f"  {trade.entry_time.strftime('%Y-%m-%d %H:%M')} "
-                  f"{trade.side.value} @ {trade.entry_price} → "
-                  f"{trade.exit_price} ({trade.pnl_pips:+.1f}pips) "
-                  f"[{trade.exit_reason}]")
+        # 行ごとにprintせず、まとめて1回で書き出す
+        lines = ["", "【取引詳細】"]
+        lines.extend(
+            f"  {trade.entry_time:%Y-%m-%d %H:%M} "
+            f"{trade.side.value} @ {trade.entry_price} → "
+            f"{trade.exit_price} ({trade.pnl_pips:+.1f}pips) "
+            f"[{trade.exit_reason}]"
+            for trade in result.trades[:20]  # 最初の20件
+        )
         
         if len(result.trades) > 20:
-            print(f"  ... 他 {len(result.trades) - 20} 件")
+            lines.append(f"  ... 他 {len(result.trades) - 20} 件")
+        
+        sys.stdout.write("\n".join(lines) + "\n")
+
+
+def run_sweep_mode(args: argparse.Namespace) -> None:
+    """
+    パラメータスイープ（複数条件のバックテスト）を複数プロセスで実行
+    
+    スイープファイル（JSON）は条件のリスト、または
+    {"defaults": {...}, "runs": [...]} の形式で記述します。
+    各条件のキー: strategy, params, currency_pair（例: "USDJPY"）, bars,
+    balance, spread_pips, slippage_pips（省略時はdefaults・コマンドライン引数の値）
+    """
+    from backtester import (
+        BacktestConfig, SweepCombo, generate_sample_data, load_ohlcv_cached, run_sweep
+    )
+    
+    logger.info(f"パラメータスイープを実行中: {args.sweep}")
+    config = get_config()
+    
+    with open(args.sweep, encoding="utf-8") as f:
+        spec = json.load(f)
+    
+    if isinstance(spec, list):
+        defaults, runs = {}, spec
+    else:
+        defaults, runs = spec.get("defaults", {}), spec["runs"]
+    
+    combos = []
+    for run in runs:
+        entry = {**defaults, **run}
+        combos.append(SweepCombo(
+            strategy=entry.get("strategy", args.strategy),
+            params=entry.get("params", {}),
+            currency_pair=CurrencyPair[entry.get("currency_pair", "USDJPY")],
+            bars=entry.get("bars", args.bars),
+            backtest_config=BacktestConfig(
+                initial_balance=Decimal(str(entry.get("balance", args.balance))),
+                spread_pips=entry.get("spread_pips", 0.3),
+                slippage_pips=entry.get("slippage_pips", 0.1)
+            )
+        ))
+    
+    # データは（通貨ペア, バー数）ごとに1回だけ読み込まれ、全条件で共有される
+    load_data = partial(
+        load_ohlcv_cached,
+        generate_sample_data,
+        use_cache=not args.no_cache,
+        **SAMPLE_DATA_PARAMS
+    )
+    outcomes = run_sweep(
+        combos, load_data, config.risk, config.strategy, max_workers=args.workers
+    )
+    
+    # シャープレシオの高い順に表示
+    succeeded = [(combo, result) for combo, result, error in outcomes if result is not None]
+    succeeded.sort(key=lambda item: item[1].sharpe_ratio, reverse=True)
+    
+    print("=" * 70)
+    print(f"パラメータスイープ結果: {len(succeeded)}/{len(outcomes)}条件")
+    print("=" * 70)
+    for combo, result in succeeded:
+        print(f"  {combo.strategy} {json.dumps(combo.params)} {combo.currency_pair.value} "
+              f"{combo.bars}本: 取引 {result.total_trades}件, "
+              f"リターン {result.total_return:+.2f}%, "
+              f"シャープ {result.sharpe_ratio:.2f}, "
+              f"最大DD {result.max_drawdown:.2f}%, "
+              f"勝率 {result.win_rate:.1f}%")
+    
+    failed = [(combo, error) for combo, result, error in outcomes if error is not None]
+    if failed:
+        print("\n【エラー】")
+        for combo, error in failed:
+            print(f"  {combo.strategy} {json.dumps(combo.params)}: {error}")
+    print("=" * 70)
 
 
 async def run_live_mode(args: argparse.Namespace) -> None:
     """ライブトレードモードで実行"""
+    from strategy import get_strategy
+    
     logger.warning("=" * 50)
     logger.warning("⚠️  ライブトレードモード")
     logger.warning("⚠️  実際のお金でトレードします")
@@ -390,6 +732,7 @@ async def run_live_mode(args: argparse.Namespace) -> None:
             return
     
     # 認証情報チェック
+    config = get_config()
     if not config.api.user_id or not config.api.password:
         logger.error("認証情報が設定されていません。.envファイルを確認してください。")
         return
@@ -405,12 +748,7 @@ async def run_live_mode(args: argparse.Namespace) -> None:
     bot = TradingBot(client, strategy, risk_manager, config)
     
     # シグナルハンドラー設定
-    def signal_handler(sig, frame):
-        logger.info("停止シグナルを受信...")
-        asyncio.create_task(bot.stop())
-    
-    signal.signal(signal.SIGINT, signal_handler)
-    signal.signal(signal.SIGTERM, signal_handler)
+    _install_signal_handlers(bot)
     
     await bot.start()
 
@@ -419,15 +757,7 @@ def show_strategies() -> None:
     """利用可能な戦略を表示"""
     print("\n利用可能な戦略:")
     print("-" * 40)
-    strategies = {
-        "ma_cross": "移動平均線クロス戦略",
-        "rsi_reversal": "RSI平均回帰戦略",
-        "bollinger": "ボリンジャーバンド戦略",
-        "macd": "MACD戦略",
-        "trend_following": "トレンドフォロー戦略",
-        "combined": "複合戦略（推奨）",
-    }
-    for name, description in strategies.items():
+    for name, description in STRATEGY_DESCRIPTIONS.items():
         print(f"  {name:20} - {description}")
     print()
 
@@ -446,6 +776,14 @@ def show_brokers() -> None:
     print()
 
 
+def _run(coro) -> None:
+    """コルーチンを実行（uvloopがインストールされていればそのイベントループを使用）"""
+    if UVLOOP_AVAILABLE:
+        uvloop.run(coro)
+    else:
+        asyncio.run(coro)
+
+
 def main():
     """メインエントリーポイント"""
     parser = argparse.ArgumentParser(
@@ -459,6 +797,9 @@ def main():
   # バックテストを実行
   python main.py --mode backtest --strategy ma_cross --bars 3000
   
+  # 複数条件のバックテストを並列実行（パラメータスイープ）
+  python main.py --sweep sweep.json --workers 8
+  
   # Saxo Bankでライブトレード
   python main.py --mode live --broker saxo
   
@@ -484,6 +825,7 @@ def main():
     
     parser.add_argument(
         "--strategy", "-s",
+        choices=list(STRATEGY_DESCRIPTIONS),
         default="combined",
         help="使用する戦略 (default: combined)"
     )
@@ -507,6 +849,27 @@ def main():
         help="バックテストのバー数 (default: 2000)"
     )
     
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="バックテストデータのディスクキャッシュを使わない"
+    )
+    
+    parser.add_argument(
+        "--sweep",
+        type=Path,
+        default=None,
+        metavar="FILE",
+        help="スイープファイル（JSON）の条件でバックテストを並列実行"
+    )
+    
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="スイープの並列プロセス数 (default: CPU数)"
+    )
+    
     parser.add_argument(
         "--balance",
         type=int,
@@ -546,6 +909,7 @@ def main():
         return
     
     # ブローカー設定を上書き
+    config = get_config()
     if args.broker:
         config.api.broker = Broker(args.broker)
     
@@ -557,13 +921,18 @@ def main():
     if args.verbose:
         config.display()
     
+    # パラメータスイープ（--modeより優先）
+    if args.sweep:
+        run_sweep_mode(args)
+        return
+    
     # モードに応じて実行
     if args.mode == "demo":
-        asyncio.run(run_demo_mode(args))
+        _run(run_demo_mode(args))
     elif args.mode == "backtest":
-        asyncio.run(run_backtest_mode(args))
+        _run(run_backtest_mode(args))
     elif args.mode == "live":
-        asyncio.run(run_live_mode(args))
+        _run(run_live_mode(args))
 
 
 if __name__ == "__main__":
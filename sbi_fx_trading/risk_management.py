@@ -15,14 +15,32 @@ from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from decimal import Decimal
 from enum import Enum
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple
 import logging
+import time
 
 from api_client import AccountInfo, CurrencyPair, Order, OrderSide, Position
 from config import RiskConfig
 
 logger = logging.getLogger(__name__)
 
+# 毎回の評価で使うDecimal定数（呼び出しごとに文字列から生成しない）
+_ZERO = Decimal("0")
+_MARGIN_LEVEL_WARNING = Decimal("200")  # 証拠金維持率の警告水準（%）
+_MARGIN_LEVEL_STOP = Decimal("150")  # 新規取引を止める証拠金維持率（%）
+
+
+@lru_cache(maxsize=256, typed=True)
+def _to_decimal(value: float) -> Decimal:
+    """
+    設定値などのfloatをDecimalに変換（表記どおりの値、結果はキャッシュ）
+    
+    Decimal(float)は2進数の誤差まで含んだ値になるため、文字列表記を経由します。
+    リスク率・リスクリワード比など同じ値が繰り返し渡されるため、変換結果を再利用します。
+    """
+    return Decimal(str(value))
+
 
 class RiskLevel(Enum):
     """リスクレベル"""
@@ -32,7 +50,7 @@ class RiskLevel(Enum):
     CRITICAL = "critical"
 
 
-@dataclass
+@dataclass(slots=True)
 class PositionSizeResult:
     """ポジションサイズ計算結果"""
     recommended_size: int  # 推奨ポジションサイズ（通貨単位）
@@ -53,7 +71,7 @@ class PositionSizeResult:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class RiskAssessment:
     """リスク評価結果"""
     level: RiskLevel
@@ -76,7 +94,7 @@ class RiskAssessment:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class TradeRecord:
     """取引記録"""
     timestamp: datetime
@@ -89,16 +107,48 @@ class TradeRecord:
     pnl_pips: Optional[float]
 
 
+@dataclass(slots=True)
+class _TradeStatistics:
+    """決済済み取引の累計（record_tradeで1件ずつ更新）"""
+    closed_count: int = 0
+    winning_count: int = 0
+    losing_count: int = 0
+    total_pnl: Decimal = Decimal("0")
+    total_profit: Decimal = Decimal("0")
+    total_loss: Decimal = Decimal("0")  # 損失の合計（正の値）
+    max_win: Decimal = Decimal("0")
+    max_loss: Decimal = Decimal("0")  # 最大損失（負の値）
+    
+    def add(self, pnl: Decimal) -> None:
+        """決済済み取引の損益を1件加算"""
+        self.closed_count += 1
+        self.total_pnl += pnl
+        if pnl > 0:
+            self.winning_count += 1
+            self.total_profit += pnl
+            if pnl > self.max_win:
+                self.max_win = pnl
+        elif pnl < 0:
+            self.losing_count += 1
+            self.total_loss -= pnl
+            if pnl < self.max_loss:
+                self.max_loss = pnl
+
+
 class RiskManager:
     """リスク管理クラス"""
     
     def __init__(self, config: RiskConfig):
         self.config = config
+        # 取引記録（追加はrecord_tradeから行う。統計は追加時に_statsへ集計）
         self.trade_history: List[TradeRecord] = []
+        self._stats = _TradeStatistics()
         self.daily_trades: int = 0
-        self.daily_loss: Decimal = Decimal("0")
-        self.peak_balance: Decimal = Decimal("0")
+        self.daily_loss: Decimal = _ZERO
+        self.peak_balance: Decimal = _ZERO
         self.last_reset_date: datetime = datetime.now().date()
+        # 前回日付を確認した時刻（time.monotonic）。1秒以内の再確認は省略する
+        self._last_reset_check: float = 0.0
     
     def calculate_position_size(
         self,
@@ -123,26 +173,27 @@ class RiskManager:
         Returns:
             PositionSizeResult
         """
-        # 損切り幅を計算（pips）
-        pip_value = Decimal("0.01") if "JPY" in currency_pair.value else Decimal("0.0001")
-        stop_loss_pips = abs(float(entry_price - stop_loss_price) / float(pip_value))
+        # 損切り幅を計算（値幅はDecimalのまま保持し、pipsは表示・リスクリワード比用）
+        pip_value = currency_pair.pip_decimal
+        stop_distance = abs(entry_price - stop_loss_price)
+        stop_loss_pips = float(stop_distance / pip_value)
         
         # リスク金額を計算
-        risk_amount = account_info.balance * Decimal(str(self.config.risk_per_trade))
+        risk_amount = account_info.balance * _to_decimal(self.config.risk_per_trade)
         
         # ポジションサイズを計算
-        # リスク金額 = ポジションサイズ × 損切り幅 × pip価値
-        # JPY通貨ペアの場合、1pip = 0.01円 × ポジションサイズ
-        if "JPY" in currency_pair.value:
-            # 例: USD/JPY 10,000通貨で1pip動くと100円の損益
-            pip_value_per_lot = Decimal("0.01") * 1000  # 1000通貨あたりの1pip = 10円
+        # リスク金額 = ポジションサイズ × 1通貨あたりの損切り額
+        # （損切り幅(pips) × pip値 = 損切り値幅なので、floatのpipsを経由せず値幅から直接求める）
+        if currency_pair.is_jpy:
+            # 例: USD/JPY 10,000通貨で0.30円（30pips）動くと3,000円の損益
+            loss_per_unit = stop_distance
         else:
             # 非JPYペアの場合（例: EUR/USD）
-            pip_value_per_lot = Decimal("0.0001") * 1000 * entry_price
+            loss_per_unit = stop_distance * entry_price
         
         # 推奨ポジションサイズ
-        if stop_loss_pips > 0:
-            position_size = int(risk_amount / (Decimal(str(stop_loss_pips)) * pip_value_per_lot / 1000))
+        if stop_distance > 0:
+            position_size = int(risk_amount / loss_per_unit)
             position_size = (position_size // 1000) * 1000  # 1000通貨単位に丸める
         else:
             position_size = self.config.default_lot_size
@@ -198,7 +249,7 @@ class RiskManager:
         self._check_daily_reset()
         
         # ドローダウン計算
-        if self.peak_balance == Decimal("0"):
+        if self.peak_balance == _ZERO:
             self.peak_balance = account_info.balance
         elif account_info.balance > self.peak_balance:
             self.peak_balance = account_info.balance
@@ -208,13 +259,15 @@ class RiskManager:
         ) if self.peak_balance > 0 else 0
         
         # オープンポジションのリスク計算
-        open_position_risk = Decimal("0")
-        for position in positions:
-            if position.stop_loss:
-                pip_value = Decimal("0.01") if "JPY" in position.currency_pair.value else Decimal("0.0001")
-                sl_pips = abs(position.entry_price - position.stop_loss) / pip_value
-                risk = sl_pips * position.quantity * pip_value
-                open_position_risk += risk
+        # 損切り幅(pips) × 数量 × pip値 = 損切りまでの値幅 × 数量（pip値は約分される）
+        open_position_risk = sum(
+            (
+                abs(position.entry_price - position.stop_loss) * position.quantity
+                for position in positions
+                if position.stop_loss
+            ),
+            _ZERO
+        )
         
         # リスクレベル判定
         if current_drawdown >= self.config.max_drawdown_percent:
@@ -243,10 +296,10 @@ class RiskManager:
             warnings.append(reason)
         
         # 証拠金維持率チェック
-        if account_info.margin_level and account_info.margin_level < Decimal("200"):
+        if account_info.margin_level and account_info.margin_level < _MARGIN_LEVEL_WARNING:
             level = RiskLevel.CRITICAL
             warnings.append(f"証拠金維持率低下: {account_info.margin_level:.0f}%")
-            if account_info.margin_level < Decimal("150"):
+            if account_info.margin_level < _MARGIN_LEVEL_STOP:
                 can_trade = False
                 reason = "証拠金維持率が危険水準"
         
@@ -286,8 +339,8 @@ class RiskManager:
             stop_distance = Decimal(str(atr * 2))
         else:
             # 固定pipsの損切り
-            pip_value = Decimal("0.01") if "JPY" in currency_pair.value else Decimal("0.0001")
-            stop_distance = pip_value * Decimal(str(self.config.default_stop_loss_pips))
+            pip_value = currency_pair.pip_decimal
+            stop_distance = pip_value * _to_decimal(self.config.default_stop_loss_pips)
         
         if side == OrderSide.BUY:
             return entry_price - stop_distance
@@ -316,7 +369,7 @@ class RiskManager:
             利確価格
         """
         stop_distance = abs(entry_price - stop_loss)
-        profit_distance = stop_distance * Decimal(str(risk_reward_ratio))
+        profit_distance = stop_distance * _to_decimal(risk_reward_ratio)
         
         if side == OrderSide.BUY:
             return entry_price + profit_distance
@@ -338,23 +391,17 @@ class RiskManager:
         Returns:
             (決済すべきか, 理由)
         """
+        # 売買方向を符号にまとめ、買い・売りを同じ比較で判定する
+        # （買い: 価格 <= 損切り / 価格 >= 利確、売り: 不等号が逆）
+        sign = 1 if position.side == OrderSide.BUY else -1
+        
         # 損切りチェック
-        if position.stop_loss:
-            if position.side == OrderSide.BUY:
-                if current_tick_price <= position.stop_loss:
-                    return True, "損切りライン到達"
-            else:
-                if current_tick_price >= position.stop_loss:
-                    return True, "損切りライン到達"
+        if position.stop_loss and sign * (position.stop_loss - current_tick_price) >= 0:
+            return True, "損切りライン到達"
         
         # 利確チェック
-        if position.take_profit:
-            if position.side == OrderSide.BUY:
-                if current_tick_price >= position.take_profit:
-                    return True, "利確ライン到達"
-            else:
-                if current_tick_price <= position.take_profit:
-                    return True, "利確ライン到達"
+        if position.take_profit and sign * (current_tick_price - position.take_profit) >= 0:
+            return True, "利確ライン到達"
         
         return False, ""
     
@@ -375,8 +422,8 @@ class RiskManager:
         Returns:
             新しい損切り価格（更新不要の場合はNone）
         """
-        pip_value = Decimal("0.01") if "JPY" in position.currency_pair.value else Decimal("0.0001")
-        trailing_distance = pip_value * Decimal(str(trailing_distance_pips))
+        pip_value = position.currency_pair.pip_decimal
+        trailing_distance = pip_value * _to_decimal(trailing_distance_pips)
         
         if position.side == OrderSide.BUY:
             # 買いポジション: 価格上昇に合わせて損切りを引き上げ
@@ -396,6 +443,9 @@ class RiskManager:
         self.trade_history.append(record)
         self.daily_trades += 1
         
+        if record.pnl is not None:
+            self._stats.add(record.pnl)
+        
         if record.pnl:
             if record.pnl < 0:
                 self.daily_loss += abs(record.pnl)
@@ -405,31 +455,23 @@ class RiskManager:
     
     def _check_daily_reset(self) -> None:
         """日次リセットチェック"""
+        now = time.monotonic()
+        if now - self._last_reset_check < 1.0:
+            return
+        self._last_reset_check = now
+        
         today = datetime.now().date()
         if today > self.last_reset_date:
             self.daily_trades = 0
-            self.daily_loss = Decimal("0")
+            self.daily_loss = _ZERO
             self.last_reset_date = today
             logger.info("日次カウンターをリセットしました")
     
     def get_statistics(self) -> Dict:
-        """取引統計を取得"""
-        if not self.trade_history:
-            return {
-                "total_trades": 0,
-                "winning_trades": 0,
-                "losing_trades": 0,
-                "win_rate": 0.0,
-                "total_pnl": 0.0,
-                "average_pnl": 0.0,
-                "max_win": 0.0,
-                "max_loss": 0.0,
-                "profit_factor": 0.0
-            }
-        
-        closed_trades = [t for t in self.trade_history if t.pnl is not None]
+        """取引統計を取得（record_tradeで集計済みの累計から作成）"""
+        stats = self._stats
         
-        if not closed_trades:
+        if not stats.closed_count:
             return {
                 "total_trades": len(self.trade_history),
                 "winning_trades": 0,
@@ -442,22 +484,19 @@ class RiskManager:
                 "profit_factor": 0.0
             }
         
-        winning_trades = [t for t in closed_trades if t.pnl > 0]
-        losing_trades = [t for t in closed_trades if t.pnl < 0]
-        
-        total_profit = sum(t.pnl for t in winning_trades)
-        total_loss = abs(sum(t.pnl for t in losing_trades))
-        
         return {
-            "total_trades": len(closed_trades),
-            "winning_trades": len(winning_trades),
-            "losing_trades": len(losing_trades),
-            "win_rate": len(winning_trades) / len(closed_trades) * 100 if closed_trades else 0,
-            "total_pnl": float(sum(t.pnl for t in closed_trades)),
-            "average_pnl": float(sum(t.pnl for t in closed_trades) / len(closed_trades)),
-            "max_win": float(max((t.pnl for t in winning_trades), default=Decimal("0"))),
-            "max_loss": float(min((t.pnl for t in losing_trades), default=Decimal("0"))),
-            "profit_factor": float(total_profit / total_loss) if total_loss > 0 else float("inf")
+            "total_trades": stats.closed_count,
+            "winning_trades": stats.winning_count,
+            "losing_trades": stats.losing_count,
+            "win_rate": stats.winning_count / stats.closed_count * 100,
+            "total_pnl": float(stats.total_pnl),
+            "average_pnl": float(stats.total_pnl / stats.closed_count),
+            "max_win": float(stats.max_win),
+            "max_loss": float(stats.max_loss),
+            "profit_factor": (
+                float(stats.total_profit / stats.total_loss)
+                if stats.total_loss > 0 else float("inf")
+            )
         }
 
 
@@ -470,13 +509,16 @@ class PartialCloseManager:
             close_levels: [(利益pips, 決済割合), ...]
                 例: [(30, 0.5), (50, 0.3), (80, 0.2)]
                     30pips で50%、50pipsで30%、80pipsで20%決済
+                利益pipsの昇順に並べ替えて保持します。
         """
-        self.close_levels = close_levels or [
+        # 利益pipsの昇順（未達のレベルに当たった時点で以降の確認を打ち切れる）
+        self.close_levels = sorted(close_levels or [
             (30.0, 0.5),  # 30pipsで50%決済
             (60.0, 0.3),  # 60pipsで30%決済
             (100.0, 0.2)  # 100pipsで残り20%決済
-        ]
-        self.executed_levels: Dict[str, List[int]] = {}
+        ], key=lambda level: level[0])
+        # ポジションID → 実行済みレベルのビットマスク（i番目のビット = close_levels[i]）
+        self.executed_levels: Dict[str, int] = {}
     
     def check_partial_close(
         self,
@@ -493,7 +535,7 @@ class PartialCloseManager:
         Returns:
             (決済数量, 理由) または None
         """
-        pip_value = Decimal("0.01") if "JPY" in position.currency_pair.value else Decimal("0.0001")
+        pip_value = position.currency_pair.pip_decimal
         
         if position.side == OrderSide.BUY:
             profit_pips = float((current_price - position.entry_price) / pip_value)
@@ -504,23 +546,25 @@ class PartialCloseManager:
             return None
         
         # 実行済みレベルを取得
-        if position.position_id not in self.executed_levels:
-            self.executed_levels[position.position_id] = []
+        executed = self.executed_levels.get(position.position_id, 0)
         
         for level_idx, (target_pips, close_ratio) in enumerate(self.close_levels):
-            if level_idx in self.executed_levels[position.position_id]:
+            if executed >> level_idx & 1:
                 continue
             
-            if profit_pips >= target_pips:
-                close_quantity = int(position.quantity * close_ratio)
-                close_quantity = (close_quantity // 1000) * 1000  # 1000通貨単位に丸める
-                
-                if close_quantity > 0:
-                    self.executed_levels[position.position_id].append(level_idx)
-                    return (
-                        close_quantity,
-                        f"部分決済: {target_pips}pips到達で{close_ratio*100:.0f}%決済"
-                    )
+            # 以降のレベルはさらに利益pipsが大きいため、未達なら確認不要
+            if profit_pips < target_pips:
+                break
+            
+            close_quantity = int(position.quantity * close_ratio)
+            close_quantity = (close_quantity // 1000) * 1000  # 1000通貨単位に丸める
+            
+            if close_quantity > 0:
+                self.executed_levels[position.position_id] = executed | 1 << level_idx
+                return (
+                    close_quantity,
+                    f"部分決済: {target_pips}pips到達で{close_ratio*100:.0f}%決済"
+                )
         
         return None
 
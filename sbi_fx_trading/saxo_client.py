@@ -27,6 +27,7 @@ import base64
 import hashlib
 import json
 import logging
+import os
 import secrets
 import time
 import webbrowser
@@ -34,19 +35,26 @@ from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from decimal import Decimal
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional, Tuple
+from functools import partial
+from pathlib import Path
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple
 from urllib.parse import urlencode, urlparse, parse_qs
 
 import aiohttp
-import requests
 
 from api_client import (
     AccountInfo, CurrencyPair, FXBrokerClient, OHLCV, Order,
-    OrderSide, OrderStatus, OrderType, Position, Tick
+    OrderSide, OrderStatus, OrderType, Position, Tick, json_loads
 )
 
 logger = logging.getLogger(__name__)
 
+# OAuthトークンの保存先（app_keyのハッシュごとに1ファイル）
+SAXO_TOKEN_CACHE_DIR = Path("./.cache/saxo_tokens")
+
+# 期限切れ判定に持たせる余裕
+_TOKEN_EXPIRY_BUFFER = timedelta(seconds=60)
+
 
 class SaxoEnvironment(Enum):
     """Saxo API環境"""
@@ -100,18 +108,23 @@ class OAuthToken:
     refresh_token: str
     refresh_token_expires_in: int
     created_at: datetime = field(default_factory=datetime.now)
+    # 有効期限（APIコールごとの期限チェックで再計算しないよう生成時に確定）
+    expires_at: datetime = field(init=False, repr=False)
+    refresh_expires_at: datetime = field(init=False, repr=False)
+    
+    def __post_init__(self):
+        self.expires_at = self.created_at + timedelta(seconds=self.expires_in)
+        self.refresh_expires_at = self.created_at + timedelta(seconds=self.refresh_token_expires_in)
     
     @property
     def is_expired(self) -> bool:
-        """アクセストークンが期限切れかどうか"""
-        expiry = self.created_at + timedelta(seconds=self.expires_in - 60)  # 60秒のバッファ
-        return datetime.now() >= expiry
+        """アクセストークンが期限切れかどうか（60秒のバッファ）"""
+        return datetime.now() + _TOKEN_EXPIRY_BUFFER >= self.expires_at
     
     @property
     def refresh_token_expired(self) -> bool:
         """リフレッシュトークンが期限切れかどうか"""
-        expiry = self.created_at + timedelta(seconds=self.refresh_token_expires_in - 60)
-        return datetime.now() >= expiry
+        return datetime.now() + _TOKEN_EXPIRY_BUFFER >= self.refresh_expires_at
     
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -160,17 +173,65 @@ SAXO_TIMEFRAME_MAP = {
 }
 
 
+def _create_session() -> aiohttp.ClientSession:
+    """ヘルパー用のHTTPセッションを作成（接続プールとキープアライブを使い回す）"""
+    return aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(
+            limit=64,
+            limit_per_host=32,
+            keepalive_timeout=75,
+            enable_cleanup_closed=True
+        )
+    )
+
+
+def _candle_to_ohlcv(currency_pair: CurrencyPair, candle: Dict[str, Any]) -> OHLCV:
+    """チャートAPIのローソク足（REST・ストリーミング共通の形式）をOHLCVに変換"""
+    return OHLCV(
+        currency_pair=currency_pair,
+        timestamp=datetime.fromisoformat(candle["Time"].replace("Z", "+00:00")),
+        open=Decimal(str(candle["Open"])),
+        high=Decimal(str(candle["High"])),
+        low=Decimal(str(candle["Low"])),
+        close=Decimal(str(candle["Close"])),
+        volume=candle.get("Volume", 0)
+    )
+
+
 class SaxoOAuthHandler:
     """
     Saxo Bank OAuth 2.0 認証ハンドラー
     
     Authorization Code Flow with PKCE を実装しています。
+    HTTPセッションは初回のトークン要求時に作成し、aclose()まで使い回します。
     """
     
-    def __init__(self, config: SaxoConfig):
+    def __init__(self, config: SaxoConfig, session: Optional[aiohttp.ClientSession] = None):
         self.config = config
         self._state: Optional[str] = None
         self._code_verifier: Optional[str] = None
+        # 外部から渡されたセッションは呼び出し側が閉じる
+        self._session = session
+        self._owns_session = session is None
+    
+    async def __aenter__(self) -> "SaxoOAuthHandler":
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.aclose()
+    
+    def _get_session(self) -> aiohttp.ClientSession:
+        """HTTPセッションを取得（未作成なら作成）"""
+        if self._session is None or self._session.closed:
+            self._session = _create_session()
+            self._owns_session = True
+        return self._session
+    
+    async def aclose(self) -> None:
+        """自前で作成したHTTPセッションを閉じる"""
+        if self._owns_session and self._session:
+            await self._session.close()
+        self._session = None
     
     def generate_auth_url(self) -> str:
         """認証URLを生成"""
@@ -208,20 +269,19 @@ class SaxoOAuthHandler:
             "code_verifier": self._code_verifier,
         }
         
-        async with aiohttp.ClientSession() as session:
-            async with session.post(token_url, data=data) as response:
-                if response.status != 200:
-                    error_text = await response.text()
-                    raise Exception(f"Token exchange failed: {response.status} - {error_text}")
-                
-                token_data = await response.json()
-                return OAuthToken(
-                    access_token=token_data["access_token"],
-                    token_type=token_data["token_type"],
-                    expires_in=token_data["expires_in"],
-                    refresh_token=token_data["refresh_token"],
-                    refresh_token_expires_in=token_data.get("refresh_token_expires_in", 86400)
-                )
+        async with self._get_session().post(token_url, data=data) as response:
+            if response.status != 200:
+                error_text = await response.text()
+                raise Exception(f"Token exchange failed: {response.status} - {error_text}")
+            
+            token_data = await response.json(loads=json_loads)
+            return OAuthToken(
+                access_token=token_data["access_token"],
+                token_type=token_data["token_type"],
+                expires_in=token_data["expires_in"],
+                refresh_token=token_data["refresh_token"],
+                refresh_token_expires_in=token_data.get("refresh_token_expires_in", 86400)
+            )
     
     async def refresh_access_token(self, refresh_token: str) -> OAuthToken:
         """リフレッシュトークンを使用してアクセストークンを更新"""
@@ -234,20 +294,22 @@ class SaxoOAuthHandler:
             "client_secret": self.config.app_secret,
         }
         
-        async with aiohttp.ClientSession() as session:
-            async with session.post(token_url, data=data) as response:
-                if response.status != 200:
-                    error_text = await response.text()
-                    raise Exception(f"Token refresh failed: {response.status} - {error_text}")
-                
-                token_data = await response.json()
-                return OAuthToken(
-                    access_token=token_data["access_token"],
-                    token_type=token_data["token_type"],
-                    expires_in=token_data["expires_in"],
-                    refresh_token=token_data.get("refresh_token", refresh_token),
-                    refresh_token_expires_in=token_data.get("refresh_token_expires_in", 86400)
-                )
+        async with self._get_session().post(token_url, data=data) as response:
+            if response.status != 200:
+                error_text = await response.text()
+                if response.status in (400, 401):
+                    # リフレッシュトークンの失効・拒否（invalid_grant）は通信エラーと区別する
+                    raise PermissionError(f"Token refresh rejected: {response.status} - {error_text}")
+                raise Exception(f"Token refresh failed: {response.status} - {error_text}")
+            
+            token_data = await response.json(loads=json_loads)
+            return OAuthToken(
+                access_token=token_data["access_token"],
+                token_type=token_data["token_type"],
+                expires_in=token_data["expires_in"],
+                refresh_token=token_data.get("refresh_token", refresh_token),
+                refresh_token_expires_in=token_data.get("refresh_token_expires_in", 86400)
+            )
 
 
 class SaxoPriceStreaming:
@@ -255,31 +317,59 @@ class SaxoPriceStreaming:
     Saxo Bank WebSocket価格ストリーミング
     
     リアルタイムの価格データをWebSocket経由で受信します。
+    購読リクエストとWebSocket接続は同じHTTPセッション（接続プール）を使い回します。
     """
     
-    def __init__(self, config: SaxoConfig, token: OAuthToken):
+    def __init__(
+        self,
+        config: SaxoConfig,
+        token_getter: Callable[[], OAuthToken],
+        session: Optional[aiohttp.ClientSession] = None
+    ):
         self.config = config
-        self.token = token
+        # トークンは更新されるため、保持せずに毎回取得する
+        self._token_getter = token_getter
         self._ws: Optional[aiohttp.ClientWebSocketResponse] = None
-        self._session: Optional[aiohttp.ClientSession] = None
+        # 外部から渡されたセッションは呼び出し側が閉じる
+        self._session = session
+        self._owns_session = session is None
         self._subscriptions: Dict[int, CurrencyPair] = {}
         self._price_callbacks: List[Callable[[Tick], None]] = []
+        # ReferenceId → (通貨ペア, ローソク足コールバック)
+        self._chart_subscriptions: Dict[str, Tuple[CurrencyPair, Callable[[OHLCV], None]]] = {}
         self._running = False
         self._context_id: Optional[str] = None
         self._reference_id_counter = 0
     
+    @property
+    def token(self) -> OAuthToken:
+        """現在のアクセストークン"""
+        return self._token_getter()
+    
+    async def __aenter__(self) -> "SaxoPriceStreaming":
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.aclose()
+    
+    def _get_session(self) -> aiohttp.ClientSession:
+        """HTTPセッションを取得（未作成なら作成）"""
+        if self._session is None or self._session.closed:
+            self._session = _create_session()
+            self._owns_session = True
+        return self._session
+    
     async def connect(self) -> bool:
         """WebSocket接続を確立"""
         try:
             self._context_id = secrets.token_hex(8)
-            self._session = aiohttp.ClientSession()
             
             headers = {
                 "Authorization": f"Bearer {self.token.access_token}"
             }
             
             ws_url = f"{self.config.streaming_endpoint}/connect?contextId={self._context_id}"
-            self._ws = await self._session.ws_connect(ws_url, headers=headers)
+            self._ws = await self._get_session().ws_connect(ws_url, headers=headers)
             
             self._running = True
             logger.info("WebSocketストリーミングに接続しました")
@@ -297,12 +387,16 @@ class SaxoPriceStreaming:
             await self._ws.close()
             self._ws = None
         
-        if self._session:
-            await self._session.close()
-            self._session = None
-        
         logger.info("WebSocketストリーミングから切断しました")
     
+    async def aclose(self) -> None:
+        """WebSocketを切断し、自前で作成したHTTPセッションを閉じる"""
+        await self.disconnect()
+        
+        if self._owns_session and self._session:
+            await self._session.close()
+        self._session = None
+    
     async def subscribe_price(self, currency_pair: CurrencyPair) -> bool:
         """価格データを購読"""
         if currency_pair not in SAXO_CURRENCY_PAIR_UIC:
@@ -330,20 +424,19 @@ class SaxoPriceStreaming:
             "Content-Type": "application/json"
         }
         
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                subscription_url,
-                json=subscription_data,
-                headers=headers
-            ) as response:
-                if response.status in [200, 201]:
-                    self._subscriptions[uic] = currency_pair
-                    logger.info(f"価格購読開始: {currency_pair.value}")
-                    return True
-                else:
-                    error_text = await response.text()
-                    logger.error(f"価格購読エラー: {response.status} - {error_text}")
-                    return False
+        async with self._get_session().post(
+            subscription_url,
+            json=subscription_data,
+            headers=headers
+        ) as response:
+            if response.status in [200, 201]:
+                self._subscriptions[uic] = currency_pair
+                logger.info(f"価格購読開始: {currency_pair.value}")
+                return True
+            else:
+                error_text = await response.text()
+                logger.error(f"価格購読エラー: {response.status} - {error_text}")
+                return False
     
     async def unsubscribe_price(self, currency_pair: CurrencyPair) -> bool:
         """価格購読を解除"""
@@ -358,10 +451,61 @@ class SaxoPriceStreaming:
             return True
         return False
     
+    async def subscribe_chart(
+        self,
+        currency_pair: CurrencyPair,
+        horizon: int,
+        callback: Callable[[OHLCV], None]
+    ) -> bool:
+        """ローソク足を購読（更新・確定した足がcallbackに渡される）"""
+        if currency_pair not in SAXO_CURRENCY_PAIR_UIC:
+            logger.error(f"未対応の通貨ペア: {currency_pair}")
+            return False
+        
+        self._reference_id_counter += 1
+        reference_id = f"chart_{self._reference_id_counter}"
+        
+        subscription_url = f"{self.config.api_endpoint}/chart/v1/charts/subscriptions"
+        
+        subscription_data = {
+            "Arguments": {
+                "Uic": SAXO_CURRENCY_PAIR_UIC[currency_pair],
+                "AssetType": "FxSpot",
+                "Horizon": horizon,
+                "Count": 1
+            },
+            "ContextId": self._context_id,
+            "ReferenceId": reference_id
+        }
+        
+        headers = {
+            "Authorization": f"Bearer {self.token.access_token}",
+            "Content-Type": "application/json"
+        }
+        
+        async with self._get_session().post(
+            subscription_url,
+            json=subscription_data,
+            headers=headers
+        ) as response:
+            if response.status in [200, 201]:
+                self._chart_subscriptions[reference_id] = (currency_pair, callback)
+                logger.info(f"ローソク足購読開始: {currency_pair.value} ({horizon}分足)")
+                return True
+            else:
+                error_text = await response.text()
+                logger.error(f"ローソク足購読エラー: {response.status} - {error_text}")
+                return False
+    
     def add_price_callback(self, callback: Callable[[Tick], None]) -> None:
         """価格更新コールバックを追加"""
         self._price_callbacks.append(callback)
     
+    def remove_price_callback(self, callback: Callable[[Tick], None]) -> None:
+        """価格更新コールバックを削除"""
+        if callback in self._price_callbacks:
+            self._price_callbacks.remove(callback)
+    
     async def listen(self) -> None:
         """WebSocketメッセージをリッスン"""
         if not self._ws:
@@ -372,9 +516,11 @@ class SaxoPriceStreaming:
                 msg = await self._ws.receive(timeout=30)
                 
                 if msg.type == aiohttp.WSMsgType.TEXT:
-                    data = json.loads(msg.data)
+                    data = json_loads(msg.data)
                     await self._handle_message(data)
-                elif msg.type == aiohttp.WSMsgType.CLOSED:
+                elif msg.type in (
+                    aiohttp.WSMsgType.CLOSE, aiohttp.WSMsgType.CLOSING, aiohttp.WSMsgType.CLOSED
+                ):
                     logger.warning("WebSocket接続が閉じられました")
                     break
                 elif msg.type == aiohttp.WSMsgType.ERROR:
@@ -390,6 +536,16 @@ class SaxoPriceStreaming:
     
     async def _handle_message(self, data: Dict[str, Any]) -> None:
         """受信メッセージを処理"""
+        chart = self._chart_subscriptions.get(data.get("ReferenceId"))
+        if chart is not None:
+            currency_pair, callback = chart
+            for candle in data.get("Data", []):
+                try:
+                    callback(_candle_to_ohlcv(currency_pair, candle))
+                except Exception as e:
+                    logger.error(f"コールバックエラー: {e}")
+            return
+        
         if "Data" in data and isinstance(data["Data"], list):
             for item in data["Data"]:
                 if "Quote" in item:
@@ -422,13 +578,27 @@ class SaxoBankClient(FXBrokerClient):
     OAuth 2.0認証、REST API、WebSocketストリーミングに完全対応しています。
     """
     
-    def __init__(self, config: SaxoConfig, demo_mode: bool = True):
+    def __init__(
+        self,
+        config: SaxoConfig,
+        demo_mode: bool = True,
+        token_cache_dir: Optional[Path] = SAXO_TOKEN_CACHE_DIR
+    ):
         self.config = config
         self.demo_mode = demo_mode
         self._session: Optional[aiohttp.ClientSession] = None
         self._token: Optional[OAuthToken] = None
+        # 同時に期限切れを検知した呼び出しが重複して/tokenへPOSTしないようにする
+        self._token_lock = asyncio.Lock()
+        self._token_cache_path: Optional[Path] = None
+        if token_cache_dir is not None:
+            key = hashlib.sha256(config.app_key.encode()).hexdigest()
+            self._token_cache_path = token_cache_dir / f"{config.environment.value}_{key}.json"
         self._oauth_handler = SaxoOAuthHandler(config)
         self._price_streaming: Optional[SaxoPriceStreaming] = None
+        self._listen_task: Optional[asyncio.Task] = None
+        # ストリーミング終了時に呼び出すコールバック（購読は接続とともに失われるため1回限り）
+        self._stream_end_callbacks: List[Callable[[], None]] = []
         self._connected = False
         self._account_key: Optional[str] = None
         self._client_key: Optional[str] = None
@@ -449,6 +619,12 @@ class SaxoBankClient(FXBrokerClient):
             self._client_key = "DEMO-CLIENT"
             return True
         
+        # 前回保存したトークンがあれば再利用する
+        from_cache = False
+        if not self._token:
+            self._token = self._load_cached_token()
+            from_cache = self._token is not None
+        
         # OAuth認証フロー
         if not self._token:
             logger.info("OAuth認証が必要です")
@@ -479,6 +655,7 @@ class SaxoBankClient(FXBrokerClient):
             
             try:
                 self._token = await self._oauth_handler.exchange_code_for_token(auth_code)
+                self._save_token()
                 logger.info("OAuth認証成功！")
             except Exception as e:
                 logger.error(f"OAuth認証エラー: {e}")
@@ -495,18 +672,24 @@ class SaxoBankClient(FXBrokerClient):
                 self._token = await self._oauth_handler.refresh_access_token(
                     self._token.refresh_token
                 )
+                self._save_token()
                 logger.info("アクセストークンを更新しました")
             except Exception as e:
                 logger.error(f"トークン更新エラー: {e}")
+                # 拒否されたトークンを残すと再起動のたびに失敗するため、破棄して再認証する
+                # （通信エラー・5xxでは有効なリフレッシュトークンを消さないよう、そのまま失敗とする）
+                if from_cache and isinstance(e, PermissionError):
+                    self._discard_cached_token()
+                    return await self.connect()
                 return False
         
-        # HTTPセッションを作成
-        self._session = aiohttp.ClientSession(
-            headers={
-                "Authorization": f"Bearer {self._token.access_token}",
-                "Content-Type": "application/json"
-            }
-        )
+        # HTTPセッションを作成（接続プールを切断まで使い回し、毎回のTLSハンドシェイクを避ける）
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=32, keepalive_timeout=300),
+                headers={"Content-Type": "application/json"}
+            )
+        self._update_auth_header()
         
         # アカウント情報を取得
         try:
@@ -516,12 +699,16 @@ class SaxoBankClient(FXBrokerClient):
             return True
         except Exception as e:
             logger.error(f"アカウント情報取得エラー: {e}")
+            # 保存済みのトークンが拒否された場合も破棄して再認証する
+            if from_cache and isinstance(e, PermissionError):
+                self._discard_cached_token()
+                return await self.connect()
             return False
     
     async def disconnect(self) -> None:
         """API接続を切断"""
-        if self._price_streaming:
-            await self._price_streaming.disconnect()
+        await self.stop_price_streaming()
+        await self._oauth_handler.aclose()
         
         if self._session:
             await self._session.close()
@@ -540,9 +727,12 @@ class SaxoBankClient(FXBrokerClient):
         async with self._session.get(url) as response:
             if response.status != 200:
                 error_text = await response.text()
+                if response.status == 401:
+                    # 認証エラーは通信エラーと区別する（保存済みトークンの破棄に使用）
+                    raise PermissionError(f"アカウント情報取得エラー: {response.status} - {error_text}")
                 raise Exception(f"アカウント情報取得エラー: {response.status} - {error_text}")
             
-            data = await response.json()
+            data = await response.json(loads=json_loads)
             
             if "Data" in data and len(data["Data"]) > 0:
                 account = data["Data"][0]
@@ -554,27 +744,78 @@ class SaxoBankClient(FXBrokerClient):
         if self.demo_mode or not self._token:
             return
         
-        if self._token.is_expired:
+        if not self._token.is_expired:
+            return
+        
+        async with self._token_lock:
+            # ロック待ちの間に他のタスクが更新済みであれば何もしない
+            if not self._token.is_expired:
+                return
+            
             try:
                 self._token = await self._oauth_handler.refresh_access_token(
                     self._token.refresh_token
                 )
+                self._save_token()
                 
-                # セッションヘッダーを更新
+                # セッションは作り直さず、認証ヘッダーだけを差し替える
                 if self._session:
-                    await self._session.close()
-                    self._session = aiohttp.ClientSession(
-                        headers={
-                            "Authorization": f"Bearer {self._token.access_token}",
-                            "Content-Type": "application/json"
-                        }
-                    )
+                    self._update_auth_header()
                 
                 logger.info("アクセストークンを自動更新しました")
             except Exception as e:
                 logger.error(f"トークン自動更新エラー: {e}")
                 raise
     
+    def _load_cached_token(self) -> Optional[OAuthToken]:
+        """保存済みのトークンを読み込む（リフレッシュトークンが期限切れなら使わない）"""
+        path = self._token_cache_path
+        if path is None or not path.exists():
+            return None
+        
+        try:
+            token = OAuthToken.from_dict(json_loads(path.read_bytes()))
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f"保存済みトークンの読み込みに失敗しました: {e}")
+            return None
+        
+        if token.refresh_token_expired:
+            return None
+        
+        logger.info("保存済みのOAuthトークンを使用します")
+        return token
+    
+    def _discard_cached_token(self) -> None:
+        """使用できなくなったトークンと保存ファイルを破棄"""
+        logger.warning("保存済みのOAuthトークンを破棄して再認証します")
+        self._token = None
+        if self._token_cache_path is not None:
+            try:
+                self._token_cache_path.unlink(missing_ok=True)
+            except OSError as e:
+                logger.warning(f"保存済みトークンの削除に失敗しました: {e}")
+    
+    def _save_token(self) -> None:
+        """現在のトークンを保存（所有者のみ読み書き可能なファイルに書き込む）"""
+        path = self._token_cache_path
+        if path is None or self._token is None:
+            return
+        
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # 書きかけのファイルを読まないよう、一時ファイルから置き換える
+            tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(self._token.to_dict(), f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"トークンの保存に失敗しました: {e}")
+    
+    def _update_auth_header(self) -> None:
+        """セッションの既定ヘッダーに現在のアクセストークンを設定"""
+        self._session.headers["Authorization"] = f"Bearer {self._token.access_token}"
+    
     def _ensure_connected(self) -> None:
         """接続状態を確認"""
         if not self._connected:
@@ -606,7 +847,7 @@ class SaxoBankClient(FXBrokerClient):
                 logger.error(f"価格取得エラー: {response.status} - {error_text}")
                 return self._generate_mock_tick(currency_pair)
             
-            data = await response.json()
+            data = await response.json(loads=json_loads)
             quote = data.get("Quote", {})
             
             tick = Tick(
@@ -623,14 +864,18 @@ class SaxoBankClient(FXBrokerClient):
         self,
         currency_pair: CurrencyPair,
         timeframe: str,
-        count: int = 100
+        count: int = 100,
+        since: Optional[datetime] = None
     ) -> List[OHLCV]:
         """ローソク足データを取得"""
         self._ensure_connected()
         await self._ensure_token_valid()
         
         if self.demo_mode:
-            return self._generate_mock_ohlcv(currency_pair, count)
+            ohlcv_list = self._generate_mock_ohlcv(currency_pair, count)
+            if since is not None:
+                ohlcv_list = [ohlcv for ohlcv in ohlcv_list if ohlcv.timestamp >= since]
+            return ohlcv_list
         
         if currency_pair not in SAXO_CURRENCY_PAIR_UIC:
             raise ValueError(f"未対応の通貨ペア: {currency_pair}")
@@ -649,6 +894,10 @@ class SaxoBankClient(FXBrokerClient):
             "Horizon": horizon,
             "Count": count
         }
+        if since is not None:
+            # 差分取得: since以降の足のみ
+            params["Mode"] = "From"
+            params["Time"] = since.isoformat()
         
         async with self._session.get(url, params=params) as response:
             if response.status != 200:
@@ -656,22 +905,8 @@ class SaxoBankClient(FXBrokerClient):
                 logger.error(f"OHLCV取得エラー: {response.status} - {error_text}")
                 return self._generate_mock_ohlcv(currency_pair, count)
             
-            data = await response.json()
-            ohlcv_list = []
-            
-            for candle in data.get("Data", []):
-                ohlcv = OHLCV(
-                    currency_pair=currency_pair,
-                    timestamp=datetime.fromisoformat(candle["Time"].replace("Z", "+00:00")),
-                    open=Decimal(str(candle["Open"])),
-                    high=Decimal(str(candle["High"])),
-                    low=Decimal(str(candle["Low"])),
-                    close=Decimal(str(candle["Close"])),
-                    volume=candle.get("Volume", 0)
-                )
-                ohlcv_list.append(ohlcv)
-            
-            return ohlcv_list
+            data = await response.json(loads=json_loads)
+            return [_candle_to_ohlcv(currency_pair, candle) for candle in data.get("Data", [])]
     
     async def place_order(self, order: Order) -> Order:
         """
@@ -685,7 +920,8 @@ class SaxoBankClient(FXBrokerClient):
         self._ensure_connected()
         await self._ensure_token_valid()
         
-        logger.info(f"注文発注: {order.to_dict()}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("注文発注: %s", order.to_dict())
         
         if self.demo_mode:
             # デモモードでは即座に約定
@@ -749,7 +985,7 @@ class SaxoBankClient(FXBrokerClient):
                 order.status = OrderStatus.REJECTED
                 return order
             
-            data = await response.json()
+            data = await response.json(loads=json_loads)
             
             order.order_id = data.get("OrderId", "")
             order.status = OrderStatus.OPEN
@@ -778,7 +1014,7 @@ class SaxoBankClient(FXBrokerClient):
             if response.status != 200:
                 return None
             
-            data = await response.json()
+            data = await response.json(loads=json_loads)
             # 注文ステータスをパース（実装は省略）
             return None
     
@@ -827,7 +1063,7 @@ class SaxoBankClient(FXBrokerClient):
             if response.status != 200:
                 return []
             
-            data = await response.json()
+            data = await response.json(loads=json_loads)
             orders = []
             
             for order_data in data.get("Data", []):
@@ -852,7 +1088,7 @@ class SaxoBankClient(FXBrokerClient):
             if response.status != 200:
                 return []
             
-            data = await response.json()
+            data = await response.json(loads=json_loads)
             positions = []
             
             for pos_data in data.get("Data", []):
@@ -953,7 +1189,7 @@ class SaxoBankClient(FXBrokerClient):
                     unrealized_pnl=Decimal("0")
                 )
             
-            data = await response.json()
+            data = await response.json(loads=json_loads)
             
             return AccountInfo(
                 account_id=self._account_key or "",
@@ -979,22 +1215,132 @@ class SaxoBankClient(FXBrokerClient):
         if not self._token:
             raise ConnectionError("認証されていません")
         
-        self._price_streaming = SaxoPriceStreaming(self.config, self._token)
+        if not await self._ensure_price_streaming():
+            return
+        
+        self._price_streaming.add_price_callback(on_tick)
+        for currency_pair in currency_pairs:
+            await self._price_streaming.subscribe_price(currency_pair)
+    
+    async def _ensure_price_streaming(self) -> bool:
+        """
+        WebSocket接続を確立（接続済みなら再利用）し、バックグラウンドでリッスンする
+        
+        購読リクエストの前に呼び出されるため、ここでトークンの有効期限も確認します。
+        切断後に呼び出された場合は再接続します。
+        """
+        await self._ensure_token_valid()
+        
+        if self._price_streaming is not None:
+            return True
+        
+        # REST APIと同じセッションを渡し、購読リクエストで接続プールを共有する
+        streaming = SaxoPriceStreaming(self.config, lambda: self._token, session=self._session)
+        if not await streaming.connect():
+            return False
         
-        if await self._price_streaming.connect():
-            self._price_streaming.add_price_callback(on_tick)
+        self._price_streaming = streaming
+        # タスクの参照を保持する（保持しないと実行中にGCで回収される可能性がある）
+        self._listen_task = asyncio.create_task(self._run_price_listener(streaming))
+        return True
+    
+    async def _run_price_listener(self, streaming: SaxoPriceStreaming) -> None:
+        """WebSocketを受信し、終了したら購読者に通知する（再購読時に再接続される）"""
+        try:
+            await streaming.listen()
+        except Exception as e:
+            logger.error(f"価格ストリーミングの受信エラー: {e}")
+        finally:
+            disconnected = self._price_streaming is streaming
+            if disconnected:
+                self._price_streaming = None
+                self._listen_task = None
+                logger.warning("価格ストリーミングが切断されました")
             
-            for currency_pair in currency_pairs:
-                await self._price_streaming.subscribe_price(currency_pair)
+            callbacks, self._stream_end_callbacks = self._stream_end_callbacks, []
+            for callback in callbacks:
+                try:
+                    callback()
+                except Exception as e:
+                    logger.error(f"コールバックエラー: {e}")
             
-            # バックグラウンドでリッスン
-            asyncio.create_task(self._price_streaming.listen())
+            if disconnected:
+                await streaming.aclose()
     
     async def stop_price_streaming(self) -> None:
         """価格ストリーミングを停止"""
-        if self._price_streaming:
-            await self._price_streaming.disconnect()
-            self._price_streaming = None
+        streaming, self._price_streaming = self._price_streaming, None
+        task, self._listen_task = self._listen_task, None
+        
+        if task:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        
+        if streaming:
+            await streaming.aclose()
+    
+    async def stream_ticks(
+        self,
+        currency_pairs: List[CurrencyPair],
+        poll_interval: float = 60.0
+    ) -> AsyncIterator[Tick]:
+        """WebSocketストリーミングでティックを配信（デモモード・接続失敗時はポーリング）"""
+        if self.demo_mode or not self._token or not await self._ensure_price_streaming():
+            if not self.demo_mode:
+                logger.warning("ストリーミングを開始できないため、ポーリングで価格を取得します")
+            async for tick in super().stream_ticks(currency_pairs, poll_interval):
+                yield tick
+            return
+        
+        # Noneは配信終了の通知（切断時に呼び出し側へ例外として伝え、再購読させる）
+        queue: "asyncio.Queue[Optional[Tick]]" = asyncio.Queue()
+        on_end = partial(queue.put_nowait, None)
+        streaming = self._price_streaming
+        streaming.add_price_callback(queue.put_nowait)
+        self._stream_end_callbacks.append(on_end)
+        
+        try:
+            for currency_pair in currency_pairs:
+                await streaming.subscribe_price(currency_pair)
+            
+            while True:
+                tick = await queue.get()
+                if tick is None:
+                    raise ConnectionError("価格ストリーミングが切断されました")
+                self._cached_prices[tick.currency_pair] = tick
+                yield tick
+        finally:
+            # 接続はローソク足の購読と共有しているため、コールバックのみ外す
+            streaming.remove_price_callback(queue.put_nowait)
+            if on_end in self._stream_end_callbacks:
+                self._stream_end_callbacks.remove(on_end)
+    
+    async def subscribe_ohlcv(
+        self,
+        currency_pair: CurrencyPair,
+        timeframe: str,
+        callback: Callable[[OHLCV], None],
+        on_end: Optional[Callable[[], None]] = None
+    ) -> bool:
+        """WebSocketストリーミングでローソク足を購読（デモモードでは未対応）"""
+        if self.demo_mode or not self._token:
+            return False
+        
+        if timeframe not in SAXO_TIMEFRAME_MAP:
+            raise ValueError(f"未対応の時間足: {timeframe}")
+        
+        if not await self._ensure_price_streaming():
+            return False
+        
+        subscribed = await self._price_streaming.subscribe_chart(
+            currency_pair, SAXO_TIMEFRAME_MAP[timeframe], callback
+        )
+        if subscribed and on_end is not None:
+            self._stream_end_callbacks.append(on_end)
+        return subscribed
     
     # ==================== モックデータ生成（デモ用） ====================
     
@@ -1016,7 +1362,7 @@ class SaxoBankClient(FXBrokerClient):
         variation = Decimal(str(random.uniform(-0.05, 0.05)))
         mid_price = base_price + variation
         
-        if "JPY" in currency_pair.value:
+        if currency_pair.is_jpy:
             spread = Decimal("0.002")  # Saxoは低スプレッド
         else:
             spread = Decimal("0.00002")
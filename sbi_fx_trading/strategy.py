@@ -10,14 +10,17 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from decimal import Decimal
 from enum import Enum
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple, Type
 
 import numpy as np
 import pandas as pd
 
 from api_client import CurrencyPair, OHLCV, OrderSide, Tick
-from config import StrategyConfig
-from indicators import TechnicalIndicators, calculate_all_indicators, ohlcv_to_dataframe
+from config import STRATEGY_DESCRIPTIONS, StrategyConfig
+from indicators import (
+    IncrementalSMA, OHLCVHistory, TechnicalIndicators, calculate_all_indicators,
+    ohlcv_to_dataframe
+)
 
 
 class SignalType(Enum):
@@ -75,12 +78,77 @@ class TradingSignal:
         }
 
 
+@dataclass
+class SignalSeries:
+    """
+    全バー分のシグナル（generate_signals_batchの結果）
+    
+    各配列のi番目は、i番目のバーまでのデータから算出したシグナルです。
+    """
+    side: np.ndarray  # 1=買い、-1=売り、0=シグナルなし（int8）
+    confidence: np.ndarray  # 信頼度（float64）
+    stop_loss: np.ndarray  # 損切り価格（float64、なしはNaN）
+    take_profit: np.ndarray  # 利確価格（float64、なしはNaN）
+    
+    def __len__(self) -> int:
+        return len(self.side)
+    
+    @classmethod
+    def neutral(cls, length: int) -> "SignalSeries":
+        """全バーがシグナルなしの系列を作成"""
+        return cls(
+            side=np.zeros(length, dtype=np.int8),
+            confidence=np.zeros(length),
+            stop_loss=np.full(length, np.nan),
+            take_profit=np.full(length, np.nan)
+        )
+    
+    @classmethod
+    def from_conditions(
+        cls,
+        buy: np.ndarray,
+        sell: np.ndarray,
+        buy_confidence: np.ndarray,
+        sell_confidence: np.ndarray,
+        buy_stop_loss: np.ndarray,
+        buy_take_profit: np.ndarray,
+        sell_stop_loss: np.ndarray,
+        sell_take_profit: np.ndarray
+    ) -> "SignalSeries":
+        """買い・売り条件の配列からシグナル系列を作成（両方成立時は買いを優先）"""
+        sell = sell & ~buy
+        return cls(
+            side=np.where(buy, 1, np.where(sell, -1, 0)).astype(np.int8),
+            confidence=np.where(buy, buy_confidence, np.where(sell, sell_confidence, 0.0)),
+            stop_loss=np.where(buy, buy_stop_loss, np.where(sell, sell_stop_loss, np.nan)),
+            take_profit=np.where(buy, buy_take_profit, np.where(sell, sell_take_profit, np.nan))
+        )
+
+
+def _shift(values: np.ndarray) -> np.ndarray:
+    """1バー前の値の配列（先頭はNaN）"""
+    shifted = np.empty_like(values)
+    shifted[0] = np.nan
+    shifted[1:] = values[:-1]
+    return shifted
+
+
+def _has_enough_data(length: int, min_length: int) -> np.ndarray:
+    """各バー時点でデータ本数がmin_length以上あるかどうか"""
+    return np.arange(1, length + 1) >= min_length
+
+
 class TradingStrategy(ABC):
     """トレード戦略の抽象基底クラス"""
     
+    # 指標の計算結果に影響するパラメータ名（指標キャッシュのキー）
+    indicator_params: Tuple[str, ...] = ()
+    
     def __init__(self, config: StrategyConfig):
         self.config = config
         self.name = self.__class__.__name__
+        # 指標キャッシュ（同一データで複数パラメータを試す最適化時に共有する）
+        self.indicator_cache: Optional[Dict[Tuple, Dict[str, np.ndarray]]] = None
     
     @abstractmethod
     def generate_signal(
@@ -102,6 +170,78 @@ class TradingStrategy(ABC):
         """
         pass
     
+    def generate_signals_batch(
+        self,
+        currency_pair: CurrencyPair,
+        ohlcv_data: List[OHLCV],
+        start: int = 0
+    ) -> SignalSeries:
+        """
+        全バー分のシグナルを一括生成（バックテスト用）
+        
+        各バーのシグナルは、generate_signalにそのバーまでのデータを
+        渡した場合と同じ結果になります。既定の実装はバーごとに
+        generate_signalを呼び出すため、指標をまとめて計算できる戦略は
+        オーバーライドしてください。
+        
+        Args:
+            currency_pair: 通貨ペア
+            ohlcv_data: ローソク足データ
+            start: シグナルを算出する最初のバー（それ以前はシグナルなし）
+        
+        Returns:
+            シグナル系列
+        """
+        series = SignalSeries.neutral(len(ohlcv_data))
+        # 各バー時点までのデータはスライスせず、元データを共有するビューで渡す
+        history = OHLCVHistory(ohlcv_data)
+        
+        for i in range(start, len(ohlcv_data)):
+            signal = self.generate_signal(currency_pair, history.up_to(i + 1))
+            if signal.is_buy_signal:
+                series.side[i] = 1
+            elif signal.is_sell_signal:
+                series.side[i] = -1
+            else:
+                continue
+            series.confidence[i] = signal.confidence
+            if signal.stop_loss:
+                series.stop_loss[i] = float(signal.stop_loss)
+            if signal.take_profit:
+                series.take_profit[i] = float(signal.take_profit)
+        
+        return series
+    
+    def compute_indicators(self, ohlcv_data: List[OHLCV]) -> Dict[str, np.ndarray]:
+        """
+        generate_signals_batchで使う指標を計算
+        
+        結果はindicator_paramsに挙げたパラメータだけで決まるようにしてください
+        （それ以外のパラメータが異なる組み合わせ間でキャッシュを共有します）。
+        
+        Args:
+            ohlcv_data: ローソク足データ
+        
+        Returns:
+            指標名 → 全バー分の値の配列
+        """
+        raise NotImplementedError
+    
+    def _batch_indicators(self, ohlcv_data: List[OHLCV]) -> Dict[str, np.ndarray]:
+        """指標を取得（indicator_cacheが設定されていればキャッシュを使う）"""
+        if self.indicator_cache is None:
+            return self.compute_indicators(ohlcv_data)
+        
+        key = (
+            self.__class__,
+            tuple(getattr(self, name) for name in self.indicator_params)
+        )
+        indicators = self.indicator_cache.get(key)
+        if indicators is None:
+            indicators = self.compute_indicators(ohlcv_data)
+            self.indicator_cache[key] = indicators
+        return indicators
+    
     def _create_signal(
         self,
         signal_type: SignalType,
@@ -128,6 +268,16 @@ class TradingStrategy(ABC):
         )
 
 
+@dataclass(slots=True)
+class _MovingAverageState:
+    """MovingAverageCrossStrategyの通貨ペアごとの移動平均の状態"""
+    short_ma: IncrementalSMA
+    long_ma: IncrementalSMA
+    # 移動平均に反映済みの最後の確定バー（系列の連続性の確認に使う）
+    last_timestamp: Optional[datetime] = None
+    last_close: Optional[float] = None
+
+
 class MovingAverageCrossStrategy(TradingStrategy):
     """
     移動平均線クロス戦略
@@ -136,10 +286,56 @@ class MovingAverageCrossStrategy(TradingStrategy):
     ゴールデンクロス（短期>長期）で買い、デッドクロス（短期<長期）で売り。
     """
     
+    indicator_params = ("short_period", "long_period")
+    
     def __init__(self, config: StrategyConfig, short_period: int = 20, long_period: int = 50):
         super().__init__(config)
         self.short_period = short_period
         self.long_period = long_period
+        # 通貨ペア → 確定バーまでの移動平均（generate_signalで逐次更新）
+        self._ma_states: Dict[CurrencyPair, _MovingAverageState] = {}
+    
+    def _update_ma_state(
+        self,
+        currency_pair: CurrencyPair,
+        ohlcv_data: List[OHLCV]
+    ) -> _MovingAverageState:
+        """
+        確定バー（最新バー以外）のうち、まだ反映していないものだけを移動平均に追加
+        
+        最新バーは形成中で終値が変わり得るため状態には含めず、peekで評価します。
+        前回の続きでないデータ（通貨ペアの初回・欠落・別系列）の場合は作り直します。
+        """
+        last_closed = len(ohlcv_data) - 2
+        state = self._ma_states.get(currency_pair)
+        start = None
+        
+        if state is not None and state.last_timestamp is not None:
+            index = last_closed
+            while index >= 0 and ohlcv_data[index].timestamp > state.last_timestamp:
+                index -= 1
+            if (
+                index >= 0
+                and ohlcv_data[index].timestamp == state.last_timestamp
+                and float(ohlcv_data[index].close) == state.last_close
+            ):
+                start = index + 1
+        
+        if start is None:
+            state = _MovingAverageState(
+                IncrementalSMA(self.short_period), IncrementalSMA(self.long_period)
+            )
+            self._ma_states[currency_pair] = state
+            start = max(0, last_closed + 1 - self.long_period)
+        
+        for index in range(start, last_closed + 1):
+            close = float(ohlcv_data[index].close)
+            state.short_ma.update(close)
+            state.long_ma.update(close)
+            state.last_timestamp = ohlcv_data[index].timestamp
+            state.last_close = close
+        
+        return state
     
     def generate_signal(
         self,
@@ -155,23 +351,21 @@ class MovingAverageCrossStrategy(TradingStrategy):
                 "データ不足"
             )
         
-        df = ohlcv_to_dataframe(ohlcv_data)
-        indicators = TechnicalIndicators(df)
-        
-        short_ma = indicators.sma(self.short_period)
-        long_ma = indicators.sma(self.long_period)
+        # 移動平均は前回からの新しいバーの分だけ更新する（毎回全期間を再計算しない）
+        state = self._update_ma_state(currency_pair, ohlcv_data)
+        close = float(ohlcv_data[-1].close)
         
         # 現在と前回の値
-        current_short = short_ma.iloc[-1]
-        current_long = long_ma.iloc[-1]
-        prev_short = short_ma.iloc[-2]
-        prev_long = long_ma.iloc[-2]
+        current_short = state.short_ma.peek(close)
+        current_long = state.long_ma.peek(close)
+        prev_short = state.short_ma.value
+        prev_long = state.long_ma.value
         
         # ゴールデンクロス検出
         if prev_short <= prev_long and current_short > current_long:
             confidence = min(abs(current_short - current_long) / current_long * 100, 1.0)
-            entry_price = Decimal(str(df["close"].iloc[-1]))
-            atr = indicators.atr(14).iloc[-1]
+            entry_price = Decimal(str(close))
+            atr = TechnicalIndicators(ohlcv_to_dataframe(ohlcv_data)).atr(14).iloc[-1]
             
             return self._create_signal(
                 SignalType.BUY,
@@ -187,8 +381,8 @@ class MovingAverageCrossStrategy(TradingStrategy):
         # デッドクロス検出
         if prev_short >= prev_long and current_short < current_long:
             confidence = min(abs(current_long - current_short) / current_long * 100, 1.0)
-            entry_price = Decimal(str(df["close"].iloc[-1]))
-            atr = indicators.atr(14).iloc[-1]
+            entry_price = Decimal(str(close))
+            atr = TechnicalIndicators(ohlcv_to_dataframe(ohlcv_data)).atr(14).iloc[-1]
             
             return self._create_signal(
                 SignalType.SELL,
@@ -208,6 +402,46 @@ class MovingAverageCrossStrategy(TradingStrategy):
             "クロスなし",
             metadata={"short_ma": current_short, "long_ma": current_long}
         )
+    
+    def compute_indicators(self, ohlcv_data: List[OHLCV]) -> Dict[str, np.ndarray]:
+        df = ohlcv_to_dataframe(ohlcv_data)
+        indicators = TechnicalIndicators(df)
+        
+        return {
+            "close": df["close"].to_numpy(),
+            "short_ma": indicators.sma(self.short_period).to_numpy(),
+            "long_ma": indicators.sma(self.long_period).to_numpy(),
+            "atr": indicators.atr(14).to_numpy(),
+        }
+    
+    def generate_signals_batch(
+        self,
+        currency_pair: CurrencyPair,
+        ohlcv_data: List[OHLCV],
+        start: int = 0
+    ) -> SignalSeries:
+        indicators = self._batch_indicators(ohlcv_data)
+        
+        short_ma = indicators["short_ma"]
+        long_ma = indicators["long_ma"]
+        prev_short = _shift(short_ma)
+        prev_long = _shift(long_ma)
+        close = indicators["close"]
+        atr = indicators["atr"]
+        
+        valid = _has_enough_data(len(ohlcv_data), self.long_period + 1)
+        golden_cross = valid & (prev_short <= prev_long) & (short_ma > long_ma)
+        dead_cross = valid & (prev_short >= prev_long) & (short_ma < long_ma)
+        
+        with np.errstate(invalid="ignore", divide="ignore"):
+            confidence = np.minimum(np.abs(short_ma - long_ma) / long_ma * 100, 1.0)
+        
+        return SignalSeries.from_conditions(
+            golden_cross, dead_cross,
+            confidence, confidence,
+            close - atr * 2, close + atr * 4,
+            close + atr * 2, close - atr * 4
+        )
 
 
 class RSIMeanReversionStrategy(TradingStrategy):
@@ -218,6 +452,8 @@ class RSIMeanReversionStrategy(TradingStrategy):
     RSI < 30 で買い、RSI > 70 で売り。
     """
     
+    indicator_params = ("rsi_period",)
+    
     def __init__(
         self,
         config: StrategyConfig,
@@ -303,6 +539,46 @@ class RSIMeanReversionStrategy(TradingStrategy):
             f"RSI中立（RSI={current_rsi:.1f}）",
             metadata={"rsi": current_rsi}
         )
+    
+    def compute_indicators(self, ohlcv_data: List[OHLCV]) -> Dict[str, np.ndarray]:
+        df = ohlcv_to_dataframe(ohlcv_data)
+        indicators = TechnicalIndicators(df)
+        
+        return {
+            "close": df["close"].to_numpy(),
+            "rsi": indicators.rsi(self.rsi_period).to_numpy(),
+            "atr": indicators.atr(14).to_numpy(),
+        }
+    
+    def generate_signals_batch(
+        self,
+        currency_pair: CurrencyPair,
+        ohlcv_data: List[OHLCV],
+        start: int = 0
+    ) -> SignalSeries:
+        indicators = self._batch_indicators(ohlcv_data)
+        
+        rsi = indicators["rsi"]
+        prev_rsi = _shift(rsi)
+        close = indicators["close"]
+        atr = indicators["atr"]
+        
+        valid = _has_enough_data(len(ohlcv_data), self.rsi_period + 1)
+        oversold = valid & (rsi < self.oversold)
+        overbought = valid & (rsi > self.overbought)
+        
+        # 反転の兆候がない場合は信頼度を下げる
+        buy_confidence = (self.oversold - rsi) / self.oversold
+        buy_confidence = np.where(rsi > prev_rsi, buy_confidence, buy_confidence * 0.7)
+        sell_confidence = (rsi - self.overbought) / (100 - self.overbought)
+        sell_confidence = np.where(rsi < prev_rsi, sell_confidence, sell_confidence * 0.7)
+        
+        return SignalSeries.from_conditions(
+            oversold, overbought,
+            np.minimum(buy_confidence, 1.0), np.minimum(sell_confidence, 1.0),
+            close - atr * 2, close + atr * 3,
+            close + atr * 2, close - atr * 3
+        )
 
 
 class BollingerBandStrategy(TradingStrategy):
@@ -313,6 +589,8 @@ class BollingerBandStrategy(TradingStrategy):
     下限タッチで買い、上限タッチで売り。
     """
     
+    indicator_params = ("period", "std_dev")
+    
     def __init__(
         self,
         config: StrategyConfig,
@@ -402,6 +680,47 @@ class BollingerBandStrategy(TradingStrategy):
                 "lower": current_lower
             }
         )
+    
+    def compute_indicators(self, ohlcv_data: List[OHLCV]) -> Dict[str, np.ndarray]:
+        df = ohlcv_to_dataframe(ohlcv_data)
+        indicators = TechnicalIndicators(df)
+        
+        upper, middle, lower = indicators.bollinger_bands(self.period, self.std_dev)
+        return {
+            "close": df["close"].to_numpy(),
+            "upper": upper.to_numpy(),
+            "middle": middle.to_numpy(),
+            "lower": lower.to_numpy(),
+        }
+    
+    def generate_signals_batch(
+        self,
+        currency_pair: CurrencyPair,
+        ohlcv_data: List[OHLCV],
+        start: int = 0
+    ) -> SignalSeries:
+        indicators = self._batch_indicators(ohlcv_data)
+        
+        upper = indicators["upper"]
+        middle = indicators["middle"]
+        lower = indicators["lower"]
+        close = indicators["close"]
+        band_width = upper - lower
+        
+        valid = _has_enough_data(len(ohlcv_data), self.period + 1)
+        touch_lower = valid & (close <= lower)
+        touch_upper = valid & (close >= upper)
+        
+        with np.errstate(invalid="ignore", divide="ignore"):
+            buy_confidence = np.minimum(0.5 + (lower - close) / band_width * 2, 1.0)
+            sell_confidence = np.minimum(0.5 + (close - upper) / band_width * 2, 1.0)
+        
+        return SignalSeries.from_conditions(
+            touch_lower, touch_upper,
+            buy_confidence, sell_confidence,
+            close - band_width * 0.3, middle,
+            close + band_width * 0.3, middle
+        )
 
 
 class MACDStrategy(TradingStrategy):
@@ -412,6 +731,8 @@ class MACDStrategy(TradingStrategy):
     ゼロライン上でのクロスを重視します。
     """
     
+    indicator_params = ("fast_period", "slow_period", "signal_period")
+    
     def __init__(
         self,
         config: StrategyConfig,
@@ -516,6 +837,47 @@ class MACDStrategy(TradingStrategy):
                 "histogram": current_hist
             }
         )
+    
+    def compute_indicators(self, ohlcv_data: List[OHLCV]) -> Dict[str, np.ndarray]:
+        df = ohlcv_to_dataframe(ohlcv_data)
+        indicators = TechnicalIndicators(df)
+        
+        macd_line, signal_line, _ = indicators.macd(
+            self.fast_period, self.slow_period, self.signal_period
+        )
+        return {
+            "close": df["close"].to_numpy(),
+            "macd": macd_line.to_numpy(),
+            "signal": signal_line.to_numpy(),
+            "atr": indicators.atr(14).to_numpy(),
+        }
+    
+    def generate_signals_batch(
+        self,
+        currency_pair: CurrencyPair,
+        ohlcv_data: List[OHLCV],
+        start: int = 0
+    ) -> SignalSeries:
+        indicators = self._batch_indicators(ohlcv_data)
+        
+        macd_line = indicators["macd"]
+        signal_line = indicators["signal"]
+        prev_macd = _shift(macd_line)
+        prev_signal = _shift(signal_line)
+        close = indicators["close"]
+        atr = indicators["atr"]
+        
+        valid = _has_enough_data(len(ohlcv_data), self.slow_period + self.signal_period + 1)
+        golden_cross = valid & (prev_macd <= prev_signal) & (macd_line > signal_line)
+        dead_cross = valid & (prev_macd >= prev_signal) & (macd_line < signal_line)
+        
+        # ゼロライン上（売りは下）でのクロスはより強いシグナル
+        return SignalSeries.from_conditions(
+            golden_cross, dead_cross,
+            np.where(macd_line > 0, 0.8, 0.6), np.where(macd_line < 0, 0.8, 0.6),
+            close - atr * 2, close + atr * 4,
+            close + atr * 2, close - atr * 4
+        )
 
 
 class CombinedStrategy(TradingStrategy):
@@ -603,6 +965,52 @@ class CombinedStrategy(TradingStrategy):
             "戦略間で合意なし",
             metadata={"individual_signals": [s.to_dict() for s in signals]}
         )
+    
+    def generate_signals_batch(
+        self,
+        currency_pair: CurrencyPair,
+        ohlcv_data: List[OHLCV],
+        start: int = 0
+    ) -> SignalSeries:
+        # 構成戦略のキーは戦略クラスを含むため、同じキャッシュを共有できる
+        if self.indicator_cache is not None:
+            for strategy in self.strategies:
+                strategy.indicator_cache = self.indicator_cache
+        
+        series_list = [
+            strategy.generate_signals_batch(currency_pair, ohlcv_data, start)
+            for strategy in self.strategies
+        ]
+        sides = np.vstack([series.side for series in series_list])
+        confidences = np.vstack([series.confidence for series in series_list])
+        stop_losses = np.vstack([series.stop_loss for series in series_list])
+        take_profits = np.vstack([series.take_profit for series in series_list])
+        columns = np.arange(sides.shape[1])
+        
+        def agreement(direction: int):
+            """指定方向の合意判定、平均信頼度、最も信頼度の高い戦略の損切り・利確"""
+            agrees = sides == direction
+            count = agrees.sum(axis=0)
+            avg_confidence = (
+                np.where(agrees, confidences, 0.0).sum(axis=0) / np.maximum(count, 1)
+            )
+            best = np.argmax(np.where(agrees, confidences, -np.inf), axis=0)
+            return (
+                count >= self.min_agreement,
+                avg_confidence,
+                stop_losses[best, columns],
+                take_profits[best, columns]
+            )
+        
+        buy, buy_confidence, buy_stop_loss, buy_take_profit = agreement(1)
+        sell, sell_confidence, sell_stop_loss, sell_take_profit = agreement(-1)
+        
+        return SignalSeries.from_conditions(
+            buy, sell,
+            buy_confidence, sell_confidence,
+            buy_stop_loss, buy_take_profit,
+            sell_stop_loss, sell_take_profit
+        )
 
 
 class TrendFollowingStrategy(TradingStrategy):
@@ -613,6 +1021,8 @@ class TrendFollowingStrategy(TradingStrategy):
     強いトレンドが確認された場合にのみエントリーします。
     """
     
+    indicator_params = ("adx_period", "ma_period")
+    
     def __init__(
         self,
         config: StrategyConfig,
@@ -721,23 +1131,81 @@ class TrendFollowingStrategy(TradingStrategy):
                 "minus_di": current_minus_di
             }
         )
+    
+    def compute_indicators(self, ohlcv_data: List[OHLCV]) -> Dict[str, np.ndarray]:
+        df = ohlcv_to_dataframe(ohlcv_data)
+        indicators = TechnicalIndicators(df)
+        adx, plus_di, minus_di = indicators.adx(self.adx_period)
+        
+        return {
+            "close": df["close"].to_numpy(),
+            "adx": adx.to_numpy(),
+            "plus_di": plus_di.to_numpy(),
+            "minus_di": minus_di.to_numpy(),
+            "ma": indicators.sma(self.ma_period).to_numpy(),
+            "atr": indicators.atr(14).to_numpy(),
+        }
+    
+    def generate_signals_batch(
+        self,
+        currency_pair: CurrencyPair,
+        ohlcv_data: List[OHLCV],
+        start: int = 0
+    ) -> SignalSeries:
+        indicators = self._batch_indicators(ohlcv_data)
+        
+        adx = indicators["adx"]
+        plus_di = indicators["plus_di"]
+        minus_di = indicators["minus_di"]
+        ma = indicators["ma"]
+        close = indicators["close"]
+        atr = indicators["atr"]
+        
+        min_periods = max(self.adx_period * 2, self.ma_period) + 1
+        # generate_signalと同じく「ADXが閾値未満」でなければトレンドありとみなす
+        trending = _has_enough_data(len(ohlcv_data), min_periods) & ~(adx < self.adx_threshold)
+        uptrend = trending & (plus_di > minus_di) & (close > ma)
+        downtrend = trending & (minus_di > plus_di) & (close < ma)
+        
+        confidence = np.minimum((adx - self.adx_threshold) / 25 + 0.5, 1.0)
+        
+        return SignalSeries.from_conditions(
+            uptrend, downtrend,
+            confidence, confidence,
+            close - atr * 2, close + atr * 4,
+            close + atr * 2, close - atr * 4
+        )
+
+
+# 戦略名 → 戦略クラス
+_STRATEGY_CLASSES: Dict[str, Type[TradingStrategy]] = {
+    "ma_cross": MovingAverageCrossStrategy,
+    "rsi_reversal": RSIMeanReversionStrategy,
+    "bollinger": BollingerBandStrategy,
+    "macd": MACDStrategy,
+    "trend_following": TrendFollowingStrategy,
+    "combined": CombinedStrategy,
+}
+
+# 戦略名はconfig.STRATEGY_DESCRIPTIONSが正（CLIの選択肢と実装がずれていればインポート時に検出する）
+if set(_STRATEGY_CLASSES) != set(STRATEGY_DESCRIPTIONS):
+    raise ValueError(
+        f"Strategy registry mismatch: classes={sorted(_STRATEGY_CLASSES)}, "
+        f"descriptions={sorted(STRATEGY_DESCRIPTIONS)}"
+    )
+
+STRATEGIES: Dict[str, Type[TradingStrategy]] = {
+    name: _STRATEGY_CLASSES[name] for name in STRATEGY_DESCRIPTIONS
+}
 
 
 def get_strategy(strategy_name: str, config: StrategyConfig) -> TradingStrategy:
     """戦略名から戦略インスタンスを取得"""
-    strategies = {
-        "ma_cross": MovingAverageCrossStrategy(config),
-        "rsi_reversal": RSIMeanReversionStrategy(config),
-        "bollinger": BollingerBandStrategy(config),
-        "macd": MACDStrategy(config),
-        "trend_following": TrendFollowingStrategy(config),
-        "combined": CombinedStrategy(config),
-    }
-    
-    if strategy_name not in strategies:
-        raise ValueError(f"Unknown strategy: {strategy_name}. Available: {list(strategies.keys())}")
-    
-    return strategies[strategy_name]
+    strategy_class = STRATEGIES.get(strategy_name)
+    if strategy_class is None:
+        raise ValueError(f"Unknown strategy: {strategy_name}. Available: {list(STRATEGIES)}")
+    
+    return strategy_class(config)
 
 
 if __name__ == "__main__":